@@ -0,0 +1,58 @@
+"""
+Per-message cost of rebuilding a Token from MetaData.token, with and
+without the memoized JWT decoding in mykobo_py.identity.models.auth.
+
+Messages cycle through a handful of service tokens, as they do on the
+message bus consumers.
+
+    python -m benchmarks.bench_jwt_decode --messages 100000 --tokens 5
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+
+import jwt
+
+from mykobo_py.identity.models.auth import Token, clear_jwt_cache, jwt_cache_info
+
+
+def uncached_from_jwt(jwt_token: str) -> Token:
+    decoded = jwt.decode(jwt_token, options={"verify_signature": False})
+    return Token(
+        subject_id=decoded["sub"],
+        token=jwt_token,
+        refresh_token=None,
+        expires_at=datetime.fromtimestamp(decoded["exp"])
+    )
+
+
+def run(label: str, messages: list, build) -> float:
+    started = time.perf_counter()
+    for raw in messages:
+        build(raw)
+    per_message = (time.perf_counter() - started) / len(messages) * 1_000_000
+    print(f"{label:<10} {per_message:6.2f} us/message")
+    return per_message
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=100_000)
+    parser.add_argument("--tokens", type=int, default=5)
+    args = parser.parse_args()
+
+    expires = datetime.now() + timedelta(days=1)
+    tokens = [
+        jwt.encode({"sub": f"urn:svc:{i}", "exp": int(expires.timestamp()), "scope": ["user:read"]}, "benchmark-signing-key-of-at-least-32-bytes", algorithm="HS256")
+        for i in range(args.tokens)
+    ]
+    messages = [tokens[i % len(tokens)] for i in range(args.messages)]
+
+    clear_jwt_cache()
+    before = run("uncached", messages, uncached_from_jwt)
+    after = run("cached", messages, Token.from_jwt)
+    print(f"speed-up: {before / after:.1f}x  ({jwt_cache_info()})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Compare calls per second of module-level `requests.get` against the pooled
+session shared by every MykoboServiceClient.
+
+A stub identity service is started on localhost so the numbers only reflect
+client-side connection handling.
+
+    python -m benchmarks.bench_transport --calls 2000
+"""
+import argparse
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from mykobo_py.client import MykoboServiceClient
+from mykobo_py.identity.identity import IdentityServiceClient
+
+PROFILE = json.dumps({"id": "urn:usrp:benchmark", "first_name": "Bench", "last_name": "Mark"}).encode("utf-8")
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(PROFILE)))
+        self.end_headers()
+        self.wfile.write(PROFILE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run(label: str, calls: int, call) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        call().raise_for_status()
+    elapsed = time.perf_counter() - started
+    rate = calls / elapsed
+    print(f"{label:<28} {calls} calls in {elapsed:.2f}s -> {rate:,.0f} calls/s")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=1000)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host = f"http://127.0.0.1:{server.server_address[1]}"
+    url = f"{host}/user/profile/urn:usrp:benchmark"
+
+    client = IdentityServiceClient(host, logging.getLogger("benchmark"))
+    try:
+        baseline = run("requests.get (no pooling)", args.calls, lambda: requests.get(url))
+        pooled = run("pooled session", args.calls, lambda: client.get_user_profile(None, "urn:usrp:benchmark"))
+        print(f"speed-up: {pooled / baseline:.1f}x")
+    finally:
+        MykoboServiceClient.close_transport()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+from typing import Any, Dict, Hashable, Mapping, NamedTuple, Optional
+
+from mykobo_py.cache import CacheInfo, TTLCache
+
+DEFAULT_CONDITIONAL_CACHE_SIZE = 1024
+
+
+class Validated(NamedTuple):
+    value: Any
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+class ConditionalCache:
+    """
+    Parsed responses kept with their ETag / Last-Modified validators.
+
+    `request_headers` turns a cached entry into If-None-Match and
+    If-Modified-Since headers; when the server answers 304 Not Modified the
+    cached value is used instead of downloading and parsing it again.
+    Responses without validators are not cached.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CONDITIONAL_CACHE_SIZE):
+        self._cache = TTLCache(maxsize)
+
+    def get(self, key: Hashable) -> Optional[Validated]:
+        return self._cache.get(key)
+
+    @staticmethod
+    def request_headers(cached: Optional[Validated]) -> Dict[str, str]:
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        return headers
+
+    def store(self, key: Hashable, response_headers: Mapping[str, str], value: Any):
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        if etag or last_modified:
+            self._cache.set(key, Validated(value, etag, last_modified))
+        else:
+            self._cache.pop(key)
+
+    def clear(self):
+        self._cache.clear()
+
+    def info(self) -> CacheInfo:
+        return self._cache.info()
@@ -0,0 +1,29 @@
+from typing import Optional
+
+import httpx
+
+from mykobo_py.anchor.dapp.models import Transaction
+from mykobo_py.anchor.rpc import AsyncJsonRpcClientMixin
+from mykobo_py.async_client import AsyncMykoboServiceClient
+from mykobo_py.identity.models.auth import Token
+
+
+class AsyncDappAnchorClient(AsyncJsonRpcClientMixin, AsyncMykoboServiceClient):
+    def __init__(self, host, logger, http_client: Optional[httpx.AsyncClient] = None):
+        super().__init__(logger, host, http_client)
+
+    async def get_transaction(self, service_token: Token, transaction_id) -> Optional[Transaction]:
+        try:
+            self.logger.info(f"Getting transaction {transaction_id} from {self.host}/v1/transactions/{transaction_id}")
+            response = await self.http_client.get(
+                f"{self.host}/v1/transactions/{transaction_id}",
+                headers=self.generate_headers(service_token, **{"Content-type": "application/json"}),
+            )
+            if response.is_success:
+                return Transaction.model_validate(response.json())
+            else:
+                self.logger.error(f"Failed to get transaction {transaction_id}, response: {response.text}, {response.status_code}")
+                return None
+        except Exception as e:
+            self.logger.error(f"Failed to get transaction {transaction_id}: {e}")
+            return None
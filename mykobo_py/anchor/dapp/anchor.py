@@ -1,48 +1,64 @@
-from typing import Optional
+from typing import Dict, Iterable, Optional, Union
 import requests
-from time import time
 
+from mykobo_py.anchor.conditional import ConditionalCache, DEFAULT_CONDITIONAL_CACHE_SIZE
 from mykobo_py.anchor.dapp.models import Transaction
+from mykobo_py.anchor.rpc import JsonRpcClientMixin
 from mykobo_py.client import MykoboServiceClient
+from mykobo_py.concurrency import fan_out, DEFAULT_MAX_WORKERS
 from mykobo_py.identity.models.auth import Token
 
 
-class DappAnchorClient(MykoboServiceClient):
-    def __init__(self, host, logger):
-        super().__init__(logger, host)
-
-    def make_request(self, method, params):
-        self.logger.info(f"Sending {method} request to {self.host}")
-        payload = [
-            {
-                "jsonrpc": "2.0",
-                "id": f"{int(time())}",
-                "method": method,
-                "params": params
-            }
-        ]
-
-        self.logger.info(payload)
-        url = f"{self.host}"
-        try:
-            response = requests.post(url, json=payload)
-            return response.json()
-        except Exception as e:
-            self.logger.error(f"Failed to make request to {self.host}: {e}")
-            return None
+class DappAnchorClient(JsonRpcClientMixin, MykoboServiceClient):
+    def __init__(
+        self,
+        host,
+        logger,
+        session: Optional[requests.Session] = None,
+        transaction_cache_size: int = DEFAULT_CONDITIONAL_CACHE_SIZE,
+    ):
+        super().__init__(logger, host, session)
+        self.transaction_cache = ConditionalCache(transaction_cache_size) if transaction_cache_size else None
 
     def get_transaction(self, service_token: Token, transaction_id) -> Optional[Transaction]:
         try:
             self.logger.info(f"Getting transaction {transaction_id} from {self.host}/v1/transactions/{transaction_id}")
-            response = requests.get(
-                url=f"{self.host}/v1/transactions/{transaction_id}",
-                headers=self.generate_headers(service_token, **{"Content-type": "application/json"}),
-            )
-            if response.ok:
-                return Transaction.model_validate(response.json())
-            else:
-                self.logger.error(f"Failed to get transaction {transaction_id}, response: {response.text}, {response.status_code}")
-                return None
+            return self._fetch_transaction(service_token, transaction_id)
+        except requests.exceptions.HTTPError as e:
+            self.logger.error(f"Failed to get transaction {transaction_id}, response: {e.response.text}, {e.response.status_code}")
+            return None
         except Exception as e:
             self.logger.error(f"Failed to get transaction {transaction_id}: {e}")
             return None
+
+    def get_transactions(
+        self,
+        service_token: Token,
+        transaction_ids: Iterable[str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> Dict[str, Union[Transaction, Exception]]:
+        """
+        Fetch many transactions concurrently, at most `max_workers` at a time.
+
+        Duplicate ids are requested once. Returns a dict mapping every id to its
+        Transaction, or to the exception raised while fetching or parsing it.
+        """
+        return fan_out(lambda id: self._fetch_transaction(service_token, id), transaction_ids, max_workers)
+
+    def _fetch_transaction(self, service_token: Token, transaction_id) -> Transaction:
+        cached = self.transaction_cache.get(transaction_id) if self.transaction_cache is not None else None
+        response = self.session.get(
+            url=f"{self.host}/v1/transactions/{transaction_id}",
+            headers=self.generate_headers(
+                service_token,
+                **{"Content-type": "application/json"},
+                **ConditionalCache.request_headers(cached),
+            ),
+        )
+        if response.status_code == 304 and cached is not None:
+            return cached.value.model_copy()
+        response.raise_for_status()
+        transaction = Transaction.model_validate(response.json())
+        if self.transaction_cache is not None:
+            self.transaction_cache.store(transaction_id, response.headers, transaction)
+        return transaction
@@ -0,0 +1,173 @@
+import threading
+import time
+from hashlib import blake2b
+from logging import Logger
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+from pydantic import BaseModel
+
+from mykobo_py.message_bus.models.base import EventType
+from mykobo_py.message_bus.models.event import TransactionStatusEventPayload
+from mykobo_py.message_bus.models.message import MessageBusMessage
+
+DEFAULT_MIN_BACKOFF = 30
+DEFAULT_MAX_BACKOFF = 600
+DEFAULT_BACKOFF_FACTOR = 2
+
+FetchTransactions = Callable[[List[str]], Dict[str, Union[BaseModel, Exception]]]
+
+
+def fingerprint(transaction: BaseModel) -> bytes:
+    """An 8 byte digest of the fields that make a transaction change worth reporting."""
+    fields = (
+        getattr(transaction, "status", None) or "",
+        getattr(transaction, "tx_hash", None) or "",
+        getattr(transaction, "updated_at", None) or "",
+    )
+    return blake2b("\x1f".join(fields).encode(), digest_size=8).digest()
+
+
+class _Tracked:
+    __slots__ = ("fingerprint", "delay", "due_at")
+
+    def __init__(self, due_at: float):
+        self.fingerprint: Optional[bytes] = None
+        self.delay = 0.0
+        self.due_at = due_at
+
+
+class TransactionPoller:
+    """
+    Polls a set of anchor transactions and emits a status event when one changes.
+
+    `fetch_transactions` takes a list of ids and returns a dict of id to
+    Transaction or exception, e.g. `anchor_client.get_transactions` or
+    `lambda ids: dapp_client.get_transactions(token, ids)`. Only a fingerprint
+    of each transaction's status, tx_hash and updated_at is kept. The first
+    time a transaction is seen only its fingerprint is recorded; after that
+    every change is passed to `emit` as a TRANSACTION_STATUS_UPDATE message.
+    A change is only recorded once `emit` returns; if it raises, the id is
+    rescheduled and the change emitted on a later poll.
+
+    Ids that have not changed are polled less and less often, from
+    `min_backoff` seconds up to `max_backoff`; a change brings the id back to
+    every cycle. Transactions for which `is_final` is true are emitted and
+    then no longer tracked.
+    """
+
+    def __init__(
+        self,
+        fetch_transactions: FetchTransactions,
+        emit: Callable[[MessageBusMessage], None],
+        source: str,
+        service_token: Callable[[], str],
+        logger: Logger,
+        min_backoff: float = DEFAULT_MIN_BACKOFF,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        is_final: Optional[Callable[[BaseModel], bool]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.fetch_transactions = fetch_transactions
+        self.emit = emit
+        self.source = source
+        self.service_token = service_token
+        self.logger = logger
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.backoff_factor = backoff_factor
+        self.is_final = is_final
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tracked: Dict[str, _Tracked] = {}
+
+    def track(self, transaction_ids: Iterable[str]):
+        now = self._clock()
+        with self._lock:
+            for transaction_id in transaction_ids:
+                self._tracked.setdefault(transaction_id, _Tracked(now))
+
+    def untrack(self, transaction_ids: Iterable[str]):
+        with self._lock:
+            for transaction_id in transaction_ids:
+                self._tracked.pop(transaction_id, None)
+
+    @property
+    def tracked(self) -> List[str]:
+        with self._lock:
+            return list(self._tracked)
+
+    def due(self) -> List[str]:
+        now = self._clock()
+        with self._lock:
+            return [transaction_id for transaction_id, state in self._tracked.items() if state.due_at <= now]
+
+    def poll(self) -> List[MessageBusMessage]:
+        """Fetch the ids that are due and emit an event for each one that changed. Returns the events."""
+        due = self.due()
+        if not due:
+            return []
+        results = self.fetch_transactions(due)
+
+        emitted = []
+        for transaction_id in due:
+            result = results.get(transaction_id)
+            if result is None or isinstance(result, Exception):
+                self.logger.warning(f"Could not poll transaction {transaction_id}: {result}")
+                self._reschedule(transaction_id, changed=False)
+                continue
+
+            current = fingerprint(result)
+            with self._lock:
+                state = self._tracked.get(transaction_id)
+                if state is None:
+                    continue
+                previous = state.fingerprint
+            changed = previous is not None and previous != current
+            if changed:
+                try:
+                    message = self._event(result)
+                    self.emit(message)
+                except Exception as e:
+                    # The change is only recorded once emitted, so a later poll retries it
+                    self.logger.error(f"Could not emit change of transaction {transaction_id}: {e}")
+                    self._reschedule(transaction_id, changed=False)
+                    continue
+                emitted.append(message)
+            with self._lock:
+                state.fingerprint = current
+
+            if self.is_final is not None and self.is_final(result):
+                self.untrack([transaction_id])
+            else:
+                self._reschedule(transaction_id, changed=changed or previous is None)
+        return emitted
+
+    def run(self, stop: threading.Event, interval: float = 1.0):
+        """Poll every `interval` seconds until `stop` is set."""
+        while not stop.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                self.logger.error(f"Transaction poll failed: {e}")
+            stop.wait(interval)
+
+    def _reschedule(self, transaction_id: str, changed: bool):
+        with self._lock:
+            state = self._tracked.get(transaction_id)
+            if state is None:
+                return
+            if changed:
+                state.delay = 0.0
+            else:
+                state.delay = min(self.max_backoff, max(self.min_backoff, state.delay * self.backoff_factor))
+            state.due_at = self._clock() + state.delay
+
+    def _event(self, transaction: BaseModel) -> MessageBusMessage:
+        reference = getattr(transaction, "reference", None) or transaction.id
+        return MessageBusMessage.create(
+            source=self.source,
+            payload=TransactionStatusEventPayload(reference=reference, status=transaction.status),
+            service_token=self.service_token(),
+            event=EventType.TRANSACTION_STATUS_UPDATE,
+        )
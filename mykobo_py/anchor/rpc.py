@@ -0,0 +1,154 @@
+import uuid
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+DEFAULT_MAX_BATCH_SIZE = 100
+
+
+class RpcError(Exception):
+    """A JSON-RPC call answered with an error object, or not answered at all."""
+
+    def __init__(self, message: str, code: Optional[int] = None, data: Any = None):
+        super().__init__(message)
+        self.code = code
+        self.data = data
+
+
+def next_request_id() -> str:
+    return uuid.uuid4().hex
+
+
+def rpc_request(method: str, params: Any, id: Optional[str] = None) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": id or next_request_id(),
+        "method": method,
+        "params": params
+    }
+
+
+def match_responses(requests: Sequence[dict], responses: Any) -> List[Union[Any, RpcError]]:
+    """
+    Pair each request with its response by id, in request order.
+
+    Each entry is the call's result, or an RpcError if the call failed or no
+    response carried its id.
+    """
+    if isinstance(responses, dict):
+        responses = [responses]
+    by_id: Dict[Any, dict] = {
+        response.get("id"): response for response in responses or [] if isinstance(response, dict)
+    }
+    results = []
+    for request in requests:
+        response = by_id.get(request["id"])
+        if response is None:
+            results.append(RpcError(f"No response to {request['method']} call {request['id']}"))
+        elif response.get("error") is not None:
+            error = response["error"]
+            if isinstance(error, dict):
+                results.append(RpcError(error.get("message", str(error)), error.get("code"), error.get("data")))
+            else:
+                results.append(RpcError(str(error)))
+        else:
+            results.append(response.get("result"))
+    return results
+
+
+class RpcBatch:
+    """
+    Collects JSON-RPC calls to send together.
+
+        batch = client.batch()
+        first = batch.add("getTransaction", {"id": "a"})
+        second = batch.add("getTransaction", {"id": "b"})
+        results = batch.send()
+        results[first], results[second]
+
+    `add` returns the position of the call's result in the list returned by `send`.
+    """
+
+    def __init__(self, client: "JsonRpcClientMixin"):
+        self.client = client
+        self.calls: List[Tuple[str, Any]] = []
+
+    def add(self, method: str, params: Any) -> int:
+        self.calls.append((method, params))
+        return len(self.calls) - 1
+
+    def send(self) -> List[Union[Any, Exception]]:
+        return self.client.make_batch_request(self.calls)
+
+    def __len__(self) -> int:
+        return len(self.calls)
+
+
+class JsonRpcClientMixin:
+    """JSON-RPC over POST to the client's host, for clients with a `session`, `host` and `logger`."""
+
+    max_batch_size: int = DEFAULT_MAX_BATCH_SIZE
+
+    def make_request(self, method, params):
+        self.logger.info(f"Sending {method} request to {self.host}")
+        payload = [rpc_request(method, params)]
+        self.logger.info(payload)
+        try:
+            response = self.session.post(f"{self.host}", json=payload)
+            return response.json()
+        except Exception as e:
+            self.logger.error(f"Failed to make request to {self.host}: {e}")
+            return None
+
+    def batch(self) -> RpcBatch:
+        return RpcBatch(self)
+
+    def make_batch_request(self, calls: Sequence[Tuple[str, Any]]) -> List[Union[Any, Exception]]:
+        """
+        Send (method, params) calls as JSON-RPC batches of up to `max_batch_size`.
+
+        Returns one entry per call, in order: its result, an RpcError if the server
+        rejected it, or the exception raised if its batch could not be sent.
+        """
+        results: List[Union[Any, Exception]] = []
+        for start in range(0, len(calls), self.max_batch_size):
+            payload = [rpc_request(method, params) for method, params in calls[start:start + self.max_batch_size]]
+            self.logger.info(f"Sending batch of {len(payload)} calls to {self.host}")
+            try:
+                response = self.session.post(f"{self.host}", json=payload)
+                response.raise_for_status()
+                results.extend(match_responses(payload, response.json()))
+            except Exception as e:
+                self.logger.error(f"Failed to make batch request to {self.host}: {e}")
+                results.extend(e for _ in payload)
+        return results
+
+
+class AsyncJsonRpcClientMixin:
+    """JSON-RPC over POST to the client's host, for async clients with an `http_client`, `host` and `logger`."""
+
+    max_batch_size: int = DEFAULT_MAX_BATCH_SIZE
+
+    async def make_request(self, method, params):
+        self.logger.info(f"Sending {method} request to {self.host}")
+        payload = [rpc_request(method, params)]
+        self.logger.info(payload)
+        try:
+            response = await self.http_client.post(f"{self.host}", json=payload)
+            return response.json()
+        except Exception as e:
+            self.logger.error(f"Failed to make request to {self.host}: {e}")
+            return None
+
+    async def make_batch_request(self, calls: Sequence[Tuple[str, Any]]) -> List[Union[Any, Exception]]:
+        """See JsonRpcClientMixin.make_batch_request."""
+        results: List[Union[Any, Exception]] = []
+        for start in range(0, len(calls), self.max_batch_size):
+            payload = [rpc_request(method, params) for method, params in calls[start:start + self.max_batch_size]]
+            self.logger.info(f"Sending batch of {len(payload)} calls to {self.host}")
+            try:
+                response = await self.http_client.post(f"{self.host}", json=payload)
+                response.raise_for_status()
+                results.extend(match_responses(payload, response.json()))
+            except Exception as e:
+                self.logger.error(f"Failed to make batch request to {self.host}: {e}")
+                results.extend(e for _ in payload)
+        return results
@@ -0,0 +1,26 @@
+from typing import Optional
+
+import httpx
+
+from mykobo_py.anchor.stellar.models import Transaction
+from mykobo_py.anchor.rpc import AsyncJsonRpcClientMixin
+from mykobo_py.async_client import AsyncMykoboServiceClient
+
+
+class AsyncAnchorRpcClient(AsyncJsonRpcClientMixin, AsyncMykoboServiceClient):
+    def __init__(self, host, logger, http_client: Optional[httpx.AsyncClient] = None):
+        super().__init__(logger, host, http_client)
+
+    async def get_transaction(self, transaction_id) -> Optional[Transaction]:
+        self.logger.info(f"CLIENT: Fetching transaction {transaction_id}")
+        url = self.host[:-1] if self.host.endswith("/") else self.host
+        try:
+            response = await self.http_client.get(f"{url}/transactions/{transaction_id}")
+            if response.is_success:
+                return Transaction.model_validate(response.json())
+            else:
+                self.logger.warning(f"CLIENT: Error fetching transaction {response.content}")
+                return None
+        except Exception as e:
+            self.logger.error(f"CLIENT Failed to get transaction {transaction_id}: {e}")
+            return e
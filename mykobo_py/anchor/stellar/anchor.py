@@ -1,50 +1,59 @@
-from typing import Optional
+from typing import Dict, Iterable, Optional, Union
 import requests
-from time import time
 
+from mykobo_py.anchor.conditional import ConditionalCache, DEFAULT_CONDITIONAL_CACHE_SIZE
 from mykobo_py.anchor.stellar.models import Transaction
+from mykobo_py.anchor.rpc import JsonRpcClientMixin
+from mykobo_py.client import MykoboServiceClient
+from mykobo_py.concurrency import fan_out, DEFAULT_MAX_WORKERS
 
 
-class AnchorRpcClient:
-    def __init__(self, host, logger):
-        self.host = host
-        self.logger = logger
-
-    def make_request(self, method, params):
-        url = f"{self.host}"
-        self.logger.info(f"Sending {method} request to {url}")
-        payload = [
-            {
-                "jsonrpc": "2.0",
-                "id": f"{int(time())}",
-                "method": method,
-                "params": params
-            }
-        ]
-        self.logger.info(payload)
-
-        try:
-            response = requests.post(url, json=payload)
-            print(f"Failed to make request to {self.host}: {response.content}")
-            return response.json()
-        except Exception as e:
-
-            self.logger.error(f"Failed to make request to {self.host}: {e}")
-            return None
+class AnchorRpcClient(JsonRpcClientMixin, MykoboServiceClient):
+    def __init__(
+        self,
+        host,
+        logger,
+        session: Optional[requests.Session] = None,
+        transaction_cache_size: int = DEFAULT_CONDITIONAL_CACHE_SIZE,
+    ):
+        super().__init__(logger, host, session)
+        self.transaction_cache = ConditionalCache(transaction_cache_size) if transaction_cache_size else None
 
     def get_transaction(self, transaction_id) -> Optional[Transaction]:
         self.logger.info(f"CLIENT: Fetching transaction {transaction_id}")
-        if self.host.endswith("/"):
-            url = self.host[:-1]
-        else:
-            url = self.host
         try:
-            response = requests.get(url=f"{url}/transactions/{transaction_id}")
-            if response.ok:
-                return Transaction.model_validate(response.json())
-            else:
-                self.logger.warning(f"CLIENT: Error fetching transaction {response.content}")
-                return None
+            return self._fetch_transaction(transaction_id)
+        except requests.exceptions.HTTPError as e:
+            self.logger.warning(f"CLIENT: Error fetching transaction {e.response.content}")
+            return None
         except Exception as e:
             self.logger.error(f"CLIENT Failed to get transaction {transaction_id}: {e}")
             return e
+
+    def get_transactions(
+        self,
+        transaction_ids: Iterable[str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> Dict[str, Union[Transaction, Exception]]:
+        """
+        Fetch many transactions concurrently, at most `max_workers` at a time.
+
+        Duplicate ids are requested once. Returns a dict mapping every id to its
+        Transaction, or to the exception raised while fetching or parsing it.
+        """
+        return fan_out(self._fetch_transaction, transaction_ids, max_workers)
+
+    def _fetch_transaction(self, transaction_id) -> Transaction:
+        url = self.host[:-1] if self.host.endswith("/") else self.host
+        cached = self.transaction_cache.get(transaction_id) if self.transaction_cache is not None else None
+        response = self.session.get(
+            url=f"{url}/transactions/{transaction_id}",
+            headers=ConditionalCache.request_headers(cached),
+        )
+        if response.status_code == 304 and cached is not None:
+            return cached.value.model_copy()
+        response.raise_for_status()
+        transaction = Transaction.model_validate(response.json())
+        if self.transaction_cache is not None:
+            self.transaction_cache.store(transaction_id, response.headers, transaction)
+        return transaction
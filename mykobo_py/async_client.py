@@ -0,0 +1,100 @@
+import asyncio
+import threading
+import weakref
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from logging import Logger
+from typing import Optional
+
+import httpx
+
+from mykobo_py.client import MykoboServiceClient
+
+DEFAULT_MAX_CONNECTIONS = 200
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 50
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+DEFAULT_RETRIES = 3
+
+
+def build_async_client(
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+    retries: int = DEFAULT_RETRIES,
+    timeout: Optional[float] = None,
+) -> httpx.AsyncClient:
+    """
+    Build an httpx AsyncClient backed by a pooled transport.
+
+    Args:
+        max_connections: Maximum number of concurrent connections across all hosts
+        max_keepalive_connections: Maximum number of idle connections kept open
+        keepalive_expiry: Seconds an idle connection is kept open
+        retries: Retries for failed connection attempts
+        timeout: Request timeout in seconds, None waits indefinitely like the sync clients
+
+    Like the sync session, the client never stores cookies, since it is shared by every caller.
+    """
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+    transport = httpx.AsyncHTTPTransport(limits=limits, retries=retries)
+    cookies = CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+    return httpx.AsyncClient(transport=transport, timeout=timeout, cookies=cookies)
+
+
+class AsyncMykoboServiceClient:
+    """
+    Base class for the asyncio service clients.
+
+    httpx clients are bound to the event loop they were first used on, so the
+    shared connection pool is kept per running loop.
+    """
+    _shared_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+    _shared_clients_lock = threading.Lock()
+    _transport_options: dict = {}
+
+    generate_headers = staticmethod(MykoboServiceClient.generate_headers)
+
+    def __init__(self, logger: Logger, host: str, http_client: Optional[httpx.AsyncClient] = None):
+        self.logger = logger
+        self.host = host
+        self._http_client = http_client
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """The client used for requests; the pool shared on the running loop unless one was given."""
+        if self._http_client is not None:
+            return self._http_client
+        return AsyncMykoboServiceClient.shared_client()
+
+    @classmethod
+    def shared_client(cls) -> httpx.AsyncClient:
+        """Return the pooled client shared on the running event loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        with AsyncMykoboServiceClient._shared_clients_lock:
+            client = AsyncMykoboServiceClient._shared_clients.get(loop)
+            if client is None or client.is_closed:
+                client = build_async_client(**AsyncMykoboServiceClient._transport_options)
+                AsyncMykoboServiceClient._shared_clients[loop] = client
+            return client
+
+    @classmethod
+    def configure_transport(cls, **kwargs):
+        """
+        Set the options used for shared clients created from now on.
+
+        Accepts the keyword arguments of `build_async_client`. Pools that are
+        already open keep their settings until `aclose_transport` is awaited.
+        """
+        AsyncMykoboServiceClient._transport_options = dict(kwargs)
+
+    @classmethod
+    async def aclose_transport(cls):
+        """Close the shared client of the running event loop."""
+        loop = asyncio.get_running_loop()
+        with AsyncMykoboServiceClient._shared_clients_lock:
+            client = AsyncMykoboServiceClient._shared_clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
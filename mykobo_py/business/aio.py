@@ -0,0 +1,45 @@
+from typing import Optional
+
+import httpx
+from httpx import Response
+
+from mykobo_py.async_client import AsyncMykoboServiceClient
+from mykobo_py.business.models import FeeConfiguration
+from mykobo_py.identity.models.auth import Token
+
+
+class AsyncBusinessServiceClient(AsyncMykoboServiceClient):
+    def __init__(self, host, logger, http_client: Optional[httpx.AsyncClient] = None):
+        super().__init__(logger, host, http_client)
+
+    async def get_fee(self, transaction_id: Optional[str], amount: Optional[str], kind: Optional[str], client_domain: Optional[str]) -> Response:
+        params = {}
+        if transaction_id:
+            params["transaction_id"] = transaction_id
+        if amount and not transaction_id:
+            params["value"] = amount
+        if kind:
+            params["kind"] = kind
+        if client_domain:
+            params["client_domain"] = client_domain
+
+        response = await self.http_client.get(f"{self.host}/fees", params=params)
+        response.raise_for_status()
+        return response
+
+    async def new_fee(self, token: Token, configuration: FeeConfiguration) -> Response:
+        response = await self.http_client.post(
+            f"{self.host}/fees/new",
+            headers=self.generate_headers(token, **{"Content-type": "application/json"}),
+            json=configuration.model_dump()
+        )
+        response.raise_for_status()
+        return response
+
+    async def all_fees(self, token: Token) -> Response:
+        response = await self.http_client.get(
+            f"{self.host}/fees/all",
+            headers=self.generate_headers(token, **{"Content-type": "application/json"})
+        )
+        response.raise_for_status()
+        return response
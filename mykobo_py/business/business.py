@@ -8,8 +8,8 @@ from requests import Response
 from typing import Optional
 
 class BusinessServiceClient(MykoboServiceClient):
-    def __init__(self, host, logger):
-        super().__init__(logger, host)
+    def __init__(self, host, logger, session: Optional[requests.Session] = None):
+        super().__init__(logger, host, session)
 
     def get_fee(self, transaction_id: Optional[str], amount: Optional[str], kind: Optional[str], client_domain: Optional[str]) -> Response:
         url = f"{self.host}/fees"
@@ -23,7 +23,7 @@ class BusinessServiceClient(MykoboServiceClient):
         if client_domain:
             url += f"&client_domain={client_domain}"
 
-        response = requests.get(
+        response = self.session.get(
             url
         )
         response.raise_for_status()
@@ -31,7 +31,7 @@ class BusinessServiceClient(MykoboServiceClient):
 
     def new_fee(self, token: Token, configuration: FeeConfiguration) -> Response:
         url = f"{self.host}/fees/new"
-        response = requests.post(
+        response = self.session.post(
             url,
             headers=self.generate_headers(token, **{"Content-type": "application/json"}),
             json=configuration.model_dump()
@@ -42,7 +42,7 @@ class BusinessServiceClient(MykoboServiceClient):
 
     def all_fees(self, token: Token) -> Response:
         url = f"{self.host}/fees/all"
-        response = requests.get(
+        response = self.session.get(
             url,
             headers=self.generate_headers(token, **{"Content-type": "application/json"})
         )
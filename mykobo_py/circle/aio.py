@@ -0,0 +1,107 @@
+from logging import Logger
+from typing import Optional
+
+import httpx
+from httpx import Response
+
+from mykobo_py.async_client import AsyncMykoboServiceClient
+from mykobo_py.identity.models.auth import Token
+from .models.request import CreateRelayAddressPairRequest
+
+
+class AsyncCircleServiceClient(AsyncMykoboServiceClient):
+    def __init__(self, host: str, logger: Logger, http_client: Optional[httpx.AsyncClient] = None):
+        super().__init__(logger, host, http_client)
+
+    async def health(self) -> Response:
+        response = await self.http_client.get(f"{self.host}/health")
+        response.raise_for_status()
+        return response
+
+    async def create_relay_address_pair(self, token: Token, request: CreateRelayAddressPairRequest) -> Response:
+        response = await self.http_client.post(
+            f"{self.host}/relay-addresses/pair",
+            headers=self.generate_headers(token, **{"Content-type": "application/json"}),
+            content=request.model_dump_json(exclude_none=True)
+        )
+
+        response.raise_for_status()
+        return response
+
+    async def list_relay_addresses(self, token: Token, chain: Optional[str] = None) -> Response:
+        params = {}
+        if chain:
+            params["chain"] = chain
+        response = await self.http_client.get(
+            f"{self.host}/relay-addresses",
+            headers=self.generate_headers(token, **{"Content-type": "application/json"}),
+            params=params,
+        )
+        response.raise_for_status()
+        return response
+
+    async def list_circle_addresses(
+        self,
+        token: Token,
+        chain: Optional[str] = None,
+        currency: Optional[str] = None,
+        purpose: Optional[str] = None,
+    ) -> Response:
+        params = {}
+        if chain:
+            params["chain"] = chain
+        if currency:
+            params["currency"] = currency
+        if purpose:
+            params["purpose"] = purpose
+
+        response = await self.http_client.get(
+            f"{self.host}/circle-addresses",
+            headers=self.generate_headers(token, **{"Content-type": "application/json"}),
+            params=params,
+        )
+        response.raise_for_status()
+        return response
+
+    async def list_transactions(
+        self,
+        token: Token,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+        chain: Optional[str] = None,
+        status: Optional[str] = None,
+        asset: Optional[str] = None,
+        sender: Optional[str] = None,
+        recipient: Optional[str] = None,
+    ) -> Response:
+        params = {}
+        if page is not None:
+            params["page"] = page
+        if per_page is not None:
+            params["per_page"] = per_page
+        if chain:
+            params["chain"] = chain
+        if status:
+            params["status"] = status
+        if asset:
+            params["token"] = asset
+        if sender:
+            params["sender"] = sender
+        if recipient:
+            params["recipient"] = recipient
+
+        response = await self.http_client.get(
+            f"{self.host}/transactions",
+            headers=self.generate_headers(token, **{"Content-type": "application/json"}),
+            params=params,
+        )
+        response.raise_for_status()
+        return response
+
+    async def get_transaction(self, token: Token, transaction_id: str) -> Response:
+        response = await self.http_client.get(
+            f"{self.host}/transactions/{transaction_id}",
+            headers=self.generate_headers(token, **{"Content-type": "application/json"}),
+        )
+        response.raise_for_status()
+        return response
@@ -11,16 +11,16 @@ from .models.request import CreateRelayAddressPairRequest
 
 
 class CircleServiceClient(MykoboServiceClient):
-    def __init__(self, host: str, logger: Logger):
-        super().__init__(logger, host)
+    def __init__(self, host: str, logger: Logger, session: Optional[requests.Session] = None):
+        super().__init__(logger, host, session)
 
     def health(self) -> Response:
-        response = requests.get(f"{self.host}/health")
+        response = self.session.get(f"{self.host}/health")
         response.raise_for_status()
         return response
 
     def create_relay_address_pair(self, token: Token, request: CreateRelayAddressPairRequest) -> Response:
-        response = requests.post(
+        response = self.session.post(
             f"{self.host}/relay-addresses/pair",
             headers=self.generate_headers(token, **{"Content-type": "application/json"}),
             data=request.model_dump_json(exclude_none=True)
@@ -33,7 +33,7 @@ class CircleServiceClient(MykoboServiceClient):
         url = f"{self.host}/relay-addresses"
         if chain:
             url += f"?chain={chain}"
-        response = requests.get(
+        response = self.session.get(
             url,
             headers=self.generate_headers(token, **{"Content-type": "application/json"}),
         )
@@ -56,7 +56,7 @@ class CircleServiceClient(MykoboServiceClient):
         if purpose:
             params["purpose"] = purpose
 
-        response = requests.get(
+        response = self.session.get(
             url,
             headers=self.generate_headers(token, **{"Content-type": "application/json"}),
             params=params,
@@ -92,7 +92,7 @@ class CircleServiceClient(MykoboServiceClient):
         if recipient:
             params["recipient"] = recipient
 
-        response = requests.get(
+        response = self.session.get(
             url,
             headers=self.generate_headers(token, **{"Content-type": "application/json"}),
             params=params,
@@ -101,7 +101,7 @@ class CircleServiceClient(MykoboServiceClient):
         return response
 
     def get_transaction(self, token: Token, transaction_id: str) -> Response:
-        response = requests.get(
+        response = self.session.get(
             f"{self.host}/transactions/{transaction_id}",
             headers=self.generate_headers(token, **{"Content-type": "application/json"}),
         )
@@ -1,12 +1,114 @@
+import os
+import threading
+from http.cookiejar import DefaultCookiePolicy
 from logging import Logger
 from typing import Optional
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from mykobo_py.identity.models.auth import Token
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 20
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.3
+RETRY_STATUS_CODES = (502, 503, 504)
+RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def build_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+    keep_alive: bool = True,
+) -> requests.Session:
+    """
+    Build a requests Session backed by a pooled HTTP adapter.
+
+    Args:
+        pool_connections: Number of per-host connection pools to keep
+        pool_maxsize: Maximum number of connections kept alive per host
+        max_retries: Retries for connection errors and 502/503/504 responses.
+            Only GET, HEAD and OPTIONS are retried, so a write (POST, PUT, PATCH,
+            DELETE) is never sent twice.
+        backoff_factor: Backoff factor between retries
+        keep_alive: Whether connections are kept open between requests
+
+    The session never stores cookies: it is shared by every client, token and thread,
+    so a Set-Cookie from one service or caller would otherwise be replayed to all others.
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=RETRY_METHODS,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    return session
+
+
 class MykoboServiceClient:
+    _shared_session: Optional[requests.Session] = None
+    _shared_session_lock = threading.Lock()
 
-    def __init__(self, logger: Logger, host: str):
+    def __init__(self, logger: Logger, host: str, session: Optional[requests.Session] = None):
         self.logger = logger
         self.host = host
+        self._session = session
+
+    @property
+    def session(self) -> requests.Session:
+        """The session used for requests; the process-wide pooled session unless one was given."""
+        if self._session is not None:
+            return self._session
+        return MykoboServiceClient.shared_session()
+
+    @classmethod
+    def shared_session(cls) -> requests.Session:
+        """Return the pooled session shared by every service client, creating it on first use."""
+        with MykoboServiceClient._shared_session_lock:
+            if MykoboServiceClient._shared_session is None:
+                MykoboServiceClient._shared_session = build_session()
+            return MykoboServiceClient._shared_session
+
+    @classmethod
+    def configure_transport(cls, **kwargs) -> requests.Session:
+        """
+        Replace the shared session with one built from the given options.
+
+        Accepts the keyword arguments of `build_session`. Clients that were
+        given their own session are not affected.
+        """
+        session = build_session(**kwargs)
+        with MykoboServiceClient._shared_session_lock:
+            previous = MykoboServiceClient._shared_session
+            MykoboServiceClient._shared_session = session
+        if previous is not None:
+            previous.close()
+        return session
+
+    @classmethod
+    def close_transport(cls):
+        """Close the shared session and release its pooled connections."""
+        with MykoboServiceClient._shared_session_lock:
+            previous = MykoboServiceClient._shared_session
+            MykoboServiceClient._shared_session = None
+        if previous is not None:
+            previous.close()
 
     @staticmethod
     def generate_headers(token: Optional[Token], **kwargs) -> dict:
@@ -16,3 +118,13 @@ class MykoboServiceClient:
             headers["User-Agent"] = token.subject_id
         headers.update(kwargs)
         return headers
+
+
+def _reset_shared_session_after_fork():
+    """Give a forked child its own shared session instead of the parent's pooled sockets."""
+    MykoboServiceClient._shared_session = None
+    MykoboServiceClient._shared_session_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_shared_session_after_fork)
@@ -0,0 +1,74 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Generic, Hashable, Iterable, Tuple, TypeVar, Union
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+DEFAULT_MAX_WORKERS = 8
+
+
+def fan_out(
+    fn: Callable[[K], V],
+    keys: Iterable[K],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Dict[K, Union[V, Exception]]:
+    """
+    Call `fn` once for every distinct key on a bounded thread pool.
+
+    Returns a dict in the order the keys were first seen, mapping each key to
+    its result or to the exception it raised.
+    """
+    unique = list(dict.fromkeys(keys))
+    if not unique:
+        return {}
+
+    def call(key: K) -> Union[V, Exception]:
+        try:
+            return fn(key)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique)))) as executor:
+        return dict(zip(unique, executor.map(call, unique)))
+
+
+class SingleFlight(Generic[K, V]):
+    """
+    Coalesces concurrent calls for the same key into one.
+
+    While a call for a key is in flight, other callers asking for that key
+    wait for it and receive its result or exception instead of calling `fn`
+    themselves. Nothing is cached: a call made after the previous one
+    finished runs again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[K, Future] = {}
+
+    def do(self, key: K, fn: Callable[[], V]) -> Tuple[V, bool]:
+        """Return the result of `fn` and whether it was shared with a call already in flight."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Future()
+        if not leader:
+            return call.result(), True
+
+        try:
+            result = fn()
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        else:
+            call.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,52 @@
+import json
+from typing import Optional
+
+import httpx
+from httpx import Response
+
+from mykobo_py.async_client import AsyncMykoboServiceClient
+from mykobo_py.identity.models.auth import Token
+from mykobo_py.idenfy.models.requests import AccessTokenRequest, VerificationRequest
+
+
+class AsyncIdenfyServiceClient(AsyncMykoboServiceClient):
+    def __init__(self, host, logger, http_client: Optional[httpx.AsyncClient] = None):
+        super().__init__(logger, host, http_client)
+
+    async def health(self) -> Response:
+        """Check the health of the iDenfy gateway."""
+        response = await self.http_client.get(f"{self.host}/health")
+        response.raise_for_status()
+        return response
+
+    async def create_verification(self, token: Token, request: VerificationRequest) -> Response:
+        """
+        Create a verification session with iDenfy.
+        See IdenfyServiceClient.create_verification for response codes.
+        """
+        self.logger.info(f"Creating verification for {request.external_ref} at {self.host}...")
+        return await self._post(token, f"{self.host}/verification", request.to_dict())
+
+    async def get_access_token(self, token: Token, request: AccessTokenRequest) -> Response:
+        """
+        Legacy endpoint. Creates an iDenfy auth token directly.
+        Prefer create_verification() for new integrations.
+        """
+        self.logger.info(f"Sending {request} to {self.host}...")
+        return await self._post(token, f"{self.host}/access_token", request.to_dict())
+
+    async def send_event(self, token: Token, payload: dict) -> Response:
+        """
+        Forward an iDenfy webhook event to the gateway.
+        """
+        self.logger.info(f"Sending iDenfy event to {self.host}...")
+        return await self._post(token, f"{self.host}/event", payload)
+
+    async def _post(self, token: Token, url: str, data: dict) -> Response:
+        response = await self.http_client.post(
+            url,
+            headers=self.generate_headers(token, **{"Content-type": "application/json"}),
+            content=json.dumps(data),
+        )
+        response.raise_for_status()
+        return response
@@ -1,4 +1,5 @@
 import json
+from typing import Optional
 
 import requests
 from requests import Response
@@ -9,13 +10,13 @@ from mykobo_py.idenfy.models.requests import AccessTokenRequest, VerificationReq
 
 
 class IdenfyServiceClient(MykoboServiceClient):
-    def __init__(self, host, logger):
-        super().__init__(logger, host)
+    def __init__(self, host, logger, session: Optional[requests.Session] = None):
+        super().__init__(logger, host, session)
 
     def health(self) -> Response:
         """Check the health of the iDenfy gateway."""
         url = f"{self.host}/health"
-        response = requests.get(url)
+        response = self.session.get(url)
         response.raise_for_status()
         return response
 
@@ -31,7 +32,7 @@ class IdenfyServiceClient(MykoboServiceClient):
         """
         self.logger.info(f"Creating verification for {request.external_ref} at {self.host}...")
         url = f"{self.host}/verification"
-        response = requests.post(
+        response = self.session.post(
             url,
             headers=self.generate_headers(token, **{"Content-type": "application/json"}),
             data=json.dumps(request.to_dict()),
@@ -46,7 +47,7 @@ class IdenfyServiceClient(MykoboServiceClient):
         """
         self.logger.info(f"Sending {request} to {self.host}...")
         url = f"{self.host}/access_token"
-        response = requests.post(
+        response = self.session.post(
             url,
             headers=self.generate_headers(token, **{"Content-type": "application/json"}),
             data=json.dumps(request.to_dict()),
@@ -60,7 +61,7 @@ class IdenfyServiceClient(MykoboServiceClient):
         """
         self.logger.info(f"Sending iDenfy event to {self.host}...")
         url = f"{self.host}/event"
-        response = requests.post(
+        response = self.session.post(
             url,
             headers=self.generate_headers(token, **{"Content-type": "application/json"}),
             data=json.dumps(payload),
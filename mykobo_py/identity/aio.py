@@ -0,0 +1,186 @@
+import json
+import os
+from logging import Logger
+from typing import Optional
+
+import httpx
+from httpx import Response
+
+from mykobo_py.async_client import AsyncMykoboServiceClient
+from mykobo_py.identity.models.auth import Token, OtcChallenge
+from mykobo_py.identity.models.request import CustomerRequest, NewDocumentRequest, NewKycReviewRequest, \
+    UpdateProfileRequest, UserRiskResetRequest, UserProfileFilterRequest
+
+
+class AsyncIdentityServiceClient(AsyncMykoboServiceClient):
+
+    def __init__(self, host: str, logger: Logger, http_client: Optional[httpx.AsyncClient] = None):
+        super().__init__(logger, host, http_client)
+        self.app_key = os.getenv("IDENTITY_ACCESS_KEY")
+        self.app_secret = os.getenv("IDENTITY_SECRET_KEY")
+
+    async def authenticate(self, email, password) -> Token | OtcChallenge:
+        data = {
+            "email": email,
+            "password": password
+        }
+
+        response = await self.http_client.post(
+            f"{self.host}/authenticate",
+            headers=self.generate_headers(None, **{"Content-type": "application/json"}),
+            content=json.dumps(data)
+        )
+
+        response.raise_for_status()
+
+        if response.json().get("otp_required"):
+            return OtcChallenge.from_json(response.json())
+        else:
+            return Token.from_json(response.json())
+
+    async def authenticate_service(self, access_key: str, secret_key: str) -> Token:
+        response = await self.http_client.post(
+            f"{self.host}/authenticate",
+            headers=self.generate_headers(None, **{"Content-type": "application/json"}),
+            content=json.dumps({"access_key": access_key, "secret_key": secret_key}),
+        )
+
+        response.raise_for_status()
+        return Token.from_json(response.json())
+
+    async def refresh_token(self, refresh_token: str) -> Token:
+        data = {
+            "refresh_token": refresh_token
+        }
+
+        response = await self.http_client.post(
+            f"{self.host}/authenticate/refresh",
+            headers=self.generate_headers(None, **{"Content-type": "application/json"}),
+            content=json.dumps(data)
+        )
+
+        response.raise_for_status()
+        return Token.from_json(response.json())
+
+    async def otp_challenge(self, nonce: str, otp: int) -> Token:
+        data = {
+            "nonce": nonce,
+            "otp": otp
+        }
+
+        response = await self.http_client.post(
+            f"{self.host}/authenticate/otp/validate",
+            headers=self.generate_headers(None, **{"Content-type": "application/json"}),
+            content=json.dumps(data)
+        )
+
+        response.raise_for_status()
+        return Token.from_json(response.json())
+
+    async def acquire_token(self) -> Token | None:
+        try:
+            data = dict(access_key=self.app_key, secret_key=self.app_secret)
+            response = await self.http_client.post(
+                f"{self.host}/authenticate",
+                headers=self.generate_headers(None, **{"Content-type": "application/json"}),
+                content=json.dumps(data)
+            )
+            if response.is_success:
+                token = Token.from_json(response.json())
+                self.logger.info(f"Successfully acquired token from IDENTITY SERVICE for {token.subject_id}")
+                return token
+            else:
+                try:
+                    json_response = response.json()
+                    if "error" in json_response:
+                        self.logger.error(f"Failed to acquire token! Reason: {json_response['error']}")
+                    return None
+                except Exception as e:
+                    self.logger.error(f"Failed to acquire token! Reason: {response.content.decode('utf-8')}:{e}")
+                    return None
+        except Exception as e:
+            self.logger.warning("Could not acquire token. Reason: %s", e)
+            return None
+
+    async def check_scope(self, token: Token, target_token: str, scope: str) -> Response:
+        response = await self.http_client.post(
+            f"{self.host}/authorise/scope",
+            content=json.dumps({"token": target_token, "scope": scope}),
+            headers=self.generate_headers(token, **{"Content-type": "application/json"}),
+        )
+        response.raise_for_status()
+        return response
+
+    async def check_subject(self, token: Token, target_token: str, subject: str) -> Response:
+        response = await self.http_client.post(
+            f"{self.host}/authorise/subject",
+            content=json.dumps({"token": target_token, "subject": subject}),
+            headers=self.generate_headers(token, **{"Content-type": "application/json"}),
+        )
+        response.raise_for_status()
+        return response
+
+    async def get_user_profile(self, token: Token, id: str) -> Response:
+        self.logger.debug(f"Requesting user profile from IDENTITY SERVICE for {id}")
+        return await self._get(token, f"{self.host}/user/profile/{id}")
+
+    async def get_profile_with_token(self, token: Token) -> Response:
+        self.logger.debug(f"Requesting user profile from IDENTITY SERVICE for {token.subject_id} with token")
+        return await self._get(token, f"{self.host}/user/profile")
+
+    async def get_profile_by_email(self, token: Token, email: str) -> Response:
+        self.logger.debug(f"Requesting user profile from IDENTITY SERVICE for {email}")
+        return await self._get(token, f"{self.host}/user/profile/email/{email}")
+
+    async def get_user_kyc_profile(self, token: Token, id: str) -> Response:
+        self.logger.debug(f"Requesting user profile from IDENTITY SERVICE for {id}")
+        return await self._get(token, f"{self.host}/kyc/profile/{id}")
+
+    async def create_new_customer(self, token: Token, payload: CustomerRequest) -> Response:
+        return await self._send(token, "POST", f"{self.host}/user/profile/new", payload)
+
+    async def create_new_document(self, token: Token, payload: NewDocumentRequest) -> Response:
+        return await self._send(token, "PUT", f"{self.host}/kyc/documents", payload)
+
+    async def initiate_kyc_review(self, token: Token, payload: NewKycReviewRequest) -> Response:
+        return await self._send(token, "POST", f"{self.host}/kyc/reviews/initiate", payload)
+
+    async def list_profiles(self, token: Token, filters: UserProfileFilterRequest) -> Response:
+        return await self._send(token, "POST", f"{self.host}/user/list", filters)
+
+    async def update_user_profile(self, token: Token, profile_id: Optional[str], payload: UpdateProfileRequest) -> Response:
+        url = f"{self.host}/user/profile/update"
+        if profile_id:
+            url += f"/{profile_id}"
+        return await self._send(token, "PATCH", url, payload)
+
+    async def get_user_risk_score(self, token: Token, profile_id: str) -> Response:
+        return await self._get(token, f"{self.host}/user/profile/{profile_id}/risk_profile")
+
+    async def get_user_risk_score_history(self, token: Token, profile_id: str) -> Response:
+        return await self._get(token, f"{self.host}/user/profile/{profile_id}/risk_history")
+
+    async def get_profile_logs(self, token: Token, profile_id: str) -> Response:
+        return await self._get(token, f"{self.host}/user/profile/{profile_id}/logs")
+
+    async def reset_user_risk_score(self, token: Token, profile_id: str, reset_request=UserRiskResetRequest) -> Response:
+        url = f"{self.host}/user/profile/{profile_id}/risk_profile/reset"
+        return await self._send(token, "POST", url, reset_request)
+
+    async def _get(self, token: Token, url: str) -> Response:
+        response = await self.http_client.get(
+            url,
+            headers=self.generate_headers(token, **{"Content-type": "application/json"}),
+        )
+        response.raise_for_status()
+        return response
+
+    async def _send(self, token: Token, method: str, url: str, payload) -> Response:
+        response = await self.http_client.request(
+            method,
+            url,
+            headers=self.generate_headers(token, **{"Content-type": "application/json"}),
+            content=payload.model_dump_json(exclude_none=True)
+        )
+        response.raise_for_status()
+        return response
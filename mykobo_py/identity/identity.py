@@ -1,6 +1,6 @@
 import json
 import os
-from typing import Optional
+from typing import Callable, Dict, Iterable, Optional, Union
 
 import requests
 from logging import Logger
@@ -9,15 +9,31 @@ from .models.auth import Token, OtcChallenge
 from .models.request import CustomerRequest, NewDocumentRequest, NewKycReviewRequest, UpdateProfileRequest, \
     UserRiskResetRequest
 from mykobo_py.client import MykoboServiceClient
+from mykobo_py.concurrency import fan_out, DEFAULT_MAX_WORKERS
+from mykobo_py.identity.models.response import UserProfile
 from mykobo_py.identity.models.request import UserProfileFilterRequest
+from mykobo_py.identity.profile_cache import ProfileCache, PROFILE, EMAIL, KYC, RISK_SCORE
+from mykobo_py.identity.verifier import JwksTokenVerifier, SigningKeysUnavailable
+from mykobo_py.pagination import PageIterator
+
+JWKS_PATH = "/.well-known/jwks.json"
+PROFILE_LIST_KEY = "profiles"
 
 
 class IdentityServiceClient(MykoboServiceClient):
 
-    def __init__(self, host: str, logger: Logger):
-        super().__init__(logger, host)
+    def __init__(
+        self,
+        host: str,
+        logger: Logger,
+        session: Optional[requests.Session] = None,
+        profile_cache: Optional[ProfileCache] = None,
+    ):
+        super().__init__(logger, host, session)
         self.app_key = os.getenv("IDENTITY_ACCESS_KEY")
         self.app_secret = os.getenv("IDENTITY_SECRET_KEY")
+        self.verifier: Optional[JwksTokenVerifier] = None
+        self.profile_cache = profile_cache
 
     def authenticate(self, email, password) -> Token | OtcChallenge:
         data = {
@@ -25,7 +41,7 @@ class IdentityServiceClient(MykoboServiceClient):
             "password": password
         }
 
-        response = requests.post(
+        response = self.session.post(
             f"{self.host}/authenticate",
             headers=self.generate_headers(None, **{"Content-type": "application/json"}),
             data=json.dumps(data)
@@ -39,7 +55,7 @@ class IdentityServiceClient(MykoboServiceClient):
             return Token.from_json(response.json())
 
     def authenticate_service(self, access_key: str, secret_key: str) -> Token:
-        response = requests.post(
+        response = self.session.post(
             f"{self.host}/authenticate",
             headers=self.generate_headers(None, **{"Content-type": "application/json"}),
             data=json.dumps({"access_key": access_key, "secret_key": secret_key}),
@@ -53,7 +69,7 @@ class IdentityServiceClient(MykoboServiceClient):
             "refresh_token": refresh_token
         }
 
-        response = requests.post(
+        response = self.session.post(
             f"{self.host}/authenticate/refresh",
             headers=self.generate_headers(None, **{"Content-type": "application/json"}),
             data=json.dumps(data)
@@ -68,7 +84,7 @@ class IdentityServiceClient(MykoboServiceClient):
             "otp": otp
         }
 
-        response = requests.post(
+        response = self.session.post(
             f"{self.host}/authenticate/otp/validate",
             headers=self.generate_headers(None, **{"Content-type": "application/json"}),
             data=json.dumps(data)
@@ -80,7 +96,7 @@ class IdentityServiceClient(MykoboServiceClient):
     def acquire_token(self) -> Token | None:
         try:
             data = data = dict(access_key=self.app_key, secret_key=self.app_secret)
-            response = requests.post(
+            response = self.session.post(
                 f"{self.host}/authenticate",
                 headers=self.generate_headers(None, **{"Content-type": "application/json"}),
                 data=json.dumps(data)
@@ -105,7 +121,7 @@ class IdentityServiceClient(MykoboServiceClient):
             return None
 
     def check_scope(self, token: Token, target_token: str, scope: str) -> Response:
-        response = requests.post(
+        response = self.session.post(
             f"{self.host}/authorise/scope",
             data=json.dumps({"token": target_token, "scope": scope}),
             headers=self.generate_headers(token, **{"Content-type": "application/json"}),
@@ -114,7 +130,7 @@ class IdentityServiceClient(MykoboServiceClient):
         return response
 
     def check_subject(self, token: Token, target_token: str, subject: str) -> Response:
-        response = requests.post(
+        response = self.session.post(
             f"{self.host}/authorise/subject",
             data=json.dumps({"token": target_token, "subject": subject}),
             headers=self.generate_headers(token, **{"Content-type": "application/json"}),
@@ -122,19 +138,84 @@ class IdentityServiceClient(MykoboServiceClient):
         response.raise_for_status()
         return response
 
+    def get_signing_keys(self, jwks_path: str = JWKS_PATH) -> dict:
+        response = self.session.get(f"{self.host}{jwks_path}")
+        response.raise_for_status()
+        return response.json()
+
+    def enable_local_verification(self, jwks_path: str = JWKS_PATH, **kwargs) -> JwksTokenVerifier:
+        """
+        Check scopes and subjects in memory against the identity service's signing keys.
+
+        Keyword arguments are passed to JwksTokenVerifier (ttl, algorithms, audience, issuer, ...).
+        `authorise_scope` and `authorise_subject` fall back to the remote check whenever a token
+        cannot be verified locally.
+        """
+        self.verifier = JwksTokenVerifier(lambda: self.get_signing_keys(jwks_path), self.logger, **kwargs)
+        return self.verifier
+
+    def authorise_scope(self, token: Token, target_token: str, scope: str) -> bool:
+        if self.verifier is not None:
+            try:
+                return self.verifier.has_scope(target_token, scope)
+            except SigningKeysUnavailable as e:
+                self.logger.debug(f"Checking scope remotely, token could not be verified locally: {e}")
+        return self._authorised(lambda: self.check_scope(token, target_token, scope))
+
+    def authorise_subject(self, token: Token, target_token: str, subject: str) -> bool:
+        if self.verifier is not None:
+            try:
+                return self.verifier.has_subject(target_token, subject)
+            except SigningKeysUnavailable as e:
+                self.logger.debug(f"Checking subject remotely, token could not be verified locally: {e}")
+        return self._authorised(lambda: self.check_subject(token, target_token, subject))
+
+    @staticmethod
+    def _authorised(check) -> bool:
+        try:
+            check()
+            return True
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code in (401, 403):
+                return False
+            raise
+
     def get_user_profile(self, token: Token, id: str) -> Response:
         url = f"{self.host}/user/profile/{id}"
-        self.logger.debug(f"Requesting user profile from IDENTITY SERVICE for {id}")
-        response = requests.get(
-            url, headers=self.generate_headers(token, **{"Content-type": "application/json"}),
+
+        def fetch():
+            self.logger.debug(f"Requesting user profile from IDENTITY SERVICE for {id}")
+            response = self.session.get(
+                url, headers=self.generate_headers(token, **{"Content-type": "application/json"}),
+            )
+            response.raise_for_status()
+            return response
+
+        return self._read_through(token, PROFILE, id, fetch)
+
+    def get_user_profiles(
+        self,
+        token: Token,
+        ids: Iterable[str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> Dict[str, Union[UserProfile, Exception]]:
+        """
+        Look up many profiles concurrently, at most `max_workers` at a time.
+
+        Duplicate ids are requested once. Returns a dict mapping every id to its
+        UserProfile, or to the exception raised while fetching or parsing it.
+        Lookups go through the profile cache when one is configured.
+        """
+        return fan_out(
+            lambda id: UserProfile.model_validate(self.get_user_profile(token, id).json()),
+            ids,
+            max_workers=max_workers,
         )
-        response.raise_for_status()
-        return response
 
     def get_profile_with_token(self, token: Token) -> Response:
         url = f"{self.host}/user/profile"
         self.logger.debug(f"Requesting user profile from IDENTITY SERVICE for {token.subject_id} with token")
-        response = requests.get(
+        response = self.session.get(
             url, headers=self.generate_headers(token, **{"Content-type": "application/json"}),
         )
         response.raise_for_status()
@@ -142,24 +223,32 @@ class IdentityServiceClient(MykoboServiceClient):
 
     def get_profile_by_email(self, token: Token, email: str) -> Response:
         url = f"{self.host}/user/profile/email/{email}"
-        self.logger.debug(f"Requesting user profile from IDENTITY SERVICE for {email}")
-        response = requests.get(
-            url, headers=self.generate_headers(token, **{"Content-type": "application/json"}),
-        )
-        response.raise_for_status()
-        return response
+
+        def fetch():
+            self.logger.debug(f"Requesting user profile from IDENTITY SERVICE for {email}")
+            response = self.session.get(
+                url, headers=self.generate_headers(token, **{"Content-type": "application/json"}),
+            )
+            response.raise_for_status()
+            return response
+
+        return self._read_through(token, EMAIL, email, fetch)
 
     def get_user_kyc_profile(self, token: Token, id: str) -> Response:
         url = f"{self.host}/kyc/profile/{id}"
-        self.logger.debug(f"Requesting user profile from IDENTITY SERVICE for {id}")
-        response = requests.get(
-            url, headers=self.generate_headers(token, **{"Content-type": "application/json"}),
-        )
-        response.raise_for_status()
-        return response
+
+        def fetch():
+            self.logger.debug(f"Requesting user profile from IDENTITY SERVICE for {id}")
+            response = self.session.get(
+                url, headers=self.generate_headers(token, **{"Content-type": "application/json"}),
+            )
+            response.raise_for_status()
+            return response
+
+        return self._read_through(token, KYC, id, fetch)
 
     def create_new_customer(self, token: Token, payload: CustomerRequest) -> Response:
-        response = requests.post(
+        response = self.session.post(
             f"{self.host}/user/profile/new",
             headers=self.generate_headers(token, **{"Content-type": "application/json"}),
             data=payload.model_dump_json(exclude_none=True)
@@ -169,27 +258,29 @@ class IdentityServiceClient(MykoboServiceClient):
 
     def create_new_document(self, token: Token, payload: NewDocumentRequest) -> Response:
         url = f"{self.host}/kyc/documents"
-        response = requests.put(
+        response = self.session.put(
             url,
             headers=self.generate_headers(token, **{"Content-type": "application/json"}),
             data=payload.model_dump_json(exclude_none=True)
         )
+        self._invalidate_profile(payload.profile_id)
         response.raise_for_status()
         return response
 
     def initiate_kyc_review(self, token: Token, payload: NewKycReviewRequest) -> Response:
         url = f"{self.host}/kyc/reviews/initiate"
-        response = requests.post(
+        response = self.session.post(
             url,
             headers=self.generate_headers(token, **{"Content-type": "application/json"}),
             data=payload.model_dump_json(exclude_none=True)
         )
+        self._invalidate_profile(payload.profile_id)
         response.raise_for_status()
         return response
 
     def list_profiles(self, token: Token, filters: UserProfileFilterRequest) -> Response:
         url = f"{self.host}/user/list"
-        response = requests.post(
+        response = self.session.post(
             url,
             headers=self.generate_headers(token, **{"Content-type": "application/json"}),
             data=filters.model_dump_json(exclude_none=True)
@@ -197,31 +288,65 @@ class IdentityServiceClient(MykoboServiceClient):
         response.raise_for_status()
         return response
 
+    def iter_profiles(
+        self,
+        token: Token,
+        filters: UserProfileFilterRequest,
+        prefetch: bool = True,
+        items_key: str = PROFILE_LIST_KEY,
+        total_key: Optional[str] = None,
+    ) -> PageIterator[UserProfile]:
+        """
+        Iterate every profile matching `filters`, starting at `filters.page`, as parsed UserProfiles.
+
+        Pages of `filters.limit` profiles are requested as the iterator is consumed; with
+        `prefetch` the next page is requested while the current one is being processed.
+        Profiles are read from the `items_key` entry of each page and iteration stops on a
+        short or empty page, or at the grand total under `total_key` when one is given.
+        """
+        def fetch_page(page: int):
+            return self.list_profiles(token, filters.model_copy(update={"page": page})).json()
+
+        return PageIterator(
+            fetch_page,
+            limit=filters.limit,
+            items_key=items_key,
+            total_key=total_key,
+            parse=UserProfile.model_validate,
+            first_page=filters.page,
+            prefetch=prefetch,
+        )
+
     def update_user_profile(self, token: Token, profile_id: Optional[str], payload: UpdateProfileRequest) -> Response:
         url = f"{self.host}/user/profile/update"
         if profile_id:
             url += f"/{profile_id}"
-        response = requests.patch(
+        response = self.session.patch(
             url,
             headers=self.generate_headers(token, **{"Content-type": "application/json"}),
             data=payload.model_dump_json(exclude_none=True)
         )
+        self._invalidate_profile(profile_id or token.subject_id)
         response.raise_for_status()
         return response
 
     def get_user_risk_score(self, token: Token, profile_id: str) -> Response:
         url = f"{self.host}/user/profile/{profile_id}/risk_profile"
-        response = requests.get(
-            url,
-            headers=self.generate_headers(token, **{"Content-type": "application/json"})
-        )
-        response.raise_for_status()
-        return response
+
+        def fetch():
+            response = self.session.get(
+                url,
+                headers=self.generate_headers(token, **{"Content-type": "application/json"})
+            )
+            response.raise_for_status()
+            return response
+
+        return self._read_through(token, RISK_SCORE, profile_id, fetch)
 
     def get_user_risk_score_history(self, token: Token, profile_id: str) -> Response:
         url = f"{self.host}/user/profile/{profile_id}/risk_history"
 
-        response = requests.get(
+        response = self.session.get(
             url,
             headers=self.generate_headers(token, **{"Content-type": "application/json"})
         )
@@ -230,7 +355,7 @@ class IdentityServiceClient(MykoboServiceClient):
 
     def get_profile_logs(self, token: Token, profile_id: str) -> Response:
         url = f"{self.host}/user/profile/{profile_id}/logs"
-        response = requests.get(
+        response = self.session.get(
             url,
             headers=self.generate_headers(token, **{"Content-type": "application/json"})
         )
@@ -239,10 +364,27 @@ class IdentityServiceClient(MykoboServiceClient):
 
     def reset_user_risk_score(self, token: Token, profile_id: str, reset_request=UserRiskResetRequest) -> Response:
         url = f"{self.host}/user/profile/{profile_id}/risk_profile/reset"
-        response = requests.post(
+        response = self.session.post(
             url,
             headers=self.generate_headers(token, **{"Content-type": "application/json"}),
             data=reset_request.model_dump_json(exclude_none=True)
         )
+        self._invalidate_profile(profile_id)
         response.raise_for_status()
         return response
+
+    def _read_through(self, token: Optional[Token], endpoint: str, key: str, fetch: Callable[[], Response]) -> Response:
+        if self.profile_cache is None:
+            return fetch()
+        bearer = token.token if token else None
+        cached = self.profile_cache.get(endpoint, key, bearer)
+        if cached is not None:
+            return cached
+        generation = self.profile_cache.generation
+        response = fetch()
+        self.profile_cache.set(endpoint, key, response, generation, bearer)
+        return response
+
+    def _invalidate_profile(self, profile_id: Optional[str]):
+        if self.profile_cache is not None and profile_id:
+            self.profile_cache.invalidate(profile_id)
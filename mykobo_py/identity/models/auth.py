@@ -3,6 +3,36 @@ import jwt
 from pydantic import BaseModel, computed_field
 from typing import Optional
 
+from mykobo_py.cache import CacheInfo, TTLCache
+
+DEFAULT_JWT_CACHE_SIZE = 1024
+
+# Decoded claims keyed on the raw token, and built Tokens keyed on the fields they were built from.
+# Signatures are not verified when decoding, so an entry never goes stale.
+_jwt_cache = TTLCache(maxsize=DEFAULT_JWT_CACHE_SIZE)
+
+
+def decode_claims(jwt_token: str) -> dict:
+    """Decode the claims of a JWT without verifying it, memoized on the raw token."""
+    claims = _jwt_cache.get(jwt_token)
+    if claims is None:
+        claims = jwt.decode(jwt_token, options={"verify_signature": False})
+        _jwt_cache.set(jwt_token, claims)
+    return dict(claims)
+
+
+def configure_jwt_cache(maxsize: int):
+    """Resize the cache used by Token.from_json and Token.from_jwt."""
+    _jwt_cache.resize(maxsize)
+
+
+def clear_jwt_cache():
+    _jwt_cache.clear()
+
+
+def jwt_cache_info() -> CacheInfo:
+    return _jwt_cache.info()
+
 
 class Token(BaseModel):
     subject_id: str
@@ -17,23 +47,33 @@ class Token(BaseModel):
 
     @staticmethod
     def from_json(json_data: dict) -> 'Token':
-        decoded = jwt.decode(json_data["token"], options={"verify_signature": False})
-        return Token(
-            subject_id=json_data["subject_id"],
-            token=json_data["token"],
-            refresh_token=json_data["refresh_token"],
-            expires_at=datetime.fromtimestamp(decoded["exp"])
-        )
+        key = ("from_json", json_data["token"], json_data["subject_id"], json_data["refresh_token"])
+        token = _jwt_cache.get(key)
+        if token is None:
+            decoded = decode_claims(json_data["token"])
+            token = Token(
+                subject_id=json_data["subject_id"],
+                token=json_data["token"],
+                refresh_token=json_data["refresh_token"],
+                expires_at=datetime.fromtimestamp(decoded["exp"])
+            )
+            _jwt_cache.set(key, token)
+        return token.model_copy()
 
     @staticmethod
     def from_jwt(jwt_token: str) -> 'Token':
-        decoded = jwt.decode(jwt_token, options={"verify_signature": False})
-        return Token(
-            subject_id=decoded["sub"],
-            token=jwt_token,
-            refresh_token=None,
-            expires_at=datetime.fromtimestamp(decoded["exp"])
-        )
+        key = ("from_jwt", jwt_token)
+        token = _jwt_cache.get(key)
+        if token is None:
+            decoded = decode_claims(jwt_token)
+            token = Token(
+                subject_id=decoded["sub"],
+                token=jwt_token,
+                refresh_token=None,
+                expires_at=datetime.fromtimestamp(decoded["exp"])
+            )
+            _jwt_cache.set(key, token)
+        return token.model_copy()
 
 
 class OtcChallenge(BaseModel):
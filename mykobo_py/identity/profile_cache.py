@@ -0,0 +1,100 @@
+import threading
+from collections import Counter
+from typing import Dict, Optional
+
+from requests import Response
+
+from mykobo_py.cache import TTLCache
+
+PROFILE = "profile"
+EMAIL = "email"
+KYC = "kyc"
+RISK_SCORE = "risk_score"
+
+DEFAULT_TTLS = {
+    PROFILE: 60,
+    EMAIL: 60,
+    KYC: 30,
+    RISK_SCORE: 30,
+}
+DEFAULT_MAX_SIZE = 10_000
+
+
+class ProfileCache:
+    """
+    Read-through cache of identity service profile lookups.
+
+    Responses are cached per endpoint (profile, email, kyc, risk_score) with
+    their own TTL and share one LRU bound. Every entry is tagged with the
+    profile it belongs to so `invalidate` drops all of them, including lookups
+    made by email. Entries are also keyed on the bearer token they were
+    fetched with, so a response is only served to callers presenting that
+    same token and never to one the identity service might have refused.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAX_SIZE, ttls: Optional[Dict[str, float]] = None):
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self._cache = TTLCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+        self.generation = 0
+
+    def get(self, endpoint: str, key: str, token: Optional[str] = None) -> Optional[Response]:
+        entry = self._cache.get((endpoint, token, key))
+        with self._lock:
+            if entry is None:
+                self.misses[endpoint] += 1
+                return None
+            self.hits[endpoint] += 1
+        return entry[0]
+
+    def set(
+        self,
+        endpoint: str,
+        key: str,
+        response: Response,
+        generation: Optional[int] = None,
+        token: Optional[str] = None,
+    ):
+        """
+        Cache a response. Pass the `generation` read before the request was made so that a
+        response fetched before an invalidation is not cached after it.
+        """
+        if endpoint == EMAIL:
+            try:
+                profile_id = response.json().get("id")
+            except ValueError:
+                return
+        else:
+            profile_id = key
+        # Checked and stored under the lock so an invalidate cannot slip in between
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._cache.set((endpoint, token, key), (response, profile_id), ttl=self.ttls[endpoint])
+
+    def invalidate(self, profile_id: str) -> int:
+        """Drop every cached lookup of a profile and return how many entries were removed."""
+        with self._lock:
+            self.generation += 1
+            return self._cache.discard_where(lambda key, entry: entry[1] == profile_id)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self.generation += 1
+            self.hits.clear()
+            self.misses.clear()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {
+                endpoint: {"hits": self.hits[endpoint], "misses": self.misses[endpoint]}
+                for endpoint in self.ttls
+            }
+
+    def __len__(self) -> int:
+        return len(self._cache)
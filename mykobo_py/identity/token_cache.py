@@ -0,0 +1,121 @@
+import fcntl
+import os
+import stat
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from pydantic import ValidationError
+
+from mykobo_py.identity.models.auth import Token
+from mykobo_py.identity.token_manager import TokenCache
+
+
+def _owned_privately(file_stat: os.stat_result) -> bool:
+    """Whether a file belongs to the current user and nobody else can read or write it."""
+    return file_stat.st_uid == os.geteuid() and not file_stat.st_mode & (stat.S_IRWXG | stat.S_IRWXO)
+
+
+def private_directory() -> str:
+    """
+    A directory only the current user can access: $XDG_RUNTIME_DIR when set, otherwise
+    a per-user directory under the system temp directory, created on first use.
+    """
+    directory = os.environ.get("XDG_RUNTIME_DIR") or os.path.join(tempfile.gettempdir(), f"mykobo-{os.geteuid()}")
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    directory_stat = os.lstat(directory)
+    if not stat.S_ISDIR(directory_stat.st_mode) or not _owned_privately(directory_stat):
+        raise PermissionError(f"{directory} is not a directory private to the current user")
+    return directory
+
+
+class FileTokenCache(TokenCache):
+    """
+    Token cache shared by every process on a host through a file.
+
+    Meant for pre-fork deployments (gunicorn, celery) where each worker runs
+    its own TokenManager: the first worker to need a token takes an exclusive
+    flock, authenticates and writes the token, the others block on the lock
+    and then pick up the stored token. Writes are atomic renames so readers
+    never see a partial file. A token file or lock file that is not owned by
+    the current user, or that others can access, is never trusted. POSIX only.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock_path = f"{path}.lock"
+        self._memo_lock = threading.Lock()
+        self._memo_key: Optional[tuple] = None
+        self._memo_token: Optional[Token] = None
+
+    @classmethod
+    def for_service(cls, access_key: str, directory: Optional[str] = None) -> 'FileTokenCache':
+        """Cache file for one service identity, in a directory private to the current user unless given."""
+        directory = directory or private_directory()
+        return cls(os.path.join(directory, f"mykobo-service-token-{access_key}.json"))
+
+    def load(self) -> Optional[Token]:
+        try:
+            fd = os.open(self.path, os.O_RDONLY | os.O_NOFOLLOW)
+        except OSError:
+            return None
+
+        with os.fdopen(fd, "r") as f:
+            file_stat = os.fstat(f.fileno())
+            if not _owned_privately(file_stat):
+                return None
+
+            # Stores replace the file, so inode, mtime and size identify its contents
+            key = (file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size)
+            with self._memo_lock:
+                if key == self._memo_key:
+                    return self._memo_token
+
+            try:
+                token = Token.model_validate_json(f.read())
+            except (OSError, ValueError, ValidationError):
+                return None
+
+        with self._memo_lock:
+            self._memo_key = key
+            self._memo_token = token
+        return token
+
+    def store(self, token: Token):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".mykobo-token-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(token.model_dump_json(exclude={"is_expired"}))
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def clear(self):
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+        with self._memo_lock:
+            self._memo_key = None
+            self._memo_token = None
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+        try:
+            if not _owned_privately(os.fstat(fd)):
+                raise PermissionError(f"Lock file {self.lock_path} is not private to the current user")
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
@@ -0,0 +1,147 @@
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from logging import Logger
+from typing import Iterator, Optional, Union
+
+from mykobo_py.identity.identity import IdentityServiceClient
+from mykobo_py.identity.models.auth import Token
+
+DEFAULT_REFRESH_MARGIN = timedelta(seconds=60)
+
+
+class TokenCache:
+    """
+    Storage for the service token held by a TokenManager.
+
+    `lock` guards a refresh so that only one holder of the cache fetches a new
+    token at a time. The in-memory implementation relies on the manager's own
+    lock, backends shared between processes must provide their own.
+    """
+
+    def load(self) -> Optional[Token]:
+        raise NotImplementedError
+
+    def store(self, token: Token):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        yield
+
+
+class MemoryTokenCache(TokenCache):
+    def __init__(self):
+        self._token: Optional[Token] = None
+
+    def load(self) -> Optional[Token]:
+        return self._token
+
+    def store(self, token: Token):
+        self._token = token
+
+    def clear(self):
+        self._token = None
+
+
+class TokenManager:
+    """
+    Caches the service token acquired through an IdentityServiceClient.
+
+    Once the cached token is within `refresh_margin` of `expires_at` it is
+    still handed out while a single background refresh runs. When there is no
+    usable token the caller blocks; concurrent callers wait for the one
+    refresh in flight instead of each authenticating on their own.
+    """
+
+    def __init__(
+        self,
+        client: IdentityServiceClient,
+        logger: Optional[Logger] = None,
+        refresh_margin: Union[timedelta, float] = DEFAULT_REFRESH_MARGIN,
+        cache: Optional[TokenCache] = None,
+        background_refresh: bool = True,
+    ):
+        self.client = client
+        self.logger = logger or client.logger
+        if not isinstance(refresh_margin, timedelta):
+            refresh_margin = timedelta(seconds=refresh_margin)
+        self.refresh_margin = refresh_margin
+        self.cache = cache or MemoryTokenCache()
+        self.background_refresh = background_refresh
+        self._condition = threading.Condition()
+        self._refreshing = False
+        self._last_result: Optional[Token] = None
+
+    def get_token(self) -> Optional[Token]:
+        """Return a valid service token, refreshing it if needed. None if one could not be acquired."""
+        token = self.cache.load()
+        if token is not None and not self.needs_refresh(token):
+            return token
+        if token is not None and not token.is_expired and self.background_refresh:
+            self._refresh_in_background()
+            return token
+        return self.refresh()
+
+    def needs_refresh(self, token: Token) -> bool:
+        return datetime.now() >= token.expires_at - self.refresh_margin
+
+    def refresh(self) -> Optional[Token]:
+        """Refresh the token, or wait for the refresh already in flight and return its result."""
+        with self._condition:
+            if self._refreshing:
+                while self._refreshing:
+                    self._condition.wait()
+                return self._last_result
+            self._refreshing = True
+        return self._run_refresh()
+
+    def invalidate(self):
+        """Drop the cached token so the next call authenticates again."""
+        self.cache.clear()
+
+    def _refresh_in_background(self):
+        with self._condition:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._run_refresh, name="token-manager-refresh", daemon=True).start()
+
+    def _run_refresh(self) -> Optional[Token]:
+        token = None
+        try:
+            token = self._fetch()
+        finally:
+            with self._condition:
+                self._last_result = token
+                self._refreshing = False
+                self._condition.notify_all()
+        return token
+
+    def _fetch(self) -> Optional[Token]:
+        with self.cache.lock():
+            current = self.cache.load()
+            # Another holder of the cache may have refreshed while we waited on the lock
+            if current is not None and not self.needs_refresh(current):
+                return current
+
+            token = None
+            if current is not None and current.refresh_token and not current.is_expired:
+                try:
+                    token = self.client.refresh_token(current.refresh_token)
+                except Exception as e:
+                    self.logger.warning("Could not refresh service token, re-authenticating. Reason: %s", e)
+
+            if token is None:
+                token = self.client.acquire_token()
+
+            if token is None:
+                if current is not None and not current.is_expired:
+                    return current
+                return None
+
+            self.cache.store(token)
+            return token
@@ -0,0 +1,134 @@
+import threading
+import time
+from logging import Logger
+from typing import Callable, List, Optional
+
+import jwt
+from jwt import PyJWK, PyJWKSet
+
+DEFAULT_JWKS_TTL = 300
+DEFAULT_MIN_REFRESH_INTERVAL = 30
+DEFAULT_ALGORITHMS = ["RS256", "ES256"]
+
+
+class SigningKeysUnavailable(Exception):
+    """The token cannot be checked locally, e.g. the signing keys could not be fetched or its key is unknown."""
+
+
+class JwksTokenVerifier:
+    """
+    Verifies identity service tokens in memory against its published signing keys.
+
+    The JWKS document returned by `fetch_jwks` is cached for `ttl` seconds. A
+    token signed with an unknown key id triggers an early refetch so rotated
+    keys are picked up, at most once every `min_refresh_interval` seconds. If
+    a refetch fails the keys already held keep being used.
+
+    `verify` raises `SigningKeysUnavailable` when it cannot decide locally and
+    a `jwt.PyJWTError` when the token is rejected.
+    """
+
+    def __init__(
+        self,
+        fetch_jwks: Callable[[], dict],
+        logger: Logger,
+        ttl: float = DEFAULT_JWKS_TTL,
+        min_refresh_interval: float = DEFAULT_MIN_REFRESH_INTERVAL,
+        algorithms: Optional[List[str]] = None,
+        audience: Optional[str] = None,
+        issuer: Optional[str] = None,
+        leeway: float = 0,
+    ):
+        self.fetch_jwks = fetch_jwks
+        self.logger = logger
+        self.ttl = ttl
+        self.min_refresh_interval = min_refresh_interval
+        self.algorithms = algorithms or list(DEFAULT_ALGORITHMS)
+        self.audience = audience
+        self.issuer = issuer
+        self.leeway = leeway
+        self._lock = threading.Lock()
+        self._keys: Optional[PyJWKSet] = None
+        self._fetched_at: Optional[float] = None
+
+    def verify(self, target_token: str) -> dict:
+        """Check the signature, expiry, audience and issuer of a token and return its claims."""
+        header = jwt.get_unverified_header(target_token)
+        algorithm = header.get("alg")
+        if algorithm not in self.algorithms:
+            raise SigningKeysUnavailable(f"Token is signed with {algorithm}, which is not verified locally")
+
+        key = self.signing_key(header.get("kid"))
+        # The header is untrusted, so it must name the algorithm the key was published for
+        if key.algorithm_name != algorithm:
+            raise jwt.InvalidAlgorithmError(f"Token is signed with {algorithm} but key {key.key_id} is {key.algorithm_name}")
+        return jwt.decode(
+            target_token,
+            key=key,
+            algorithms=[algorithm],
+            audience=self.audience,
+            issuer=self.issuer,
+            leeway=self.leeway,
+            options={"require": ["exp", "sub"], "verify_aud": self.audience is not None},
+        )
+
+    def has_scope(self, target_token: str, scope: str) -> bool:
+        try:
+            claims = self.verify(target_token)
+        except (jwt.PyJWTError, TypeError) as e:
+            self.logger.info(f"Rejected token while checking scope {scope}: {e}")
+            return False
+        scopes = claims.get("scope") or []
+        if isinstance(scopes, str):
+            scopes = scopes.split()
+        return scope in scopes
+
+    def has_subject(self, target_token: str, subject: str) -> bool:
+        try:
+            claims = self.verify(target_token)
+        except (jwt.PyJWTError, TypeError) as e:
+            self.logger.info(f"Rejected token while checking subject {subject}: {e}")
+            return False
+        return claims.get("sub") == subject
+
+    def signing_key(self, kid: Optional[str]) -> PyJWK:
+        with self._lock:
+            now = time.monotonic()
+            refreshed = False
+            if self._keys is None or now - self._fetched_at >= self.ttl:
+                self._refresh(now)
+                refreshed = True
+            key = self._find(kid)
+            # An unknown key id may mean the keys were rotated since we last fetched them
+            if key is None and not refreshed and now - self._fetched_at >= self.min_refresh_interval:
+                self._refresh(now)
+                key = self._find(kid)
+        if key is None:
+            raise SigningKeysUnavailable(f"No signing key found for kid {kid}")
+        return key
+
+    def clear(self):
+        with self._lock:
+            self._keys = None
+            self._fetched_at = None
+
+    def _find(self, kid: Optional[str]) -> Optional[PyJWK]:
+        if self._keys is None:
+            return None
+        if kid is None:
+            return self._keys.keys[0] if len(self._keys.keys) == 1 else None
+        for key in self._keys.keys:
+            if key.key_id == kid:
+                return key
+        return None
+
+    def _refresh(self, now: float):
+        try:
+            self._keys = PyJWKSet.from_dict(self.fetch_jwks())
+            self._fetched_at = now
+        except Exception as e:
+            if self._keys is None:
+                raise SigningKeysUnavailable(f"Could not fetch signing keys: {e}") from e
+            # Keep serving the keys we have; retry once the refresh interval has passed
+            self._fetched_at = now - self.ttl + self.min_refresh_interval
+            self.logger.warning(f"Could not refresh signing keys, using cached keys. Reason: {e}")
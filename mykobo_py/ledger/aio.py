@@ -0,0 +1,103 @@
+from logging import Logger
+from typing import Optional
+
+import httpx
+
+from mykobo_py.async_client import AsyncMykoboServiceClient
+from mykobo_py.identity.models.auth import Token
+from mykobo_py.ledger.models.request import TransactionFilterRequest, GetVerificationExceptionRequest, \
+    AddVerificationException, RevokeExceptionRequest
+
+
+class AsyncLedgerServiceClient(AsyncMykoboServiceClient):
+    def __init__(self, host: str, logger: Logger, http_client: Optional[httpx.AsyncClient] = None):
+        super().__init__(logger, host, http_client)
+
+    async def transaction_list(self, token: Token, params: TransactionFilterRequest):
+        """
+        Get a list of transactions with a set of filter options.
+        See LedgerServiceClient.transaction_list for the request shape.
+        """
+        params_dict = params.to_dict()
+        params_dict["from"] = params.from_date
+        params_dict["to"] = params.to_date
+
+        try:
+            self.logger.info(f"Getting transactions with {params}")
+            response = await self.http_client.post(
+                f"{self.host}/transactions/list",
+                headers=self.generate_headers(token, **{"Content-type": "application/json"}),
+                json=params_dict
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            self.logger.error(e)
+            return {}
+
+    async def get_transaction_statuses(self, token: Token, status: Optional[str] = None):
+        url = f"{self.host}/transactions/statuses"
+        if status:
+            url += f"/transitions/{status}"
+        return await self._get_json(token, url)
+
+    async def get_transaction_by_reference(self, token: Token, reference: str):
+        return await self._get_json(token, f"{self.host}/transactions/reference/{reference}/details")
+
+    async def get_transaction_by_external_id(self, token: Token, external_id: str):
+        return await self._get_json(token, f"{self.host}/transactions/external/{external_id}")
+
+    async def get_transaction_compliance_events(self, token: Token, reference: str):
+        return await self._get_json(token, f"{self.host}/transactions/reference/{reference}/compliance")
+
+    async def get_transaction_stats(self, token: Token, to_date: Optional[str], from_date: Optional[str], profile_id: Optional[str]):
+        params = {}
+        if to_date:
+            params["to"] = to_date
+        if from_date:
+            params["from"] = from_date
+        if profile_id:
+            params["profile_id"] = profile_id
+        return await self._get_json(token, f"{self.host}/transactions/stats", params=params)
+
+    async def get_compliance_gates(self, token: Token):
+        return await self._get_json(token, f"{self.host}/transactions/compliance_gates")
+
+    async def get_verification_error_codes(self, token: Token):
+        return await self._get_json(token, f"{self.host}/transactions/verification/error_codes")
+
+    async def get_exceptions(self, token: Token, params: GetVerificationExceptionRequest):
+        params_dict = params.to_dict()
+        params_dict["from"] = params.from_date
+        params_dict["to"] = params.to_date
+        return await self._get_json(token, f"{self.host}/transactions/exceptions", params=params_dict)
+
+    async def get_exception(self, token: Token, id: int):
+        return await self._get_json(token, f"{self.host}/transactions/exceptions/{id}")
+
+    async def add_exception(self, token: Token, exception: AddVerificationException):
+        response = await self.http_client.post(
+            f"{self.host}/transactions/exceptions",
+            headers=self.generate_headers(token, **{"Content-type": "application/json"}),
+            json=exception.to_dict()
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def revoke_exception(self, token: Token, exception: RevokeExceptionRequest):
+        response = await self.http_client.put(
+            f"{self.host}/transactions/exceptions/{exception.id}/revoke",
+            headers=self.generate_headers(token, **{"Content-type": "application/json"}),
+            json=exception.to_dict()
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def _get_json(self, token: Token, url: str, params: Optional[dict] = None):
+        response = await self.http_client.get(
+            url,
+            headers=self.generate_headers(token, **{"Content-type": "application/json"}),
+            params=params
+        )
+        response.raise_for_status()
+        return response.json()
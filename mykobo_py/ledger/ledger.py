@@ -1,19 +1,33 @@
+import copy
 import json
 import os
-from typing import Optional
+from datetime import timedelta
+from typing import Callable, Dict, Iterable, Optional, Union
 from mykobo_py.client import MykoboServiceClient
+from mykobo_py.concurrency import SingleFlight, fan_out, DEFAULT_MAX_WORKERS as DEFAULT_LOOKUP_WORKERS
 from logging import Logger
 import requests
 from mykobo_py.identity.models.auth import Token
 from mykobo_py.ledger.models.request import TransactionFilterRequest, GetVerificationExceptionRequest, \
     AddVerificationException, RevokeExceptionRequest
+from mykobo_py.ledger.partition import PartitionedExport, time_slices, parse_ledger_datetime, \
+    format_ledger_datetime, DEFAULT_SLICE_WIDTH, DEFAULT_MAX_WORKERS
+from mykobo_py.ledger.models.reference import ComplianceGate, VerificationErrorCode
+from mykobo_py.ledger.reference import ReferenceDataCache
+from mykobo_py.ledger.statuses import TransactionStatusGraph
+from mykobo_py.pagination import PageIterator
+
+TRANSACTION_LIST_KEY = "transactions"
 
 
 class LedgerServiceClient(MykoboServiceClient):
-    def __init__(self, host: str, logger: Logger):
-        super().__init__(logger, host)
+    def __init__(self, host: str, logger: Logger, session: Optional[requests.Session] = None):
+        super().__init__(logger, host, session)
         self.app_key = os.getenv("IDENTLTY_ACCESS_KEY")
         self.app_secret = os.getenv("IDENTITY_SECRET_KEY")
+        self.status_graph = TransactionStatusGraph(self.get_transaction_statuses, logger)
+        self.reference_data = ReferenceDataCache(self.get_compliance_gates, self.get_verification_error_codes, logger)
+        self._reference_lookups = SingleFlight()
 
     def transaction_list(self, token: Token, params: TransactionFilterRequest):
         """
@@ -32,44 +46,184 @@ class LedgerServiceClient(MykoboServiceClient):
               "limit": 2
            }
         """
-        params_dict = params.to_dict()
-        params_dict["from"] = params.from_date
-        params_dict["to"] = params.to_date
-
         try:
-            self.logger.info(f"Getting transactions with {params}")
-            response = requests.post(
-                f"{self.host}/transactions/list",
-                headers=self.generate_headers(token, **{"Content-type": "application/json"}),
-                json=params_dict
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._transaction_page(token, params)
         except requests.exceptions.HTTPError as e:
             self.logger.error(e)
             return {}
 
+    def iter_transactions(
+        self,
+        token: Token,
+        params: TransactionFilterRequest,
+        prefetch: bool = True,
+        on_page: Optional[Callable[[PageIterator], None]] = None,
+        items_key: str = TRANSACTION_LIST_KEY,
+        total_key: Optional[str] = None,
+    ) -> PageIterator[dict]:
+        """
+        Iterate every transaction matching `params`, starting at `params.page`.
+
+        Pages of `params.limit` transactions are requested as the iterator is consumed;
+        with `prefetch` the next page is requested in the background while the current
+        one is processed. `on_page` is called with the iterator after each page arrives,
+        and its pages_fetched, items_yielded and total attributes report progress.
+        Transactions are read from the `items_key` entry of each transaction_list page
+        and a page of any other shape raises ValueError. Iteration ends on a short or
+        empty page, or at the grand total under `total_key` when one is given. Unlike
+        transaction_list, a failed page raises instead of ending the iteration.
+        """
+        def fetch_page(page: int):
+            return self._transaction_page(token, params.model_copy(update={"page": page}))
+
+        return PageIterator(
+            fetch_page,
+            limit=params.limit,
+            items_key=items_key,
+            total_key=total_key,
+            first_page=params.page,
+            prefetch=prefetch,
+            on_page=on_page,
+        )
+
+    def export_transactions(
+        self,
+        token: Token,
+        params: TransactionFilterRequest,
+        slice_width: timedelta = DEFAULT_SLICE_WIDTH,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        ordered: bool = True,
+        items_key: str = TRANSACTION_LIST_KEY,
+    ) -> PartitionedExport:
+        """
+        Export every transaction between `params.from_date` and `params.to_date` concurrently.
+
+        The range is split into windows of `slice_width`, each walked page by page on a pool
+        of `max_workers` threads, and the results are merged into one stream without
+        duplicates. With `ordered` rows come out in window order, otherwise as soon as any
+        window produces a page.
+        """
+        if not params.from_date or not params.to_date:
+            raise ValueError("export_transactions requires both from_date and to_date")
+
+        def fetch_slice(start, end):
+            window = params.model_copy(update={
+                "from_date": format_ledger_datetime(start),
+                "to_date": format_ledger_datetime(end),
+            })
+            return self.iter_transactions(token, window, prefetch=False, items_key=items_key)
+
+        slices = time_slices(parse_ledger_datetime(params.from_date), parse_ledger_datetime(params.to_date), slice_width)
+        return PartitionedExport(fetch_slice, slices, max_workers=max_workers, ordered=ordered, page_size=params.limit)
+
+    def write_transactions(
+        self,
+        token: Token,
+        params: TransactionFilterRequest,
+        path: str,
+        file_format: str = "parquet",
+        items_key: str = TRANSACTION_LIST_KEY,
+    ) -> int:
+        """
+        Write every transaction matching `params` to a Parquet or Arrow IPC file.
+
+        Each transaction_list page becomes one record batch, with amounts as fixed-point
+        decimals and timestamps as UTC datetimes (see mykobo_py.ledger.columnar). Needs
+        pyarrow, installed with the 'arrow' extra. Returns the number of rows written.
+        """
+        from mykobo_py.ledger.columnar import write_record_batches
+
+        pages = self.iter_transactions(token, params, items_key=items_key).pages()
+        return write_record_batches(pages, path, file_format=file_format)
+
+    def compute_transaction_stats(
+        self,
+        token: Token,
+        params: TransactionFilterRequest,
+        profile_ids: Optional[Iterable[str]] = None,
+        items_key: str = TRANSACTION_LIST_KEY,
+    ) -> Dict[str, Dict[str, object]]:
+        """
+        Compute get_transaction_stats style aggregates for every profile in one pass.
+
+        Walks every transaction matching `params` and returns stats keyed by profile id
+        (see mykobo_py.ledger.stats), optionally only for `profile_ids`. Replaces one
+        get_transaction_stats request per profile. Needs pyarrow, installed with the
+        'arrow' extra.
+        """
+        from mykobo_py.ledger.stats import TransactionStatsEngine
+
+        engine = TransactionStatsEngine(profile_ids)
+        for page in self.iter_transactions(token, params, items_key=items_key).pages():
+            engine.add_page(page)
+        return engine.result()
+
+    def _transaction_page(self, token: Token, params: TransactionFilterRequest):
+        params_dict = params.to_dict()
+        params_dict["from"] = params.from_date
+        params_dict["to"] = params.to_date
+
+        self.logger.info(f"Getting transactions with {params}")
+        response = self.session.post(
+            f"{self.host}/transactions/list",
+            headers=self.generate_headers(token, **{"Content-type": "application/json"}),
+            json=params_dict
+        )
+        response.raise_for_status()
+        return response.json()
+
     def get_transaction_statuses(self, token: Token, status: Optional[str] = None):
         url = f"{self.host}/transactions/statuses"
         if status:
             url += f"/transitions/{status}"
-        response = requests.get(
+        response = self.session.get(
             url,
             headers=self.generate_headers(token, **{"Content-type": "application/json"})
         )
         response.raise_for_status()
         return response.json()
 
+    def can_transition(self, token: Token, from_status: str, to_status: str) -> bool:
+        """
+        Whether a transaction may move from `from_status` to `to_status`.
+
+        Answered from `status_graph`, which loads every transition once and refreshes
+        it after its ttl, instead of calling get_transaction_statuses each time.
+        """
+        return self.status_graph.can_transition(token, from_status, to_status)
+
     def get_transaction_by_reference(self, token: Token, reference: str):
-        response = requests.get(
-            f"{self.host}/transactions/reference/{reference}/details",
-            headers=self.generate_headers(token, **{"Content-type": "application/json"})
-        )
-        response.raise_for_status()
-        return response.json()
+        """
+        Concurrent lookups of the same reference share one request; callers that joined
+        a request already in flight get their own copy of its result.
+        """
+        def fetch():
+            response = self.session.get(
+                f"{self.host}/transactions/reference/{reference}/details",
+                headers=self.generate_headers(token, **{"Content-type": "application/json"})
+            )
+            response.raise_for_status()
+            return response.json()
+
+        result, shared = self._reference_lookups.do((token.token if token else None, reference), fetch)
+        return copy.deepcopy(result) if shared else result
+
+    def get_transactions_by_reference(
+        self,
+        token: Token,
+        references: Iterable[str],
+        max_workers: int = DEFAULT_LOOKUP_WORKERS,
+    ) -> Dict[str, Union[dict, Exception]]:
+        """
+        Look up many transactions concurrently, at most `max_workers` at a time.
+
+        Duplicate references are requested once. Returns a dict mapping every reference
+        to its transaction details, or to the exception raised while fetching them.
+        """
+        return fan_out(lambda reference: self.get_transaction_by_reference(token, reference), references, max_workers)
 
     def get_transaction_by_external_id(self, token: Token, external_id: str):
-        response = requests.get(
+        response = self.session.get(
             f"{self.host}/transactions/external/{external_id}",
             headers=self.generate_headers(token, **{"Content-type": "application/json"})
         )
@@ -77,7 +231,7 @@ class LedgerServiceClient(MykoboServiceClient):
         return response.json()
 
     def get_transaction_compliance_events(self, token: Token, reference: str):
-        response = requests.get(
+        response = self.session.get(
             f"{self.host}/transactions/reference/{reference}/compliance",
             headers=self.generate_headers(token, **{"Content-type": "application/json"})
         )
@@ -98,13 +252,13 @@ class LedgerServiceClient(MykoboServiceClient):
         if profile_id:
             url = f"{url}&profile_id={profile_id}"
 
-        response = requests.get(url, headers=self.generate_headers(token, **{"Content-type": "application/json"}))
+        response = self.session.get(url, headers=self.generate_headers(token, **{"Content-type": "application/json"}))
         response.raise_for_status()
         return response.json()
 
     def get_compliance_gates(self, token: Token):
         url = f"{self.host}/transactions/compliance_gates"
-        response = requests.get(
+        response = self.session.get(
             url,
             headers=self.generate_headers(token, **{"Content-type": "application/json"})
         )
@@ -113,20 +267,28 @@ class LedgerServiceClient(MykoboServiceClient):
 
     def get_verification_error_codes(self, token: Token):
         url = f"{self.host}/transactions/verification/error_codes"
-        response = requests.get(
+        response = self.session.get(
             url,
             headers=self.generate_headers(token, **{"Content-type": "application/json"})
         )
         response.raise_for_status()
         return response.json()
 
+    def get_compliance_gate(self, token: Token, code: str) -> Optional[ComplianceGate]:
+        """Look up a compliance gate from `reference_data`, refreshed in the background after its ttl."""
+        return self.reference_data.compliance_gate(token, code)
+
+    def get_verification_error_code(self, token: Token, code: str) -> Optional[VerificationErrorCode]:
+        """Look up a verification error code from `reference_data`, refreshed in the background after its ttl."""
+        return self.reference_data.verification_error_code(token, code)
+
     def get_exceptions(self, token: Token, params: GetVerificationExceptionRequest):
         params_dict = params.to_dict()
         params_dict["from"] = params.from_date
         params_dict["to"] = params.to_date
 
         url = f"{self.host}/transactions/exceptions"
-        response = requests.get(
+        response = self.session.get(
             url,
             headers=self.generate_headers(token, **{"Content-type": "application/json"}),
             params=params_dict
@@ -136,7 +298,7 @@ class LedgerServiceClient(MykoboServiceClient):
 
     def get_exception(self, token: Token, id: int):
         url = f"{self.host}/transactions/exceptions/{id}"
-        response = requests.get(
+        response = self.session.get(
             url,
             headers=self.generate_headers(token, **{"Content-type": "application/json"})
         )
@@ -145,7 +307,7 @@ class LedgerServiceClient(MykoboServiceClient):
 
     def add_exception(self, token: Token, exception: AddVerificationException):
         url = f"{self.host}/transactions/exceptions"
-        response = requests.post(
+        response = self.session.post(
             url,
             headers=self.generate_headers(token, **{"Content-type": "application/json"}),
             json=exception.to_dict()
@@ -155,7 +317,7 @@ class LedgerServiceClient(MykoboServiceClient):
 
     def revoke_exception(self, token: Token, exception: RevokeExceptionRequest):
         url = f"{self.host}/transactions/exceptions/{exception.id}/revoke"
-        response = requests.put(
+        response = self.session.put(
             url,
             headers=self.generate_headers(token, **{"Content-type": "application/json"}),
             json=exception.to_dict()
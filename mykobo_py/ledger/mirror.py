@@ -0,0 +1,277 @@
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta, UTC
+from decimal import Decimal
+from itertools import islice
+from logging import Logger
+from typing import Dict, Iterator, List, Optional, Set
+
+from pydantic import BaseModel
+
+from mykobo_py.concurrency import DEFAULT_MAX_WORKERS
+from mykobo_py.identity.models.auth import Token
+from mykobo_py.ledger.ledger import LedgerServiceClient
+from mykobo_py.ledger.models.request import TransactionFilterRequest
+from mykobo_py.ledger.partition import format_ledger_datetime, parse_ledger_datetime
+
+DEFAULT_LOOKBACK = timedelta(days=1)
+DEFAULT_PAGE_SIZE = 500
+DEFAULT_REFRESH_WINDOW = timedelta(days=30)
+DEFAULT_REFRESH_LIMIT = 1000
+
+COLUMNS = (
+    "id", "reference", "external_reference", "source", "transaction_type", "status",
+    "incoming_currency", "outgoing_currency", "payer", "payee",
+    "amount_in", "amount_out", "fee", "created_at", "updated_at",
+)
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS transactions (
+    {", ".join(f"{column} TEXT" + (" PRIMARY KEY" if column == "id" else "") for column in COLUMNS)},
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transactions_reference ON transactions (reference);
+CREATE INDEX IF NOT EXISTS transactions_status ON transactions (status);
+CREATE INDEX IF NOT EXISTS transactions_payer ON transactions (payer, created_at);
+CREATE INDEX IF NOT EXISTS transactions_payee ON transactions (payee, created_at);
+CREATE INDEX IF NOT EXISTS transactions_created_at ON transactions (created_at);
+CREATE TABLE IF NOT EXISTS sync_checkpoints (
+    name TEXT PRIMARY KEY,
+    high_water_mark TEXT,
+    synced_at TEXT NOT NULL,
+    rows INTEGER NOT NULL
+);
+"""
+
+
+class SyncResult(BaseModel):
+    name: str
+    rows: int
+    from_date: Optional[str] = None
+    high_water_mark: Optional[str] = None
+
+
+class LedgerMirror:
+    """
+    Local SQLite copy of ledger transactions kept up to date incrementally.
+
+    Each `sync` walks transaction_list from the last checkpoint and upserts the
+    rows by id, committing page by page. The list endpoint filters on the
+    creation date, so the checkpoint is the latest created_at seen and every
+    sync starts `lookback` before it to pick up rows that arrived late. A row
+    can still change after it was created, so the mirrored rows whose status
+    is not final (has transitions left in the client's status_graph), that
+    were created within `refresh_window` of the checkpoint and that were not
+    in the listing are then fetched again by reference, newest first and at
+    most `refresh_limit` of them. A reference that cannot be fetched is logged
+    and left as it is until the next sync. The checkpoint is only advanced
+    once a sync completes, so an interrupted sync is simply repeated.
+
+    Reads (`get`, `by_reference`, `transactions`, `stats`) only touch the local
+    database.
+    """
+
+    def __init__(
+        self,
+        client: LedgerServiceClient,
+        path: str,
+        logger: Optional[Logger] = None,
+        lookback: timedelta = DEFAULT_LOOKBACK,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        refresh_window: timedelta = DEFAULT_REFRESH_WINDOW,
+        refresh_limit: int = DEFAULT_REFRESH_LIMIT,
+    ):
+        self.client = client
+        self.path = path
+        self.logger = logger or client.logger
+        self.lookback = lookback
+        self.page_size = page_size
+        self.max_workers = max_workers
+        self.refresh_window = refresh_window
+        self.refresh_limit = refresh_limit
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(SCHEMA)
+
+    def sync(self, token: Token, params: Optional[TransactionFilterRequest] = None, name: str = "default") -> SyncResult:
+        """
+        Fetch the transactions changed since the last sync named `name` into the mirror.
+
+        `params` narrows what is mirrored (sources, statuses, ...); its dates and paging are
+        managed by the mirror. Use a different `name` for each distinct filter.
+        """
+        checkpoint = self.checkpoint(name)
+        from_date = None
+        if checkpoint:
+            from_date = format_ledger_datetime(parse_ledger_datetime(checkpoint) - self.lookback)
+
+        params = params or TransactionFilterRequest(
+            sources=[], transaction_types=[], statuses=[], currencies=[], from_date=None,
+            to_date=None, payee=None, payer=None, page=1, limit=self.page_size
+        )
+        params = params.model_copy(update={"from_date": from_date, "to_date": None, "page": 1, "limit": self.page_size})
+
+        high_water_mark = checkpoint
+        rows = 0
+        seen: Set[str] = set()
+        batch: List[dict] = []
+        for transaction in self.client.iter_transactions(token, params):
+            batch.append(transaction)
+            seen.add(transaction.get("id"))
+            created_at = transaction.get("created_at")
+            if created_at and (high_water_mark is None or created_at > high_water_mark):
+                high_water_mark = created_at
+            if len(batch) >= self.page_size:
+                rows += self._upsert(batch)
+                batch = []
+        if batch:
+            rows += self._upsert(batch)
+        if checkpoint:
+            rows += self._refresh_open(token, checkpoint, seen)
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO sync_checkpoints (name, high_water_mark, synced_at, rows) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET high_water_mark = excluded.high_water_mark, "
+                "synced_at = excluded.synced_at, rows = excluded.rows",
+                (name, high_water_mark, datetime.now(UTC).isoformat(), rows),
+            )
+        self.logger.info(f"Mirrored {rows} transactions for {name} from {from_date or 'the beginning'}")
+        return SyncResult(name=name, rows=rows, from_date=from_date, high_water_mark=high_water_mark)
+
+    def checkpoint(self, name: str = "default") -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT high_water_mark FROM sync_checkpoints WHERE name = ?", (name,)
+            ).fetchone()
+        return row["high_water_mark"] if row else None
+
+    def get(self, id: str) -> Optional[dict]:
+        with self._lock:
+            row = self._connection.execute("SELECT data FROM transactions WHERE id = ?", (id,)).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    def by_reference(self, reference: str) -> Optional[dict]:
+        with self._lock:
+            row = self._connection.execute("SELECT data FROM transactions WHERE reference = ?", (reference,)).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    def transactions(
+        self,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+        profile_id: Optional[str] = None,
+        statuses: Optional[List[str]] = None,
+    ) -> Iterator[dict]:
+        where, args = self._where(from_date, to_date, profile_id, statuses)
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT data FROM transactions {where} ORDER BY created_at, id", args
+            ).fetchall()
+        return (json.loads(row["data"]) for row in rows)
+
+    def stats(
+        self,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+        profile_id: Optional[str] = None,
+    ) -> Dict[str, object]:
+        """
+        Counts by status and currency and incoming volume by type (the sum of amount_in, as a
+        Decimal, by transaction type and then incoming currency), computed on the local copy.
+        """
+        where, args = self._where(from_date, to_date, profile_id)
+        with self._lock:
+            total = self._connection.execute(f"SELECT COUNT(*) FROM transactions {where}", args).fetchone()[0]
+            by_status = self._connection.execute(
+                f"SELECT status, COUNT(*) FROM transactions {where} GROUP BY status", args
+            ).fetchall()
+            by_currency = self._connection.execute(
+                f"SELECT incoming_currency, COUNT(*) FROM transactions {where} GROUP BY incoming_currency", args
+            ).fetchall()
+            amounts = self._connection.execute(
+                f"SELECT transaction_type, incoming_currency, amount_in FROM transactions {where}", args
+            ).fetchall()
+        # Amounts are stored as text and summed exactly
+        volume_by_type: Dict[str, Dict[str, Decimal]] = {}
+        for transaction_type, currency, amount in amounts:
+            volume = volume_by_type.setdefault(transaction_type, {})
+            volume[currency] = volume.get(currency, Decimal(0)) + (Decimal(amount) if amount is not None else 0)
+        return {
+            "total": total,
+            "by_status": {row[0]: row[1] for row in by_status},
+            "by_currency": {row[0]: row[1] for row in by_currency},
+            "volume_by_type": volume_by_type,
+        }
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def _refresh_open(self, token: Token, checkpoint: str, seen: Set[str]) -> int:
+        """Fetch the recent mirrored rows in a non-final status that the listing did not return."""
+        transitions = self.client.status_graph.transitions(token)
+        final = [status for status, targets in transitions.items() if not targets]
+        if not final:
+            self.logger.warning("No final transaction statuses are known, not refreshing open transactions")
+            return 0
+        created_after = (parse_ledger_datetime(checkpoint) - self.refresh_window).isoformat(timespec="seconds")
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, reference FROM transactions WHERE reference IS NOT NULL AND created_at >= ? "
+                f"AND (status IS NULL OR status NOT IN ({', '.join('?' for _ in final)})) ORDER BY created_at DESC",
+                [created_after, *final],
+            )
+            references = list(islice((row["reference"] for row in rows if row["id"] not in seen), self.refresh_limit))
+        results = self.client.get_transactions_by_reference(token, references, self.max_workers)
+        transactions = []
+        for reference, result in results.items():
+            if isinstance(result, Exception):
+                self.logger.warning(f"Could not refresh transaction {reference}: {result}")
+            else:
+                transactions.append(result["transaction"])
+        return self._upsert(transactions)
+
+    def _upsert(self, transactions: List[dict]) -> int:
+        values = [
+            tuple(None if transaction.get(column) is None else str(transaction.get(column)) for column in COLUMNS)
+            + (json.dumps(transaction),)
+            for transaction in transactions
+            if transaction.get("id")
+        ]
+        placeholders = ", ".join("?" for _ in range(len(COLUMNS) + 1))
+        updates = ", ".join(f"{column} = excluded.{column}" for column in COLUMNS[1:] + ("data",))
+        with self._lock, self._connection:
+            self._connection.executemany(
+                f"INSERT INTO transactions ({', '.join(COLUMNS)}, data) VALUES ({placeholders}) "
+                f"ON CONFLICT (id) DO UPDATE SET {updates}",
+                values,
+            )
+        return len(values)
+
+    @staticmethod
+    def _where(
+        from_date: Optional[str],
+        to_date: Optional[str],
+        profile_id: Optional[str],
+        statuses: Optional[List[str]] = None,
+    ):
+        clauses, args = [], []
+        if from_date:
+            clauses.append("created_at >= ?")
+            args.append(from_date)
+        if to_date:
+            clauses.append("created_at <= ?")
+            args.append(to_date)
+        if profile_id:
+            clauses.append("(payer = ? OR payee = ?)")
+            args.extend([profile_id, profile_id])
+        if statuses:
+            clauses.append(f"status IN ({', '.join('?' for _ in statuses)})")
+            args.extend(statuses)
+        return ("WHERE " + " AND ".join(clauses)) if clauses else "", args
@@ -0,0 +1,24 @@
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ComplianceGate(BaseModel):
+    model_config = ConfigDict(extra="allow", coerce_numbers_to_str=True)
+
+    code: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return self.model_dump(exclude_none=True)
+
+
+class VerificationErrorCode(BaseModel):
+    model_config = ConfigDict(extra="allow", coerce_numbers_to_str=True)
+
+    code: str
+    description: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return self.model_dump(exclude_none=True)
@@ -0,0 +1,167 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, UTC
+from typing import Callable, Dict, Iterable, Iterator, List, Set, Tuple
+
+from mykobo_py.utils import LEDGER_DATE_TIME_FORMAT
+
+DEFAULT_SLICE_WIDTH = timedelta(days=1)
+DEFAULT_MAX_WORKERS = 4
+# Pages buffered per slice (ordered) or across all slices (unordered) before workers wait
+DEFAULT_BUFFERED_PAGES = 4
+
+_PAGE, _DONE, _ERROR = "page", "done", "error"
+
+
+def parse_ledger_datetime(value: str) -> datetime:
+    """Parse an ISO timestamp as a naive UTC datetime, converting any UTC offset it carries."""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(UTC).replace(tzinfo=None)
+    return parsed
+
+
+def time_slices(from_date: datetime, to_date: datetime, width: timedelta) -> List[Tuple[datetime, datetime]]:
+    """Split [from_date, to_date] into consecutive windows of at most `width`."""
+    if width <= timedelta(0):
+        raise ValueError("slice width must be positive")
+    if to_date < from_date:
+        raise ValueError("to_date must not be before from_date")
+    slices = []
+    start = from_date
+    while True:
+        end = min(start + width, to_date)
+        slices.append((start, end))
+        if end >= to_date:
+            return slices
+        start = end
+
+
+def format_ledger_datetime(value: datetime) -> str:
+    """Format as the ledger's UTC timestamps; aware datetimes are converted to UTC first, naive ones are taken as UTC."""
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC)
+    return value.strftime(LEDGER_DATE_TIME_FORMAT)
+
+
+class PartitionedExport:
+    """
+    Fetches time slices concurrently and merges them into one stream of rows.
+
+    `fetch_slice(start, end)` returns an iterable of rows for one window and is
+    run on a pool of `max_workers` threads. Rows are de-duplicated on their id:
+    slices only overlap at their boundaries, so ids are remembered per slice
+    and dropped once both neighbouring slices have been merged, which keeps
+    memory bounded by a few slices rather than the whole export.
+
+    With `ordered` the rows of each slice are yielded in slice order, otherwise
+    pages are yielded as soon as any worker produces them.
+    """
+
+    def __init__(
+        self,
+        fetch_slice: Callable[[datetime, datetime], Iterable[dict]],
+        slices: List[Tuple[datetime, datetime]],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        ordered: bool = True,
+        page_size: int = 100,
+        buffered_pages: int = DEFAULT_BUFFERED_PAGES,
+        key: Callable[[dict], str] = lambda row: row.get("id"),
+    ):
+        self.fetch_slice = fetch_slice
+        self.slices = slices
+        self.max_workers = max_workers
+        self.ordered = ordered
+        self.page_size = page_size
+        self.buffered_pages = buffered_pages
+        self.key = key
+        self.duplicates = 0
+        self.rows = 0
+
+    def __iter__(self) -> Iterator[dict]:
+        stop = threading.Event()
+        if self.ordered:
+            queues = [queue.Queue(maxsize=self.buffered_pages) for _ in self.slices]
+        else:
+            shared = queue.Queue(maxsize=self.buffered_pages * self.max_workers)
+            queues = [shared] * len(self.slices)
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ledger-export")
+        try:
+            for index, (start, end) in enumerate(self.slices):
+                executor.submit(self._run_slice, index, start, end, queues[index], stop)
+            if self.ordered:
+                messages = (message for q in queues for message in self._drain(q))
+            else:
+                messages = self._drain(shared, expected_done=len(self.slices))
+            yield from self._merge(messages)
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run_slice(self, index: int, start: datetime, end: datetime, out: queue.Queue, stop: threading.Event):
+        try:
+            page = []
+            for row in self.fetch_slice(start, end):
+                if stop.is_set():
+                    return
+                page.append(row)
+                if len(page) >= self.page_size:
+                    self._put(out, (index, _PAGE, page), stop)
+                    page = []
+            if page:
+                self._put(out, (index, _PAGE, page), stop)
+            self._put(out, (index, _DONE, None), stop)
+        except Exception as e:
+            self._put(out, (index, _ERROR, e), stop)
+
+    @staticmethod
+    def _put(out: queue.Queue, message, stop: threading.Event):
+        while not stop.is_set():
+            try:
+                out.put(message, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    @staticmethod
+    def _drain(q: queue.Queue, expected_done: int = 1):
+        done = 0
+        while done < expected_done:
+            message = q.get()
+            if message[1] == _DONE:
+                done += 1
+            yield message
+            if message[1] == _ERROR:
+                return
+
+    def _merge(self, messages) -> Iterator[dict]:
+        seen: Dict[int, Set[str]] = {}
+        finished: Set[int] = set()
+        last = len(self.slices) - 1
+
+        def release(index: int):
+            # A slice's ids are only needed until both of its neighbours have been merged
+            if index in finished and (index == 0 or index - 1 in finished) and (index == last or index + 1 in finished):
+                seen.pop(index, None)
+
+        for index, kind, payload in messages:
+            if kind == _ERROR:
+                raise payload
+            if kind == _DONE:
+                finished.add(index)
+                for neighbour in (index - 1, index, index + 1):
+                    release(neighbour)
+                continue
+
+            ids = seen.setdefault(index, set())
+            for row in payload:
+                row_id = self.key(row)
+                if row_id is not None:
+                    if row_id in ids or row_id in seen.get(index - 1, ()) or row_id in seen.get(index + 1, ()):
+                        self.duplicates += 1
+                        continue
+                    ids.add(row_id)
+                self.rows += 1
+                yield row
@@ -0,0 +1,153 @@
+import threading
+import time
+from logging import Logger
+from typing import Any, Callable, Dict, Generic, List, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+from mykobo_py.identity.models.auth import Token
+from mykobo_py.ledger.models.reference import ComplianceGate, VerificationErrorCode
+
+DEFAULT_REFERENCE_TTL = 3600
+DEFAULT_RETRY_INTERVAL = 30
+
+COMPLIANCE_GATES_KEY = "compliance_gates"
+ERROR_CODES_KEY = "error_codes"
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def _entries(payload: Any, key: str) -> List[dict]:
+    entries = payload.get(key) if isinstance(payload, dict) else None
+    if not isinstance(entries, list):
+        found = list(payload) if isinstance(payload, dict) else type(payload).__name__
+        raise ValueError(f"Expected a list of entries under {key!r} but got {found}")
+    return entries
+
+
+class ReferenceDataset(Generic[M]):
+    """
+    One reference endpoint loaded into memory and indexed by code.
+
+    The endpoint answers with its entries as a list under `items_key`; a
+    response of any other shape, or an entry without a code, fails the load.
+
+    The first call blocks until the data is loaded. Afterwards the data is
+    served from memory; once it is older than `ttl` it keeps being served
+    while a single background refresh runs. If that refresh fails the stale
+    data stays in use and the refresh is retried after `retry_interval`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fetch: Callable[[Token], Any],
+        model: Type[M],
+        items_key: str,
+        logger: Logger,
+        ttl: float = DEFAULT_REFERENCE_TTL,
+        retry_interval: float = DEFAULT_RETRY_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.fetch = fetch
+        self.model = model
+        self.items_key = items_key
+        self.logger = logger
+        self.ttl = ttl
+        self.retry_interval = retry_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._index: Optional[Dict[str, M]] = None
+        self._loaded_at: Optional[float] = None
+        self._next_attempt: Optional[float] = None
+        self._refreshing = False
+
+    def index(self, token: Token) -> Dict[str, M]:
+        """Every entry keyed by its code."""
+        with self._lock:
+            index = self._index
+            now = self._clock()
+            stale = index is not None and now >= self._loaded_at + self.ttl
+            start_refresh = stale and not self._refreshing and (self._next_attempt is None or now >= self._next_attempt)
+            if start_refresh:
+                self._refreshing = True
+        if index is None:
+            return self.refresh(token)
+        if start_refresh:
+            threading.Thread(target=self._refresh_in_background, args=(token,), daemon=True).start()
+        return index
+
+    def get(self, token: Token, code: str) -> Optional[M]:
+        return self.index(token).get(str(code))
+
+    def all(self, token: Token) -> List[M]:
+        return list(self.index(token).values())
+
+    def refresh(self, token: Token) -> Dict[str, M]:
+        """Load the data now, blocking; concurrent callers share one request."""
+        with self._load_lock:
+            with self._lock:
+                if self._index is not None and self._clock() < self._loaded_at + self.ttl:
+                    return self._index
+            entries = _entries(self.fetch(token), self.items_key)
+            index = {}
+            for entry in entries:
+                item = self.model.model_validate(entry)
+                index[item.code] = item
+            with self._lock:
+                self._index = index
+                self._loaded_at = self._clock()
+                self._next_attempt = None
+            self.logger.info(f"Loaded {len(index)} {self.name}")
+            return index
+
+    def invalidate(self):
+        with self._lock:
+            self._index = None
+            self._loaded_at = None
+            self._next_attempt = None
+
+    def _refresh_in_background(self, token: Token):
+        try:
+            self.refresh(token)
+        except Exception as e:
+            self.logger.warning(f"Could not refresh {self.name}, serving stale data: {e}")
+            with self._lock:
+                self._next_attempt = self._clock() + self.retry_interval
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+
+class ReferenceDataCache:
+    """Compliance gates and verification error codes kept in memory with a shared ttl."""
+
+    def __init__(
+        self,
+        fetch_compliance_gates: Callable[[Token], Any],
+        fetch_verification_error_codes: Callable[[Token], Any],
+        logger: Logger,
+        ttl: float = DEFAULT_REFERENCE_TTL,
+        retry_interval: float = DEFAULT_RETRY_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.compliance_gates: ReferenceDataset[ComplianceGate] = ReferenceDataset(
+            "compliance gates", fetch_compliance_gates, ComplianceGate, COMPLIANCE_GATES_KEY,
+            logger, ttl, retry_interval, clock,
+        )
+        self.verification_error_codes: ReferenceDataset[VerificationErrorCode] = ReferenceDataset(
+            "verification error codes", fetch_verification_error_codes, VerificationErrorCode, ERROR_CODES_KEY,
+            logger, ttl, retry_interval, clock,
+        )
+
+    def compliance_gate(self, token: Token, code: str) -> Optional[ComplianceGate]:
+        return self.compliance_gates.get(token, code)
+
+    def verification_error_code(self, token: Token, code: str) -> Optional[VerificationErrorCode]:
+        return self.verification_error_codes.get(token, code)
+
+    def invalidate(self):
+        self.compliance_gates.invalidate()
+        self.verification_error_codes.invalidate()
@@ -0,0 +1,117 @@
+"""
+Per-profile transaction statistics computed locally over Arrow record batches.
+
+Requires pyarrow, installed with the 'arrow' extra.
+"""
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from mykobo_py.ledger.columnar import transactions_to_record_batch
+
+# Partial aggregates held before they are folded into one table
+COMPACT_EVERY = 16
+
+_COUNT = ([], "count_all")
+_SUM_ZERO = pc.ScalarAggregateOptions(min_count=0)
+
+
+def _profile_rows(batch: pa.RecordBatch) -> pa.Table:
+    """One row per (transaction, profile) pair: the payer, and the payee when it is someone else."""
+    columns = ["status", "incoming_currency", "transaction_type", "amount_in"]
+    table = pa.Table.from_batches([batch]).select(["payer", "payee"] + columns)
+    payer = table.select(columns).append_column("profile_id", table.column("payer"))
+    other_payee = pc.fill_null(pc.not_equal(table.column("payee"), table.column("payer")), True)
+    payees = table.filter(other_payee)
+    payee = payees.select(columns).append_column("profile_id", payees.column("payee"))
+    rows = pa.concat_tables([payer, payee])
+    return rows.filter(pc.is_valid(rows.column("profile_id")))
+
+
+class TransactionStatsEngine:
+    """
+    Computes get_transaction_stats style aggregates for many profiles in one pass.
+
+    Pages of transactions are added as they are read from transaction_list;
+    each is converted to a record batch and reduced with grouped, vectorized
+    aggregations into per-profile partial results, so memory grows with the
+    number of profiles rather than the number of transactions. A transaction
+    counts towards both its payer and its payee. Pass `profile_ids` to keep
+    only those profiles.
+    """
+
+    def __init__(self, profile_ids: Optional[Iterable[str]] = None):
+        self.profile_ids = pa.array(sorted(set(profile_ids)), pa.string()) if profile_ids is not None else None
+        self.rows = 0
+        self._by_status: List[pa.Table] = []
+        self._by_currency: List[pa.Table] = []
+        self._volume_by_type: List[pa.Table] = []
+
+    def add_page(self, transactions: Sequence[dict]):
+        if transactions:
+            self.add_batch(transactions_to_record_batch(transactions))
+
+    def add_batch(self, batch: pa.RecordBatch):
+        self.rows += batch.num_rows
+        rows = _profile_rows(batch)
+        if self.profile_ids is not None:
+            rows = rows.filter(pc.is_in(rows.column("profile_id"), value_set=self.profile_ids))
+        if rows.num_rows == 0:
+            return
+
+        self._by_status.append(self._count(rows, "status"))
+        self._by_currency.append(self._count(rows, "incoming_currency"))
+        self._volume_by_type.append(
+            rows.group_by(["profile_id", "transaction_type", "incoming_currency"])
+            .aggregate([("amount_in", "sum", _SUM_ZERO)])
+            .rename_columns(["profile_id", "transaction_type", "incoming_currency", "value"])
+        )
+        if len(self._by_status) >= COMPACT_EVERY:
+            self._compact()
+
+    def result(self) -> Dict[str, Dict[str, object]]:
+        """
+        Stats per profile, in the same shape as LedgerMirror.stats: total, by_status,
+        by_currency and volume_by_type (the sum of amount_in, as a Decimal, by transaction
+        type and then incoming currency).
+        """
+        self._compact()
+        stats: Dict[str, Dict[str, object]] = {}
+
+        def profile(profile_id: str) -> Dict[str, object]:
+            if profile_id not in stats:
+                stats[profile_id] = {"total": 0, "by_status": {}, "by_currency": {}, "volume_by_type": {}}
+            return stats[profile_id]
+
+        for table in self._by_status:
+            for row in table.to_pylist():
+                entry = profile(row["profile_id"])
+                entry["by_status"][row["status"]] = row["value"]
+                entry["total"] += row["value"]
+        for table in self._by_currency:
+            for row in table.to_pylist():
+                profile(row["profile_id"])["by_currency"][row["incoming_currency"]] = row["value"]
+        for table in self._volume_by_type:
+            for row in table.to_pylist():
+                volume = profile(row["profile_id"])["volume_by_type"].setdefault(row["transaction_type"], {})
+                volume[row["incoming_currency"]] = row["value"] or Decimal(0)
+        return stats
+
+    def _compact(self):
+        self._by_status = self._fold(self._by_status, ["status"])
+        self._by_currency = self._fold(self._by_currency, ["incoming_currency"])
+        self._volume_by_type = self._fold(self._volume_by_type, ["transaction_type", "incoming_currency"])
+
+    @staticmethod
+    def _count(rows: pa.Table, column: str) -> pa.Table:
+        return rows.group_by(["profile_id", column]).aggregate([_COUNT]).rename_columns(["profile_id", column, "value"])
+
+    @staticmethod
+    def _fold(partials: List[pa.Table], columns: List[str]) -> List[pa.Table]:
+        if len(partials) <= 1:
+            return partials
+        keys = ["profile_id"] + columns
+        merged = pa.concat_tables(partials).group_by(keys).aggregate([("value", "sum", _SUM_ZERO)])
+        return [merged.rename_columns(keys + ["value"])]
@@ -0,0 +1,86 @@
+import threading
+from logging import Logger
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
+
+from mykobo_py.cache import TTLCache
+from mykobo_py.concurrency import fan_out, DEFAULT_MAX_WORKERS
+from mykobo_py.identity.models.auth import Token
+
+DEFAULT_STATUS_GRAPH_TTL = 300
+
+STATUSES_KEY = "statuses"
+TRANSITIONS_KEY = "transitions"
+
+_GRAPH = "graph"
+
+
+def status_names(payload: Any, key: str) -> List[str]:
+    """
+    Read the status names of a get_transaction_statuses response: {"statuses": [...]} for the
+    list of statuses, {"transitions": [...]} for the transitions of one status.
+    """
+    names = payload.get(key) if isinstance(payload, dict) else None
+    if not isinstance(names, list) or not all(isinstance(name, str) for name in names):
+        found = list(payload) if isinstance(payload, dict) else type(payload).__name__
+        raise ValueError(f"Expected a list of status names under {key!r} but got {found}")
+    return names
+
+
+class TransactionStatusGraph:
+    """
+    In-memory copy of the ledger's transaction status transitions.
+
+    The whole graph is loaded on first use, one get_transaction_statuses call
+    for the list of statuses and one per status for its transitions (run
+    concurrently), and kept for `ttl` seconds as a dict of frozensets, so
+    `can_transition` is a pair of hash lookups. Concurrent callers share a
+    single load; a failed load, including a response of an unexpected shape,
+    is raised and nothing is cached.
+    """
+
+    def __init__(
+        self,
+        fetch_statuses: Callable[[Token, Optional[str]], Any],
+        logger: Logger,
+        ttl: float = DEFAULT_STATUS_GRAPH_TTL,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        self.fetch_statuses = fetch_statuses
+        self.logger = logger
+        self.max_workers = max_workers
+        self._cache = TTLCache(maxsize=1, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def transitions(self, token: Token) -> Dict[str, FrozenSet[str]]:
+        graph = self._cache.get(_GRAPH)
+        if graph is not None:
+            return graph
+        with self._lock:
+            graph = self._cache.get(_GRAPH)
+            if graph is None:
+                graph = self._load(token)
+                self._cache.set(_GRAPH, graph)
+        return graph
+
+    def statuses(self, token: Token) -> FrozenSet[str]:
+        return frozenset(self.transitions(token))
+
+    def allowed(self, token: Token, from_status: str) -> FrozenSet[str]:
+        return self.transitions(token).get(from_status, frozenset())
+
+    def can_transition(self, token: Token, from_status: str, to_status: str) -> bool:
+        return to_status in self.transitions(token).get(from_status, ())
+
+    def invalidate(self):
+        self._cache.clear()
+
+    def _load(self, token: Token) -> Dict[str, FrozenSet[str]]:
+        statuses = status_names(self.fetch_statuses(token, None), STATUSES_KEY)
+        results = fan_out(lambda status: self.fetch_statuses(token, status), statuses, self.max_workers)
+        graph = {}
+        for status, result in results.items():
+            if isinstance(result, Exception):
+                raise result
+            graph[status] = frozenset(status_names(result, TRANSITIONS_KEY))
+        self.logger.info(f"Loaded transitions for {len(graph)} transaction statuses")
+        return graph
@@ -1,10 +1,39 @@
 import os
+import threading
+import time
 
 import boto3
 import logging
-from typing import Optional, Any, Dict, Union
+from typing import Optional, Any, Dict, Iterable, Iterator, List, NamedTuple, Union
 import json
 
+# SendMessageBatch / DeleteMessageBatch limits
+MAX_BATCH_ENTRIES = 10
+MAX_BATCH_BYTES = 256 * 1024
+
+DEFAULT_DELAY_SECONDS = 10
+DEFAULT_BATCH_ATTEMPTS = 3
+DEFAULT_RETRY_BACKOFF = 0.2
+# Long polling: the longest wait SQS allows
+DEFAULT_WAIT_TIME_SECONDS = 20
+DEFAULT_VISIBILITY_TIMEOUT = 30
+
+MESSAGE_ATTRIBUTE_NAMES = [
+    "MYKOBO.SourceSystem",
+    "MYKOBO.Process",
+    "MYKOBO.Token",
+    "MYKOBO.Operation",
+    "MYKOBO.Channel",
+    "MYKOBO.MessageClass"
+]
+
+
+class ReceivedMessage(NamedTuple):
+    receipt_handle: str
+    message: 'MessageBusMessage'
+    message_id: Optional[str] = None
+    receive_count: int = 1
+
 
 class SQS:
     queue_url: Optional[str]
@@ -28,21 +57,111 @@ class SQS:
         Returns:
             SQS response
         """
+        response = self.client.send_message(
+            QueueUrl=f"{self.queue_url}/{target_queue}",
+            DelaySeconds=DEFAULT_DELAY_SECONDS,
+            MessageBody=self._message_body(message)
+        )
+        return response
+
+    def send_messages(
+        self,
+        messages: Iterable[Union['MessageBusMessage', Dict[str, Any]]],
+        target_queue: str,
+        delay_seconds: int = DEFAULT_DELAY_SECONDS,
+        max_attempts: int = DEFAULT_BATCH_ATTEMPTS,
+        retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Send many messages to the SQS queue with SendMessageBatch.
+
+        Messages are packed into batches of at most 10 entries and 256 KB. Entries
+        that fail through no fault of the sender (throttling, service errors) are
+        retried on their own, up to `max_attempts` times in all.
+
+        Args:
+            messages: MessageBusMessage objects or dictionaries to send
+            target_queue: Name of the target queue
+            delay_seconds: DelaySeconds for every message
+            max_attempts: Attempts per entry, including the first
+            retry_backoff: Seconds to wait before a retry, multiplied by the attempt number
+
+        Returns:
+            {"Successful": [...], "Failed": [...]} in the shape of a SendMessageBatch
+            response, where each entry's Id is the position of its message in `messages`
+        """
+        queue_url = f"{self.queue_url}/{target_queue}"
+        successful: List[Dict[str, Any]] = []
+        failed: List[Dict[str, Any]] = []
+
+        pending = []
+        for index, message in enumerate(messages):
+            body = self._message_body(message)
+            if len(body.encode("utf-8")) > MAX_BATCH_BYTES:
+                failed.append({
+                    "Id": str(index), "SenderFault": True, "Code": "MessageTooLong",
+                    "Message": f"Message is larger than {MAX_BATCH_BYTES} bytes",
+                })
+                continue
+            pending.append({"Id": str(index), "MessageBody": body, "DelaySeconds": delay_seconds})
+
+        for attempt in range(1, max_attempts + 1):
+            entries = {entry["Id"]: entry for entry in pending}
+            pending = []
+            for batch in self._batches(list(entries.values())):
+                sent, failures = self._send_batch(queue_url, batch)
+                successful.extend(sent)
+                for failure in failures:
+                    if failure.get("SenderFault") or attempt == max_attempts or failure.get("Id") not in entries:
+                        failed.append(failure)
+                    else:
+                        pending.append(entries[failure["Id"]])
+            if not pending:
+                break
+            self.logger.warning(f"Retrying {len(pending)} messages to {target_queue}")
+            time.sleep(retry_backoff * attempt)
+
+        if failed:
+            self.logger.error(f"Failed to send {len(failed)} messages to {target_queue}")
+        return {
+            "Successful": sorted(successful, key=lambda entry: int(entry["Id"])),
+            "Failed": sorted(failed, key=lambda entry: int(entry["Id"])),
+        }
+
+    @staticmethod
+    def _message_body(message: Union['MessageBusMessage', Dict[str, Any]]) -> str:
         # Import here to avoid circular dependency
         from mykobo_py.message_bus.models import MessageBusMessage
 
         # Convert MessageBusMessage to dict if needed
         if isinstance(message, MessageBusMessage):
-            message_body = message.to_json()
-        else:
-            message_body = json.dumps(message)
+            return message.to_json()
+        return json.dumps(message)
 
-        response = self.client.send_message(
-            QueueUrl=f"{self.queue_url}/{target_queue}",
-            DelaySeconds=10,
-            MessageBody=message_body
-        )
-        return response
+    @staticmethod
+    def _batches(entries: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        batches, batch, size = [], [], 0
+        for entry in entries:
+            entry_size = len(entry["MessageBody"].encode("utf-8"))
+            if batch and (len(batch) == MAX_BATCH_ENTRIES or size + entry_size > MAX_BATCH_BYTES):
+                batches.append(batch)
+                batch, size = [], 0
+            batch.append(entry)
+            size += entry_size
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _send_batch(self, queue_url: str, batch: List[Dict[str, Any]]):
+        try:
+            response = self.client.send_message_batch(QueueUrl=queue_url, Entries=batch)
+        except Exception as e:
+            self.logger.error(f"Could not send message batch: {e}")
+            return [], [
+                {"Id": entry["Id"], "SenderFault": False, "Code": type(e).__name__, "Message": str(e)}
+                for entry in batch
+            ]
+        return response.get("Successful", []), response.get("Failed", [])
 
     def delete_message(self, target_queue: str, receipt_handle: str):
         self.client.delete_message(
@@ -50,6 +169,62 @@ class SQS:
             ReceiptHandle=receipt_handle
         )
 
+    def delete_messages(self, target_queue: str, receipt_handles: Iterable[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Delete many messages with DeleteMessageBatch, 10 receipt handles per call.
+
+        Returns:
+            {"Successful": [...], "Failed": [...]} in the shape of a DeleteMessageBatch
+            response, where each entry's Id is the position of its receipt handle and
+            failed entries also carry their ReceiptHandle
+        """
+        result = self._receipt_batches(self.client.delete_message_batch, target_queue, receipt_handles)
+        if result["Failed"]:
+            self.logger.error(f"Failed to delete {len(result['Failed'])} messages from {target_queue}")
+        return result
+
+    def change_message_visibility_batch(
+        self,
+        target_queue: str,
+        receipt_handles: Iterable[str],
+        visibility_timeout: int,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Set the visibility timeout of many messages with ChangeMessageVisibilityBatch,
+        10 receipt handles per call. The result has the same shape as delete_messages.
+        """
+        result = self._receipt_batches(
+            self.client.change_message_visibility_batch, target_queue, receipt_handles,
+            VisibilityTimeout=visibility_timeout,
+        )
+        if result["Failed"]:
+            self.logger.warning(f"Failed to change visibility of {len(result['Failed'])} messages on {target_queue}")
+        return result
+
+    def _receipt_batches(self, call, target_queue: str, receipt_handles: Iterable[str], **entry_fields):
+        queue_url = f"{self.queue_url}/{target_queue}"
+        entries = [
+            {"Id": str(index), "ReceiptHandle": handle, **entry_fields}
+            for index, handle in enumerate(receipt_handles)
+        ]
+        handles = {entry["Id"]: entry["ReceiptHandle"] for entry in entries}
+        successful: List[Dict[str, Any]] = []
+        failed: List[Dict[str, Any]] = []
+
+        for start in range(0, len(entries), MAX_BATCH_ENTRIES):
+            batch = entries[start:start + MAX_BATCH_ENTRIES]
+            try:
+                response = call(QueueUrl=queue_url, Entries=batch)
+            except Exception as e:
+                self.logger.error(f"Batch request to {target_queue} failed: {e}")
+                response = {"Failed": [
+                    {"Id": entry["Id"], "SenderFault": False, "Code": type(e).__name__, "Message": str(e)}
+                    for entry in batch
+                ]}
+            successful.extend(response.get("Successful", []))
+            failed.extend(dict(failure, ReceiptHandle=handles.get(failure.get("Id"))) for failure in response.get("Failed", []))
+        return {"Successful": successful, "Failed": failed}
+
     def receive_message(self, target_queue: str) -> Optional[Dict[str, Any]]:
         try:
             msg = self.client.receive_message(
@@ -58,14 +233,7 @@ class SQS:
                     "SentTimestamp",
                 ],
                 MaxNumberOfMessages=1,
-                MessageAttributeNames=[
-                    "MYKOBO.SourceSystem",
-                    "MYKOBO.Process",
-                    "MYKOBO.Token",
-                    "MYKOBO.Operation",
-                    "MYKOBO.Channel",
-                    "MYKOBO.MessageClass"
-                ],
+                MessageAttributeNames=MESSAGE_ATTRIBUTE_NAMES,
                 VisibilityTimeout=0,
                 WaitTimeSeconds=0,
             )
@@ -75,3 +243,73 @@ class SQS:
             self.logger.error(f"Could not process message, key not found: {e}")
         except Exception as e:
             self.logger.error(f"Could not process message {e}")
+
+    def receive_messages(
+        self,
+        target_queue: str,
+        max_messages: int = MAX_BATCH_ENTRIES,
+        wait_time_seconds: int = DEFAULT_WAIT_TIME_SECONDS,
+        visibility_timeout: int = DEFAULT_VISIBILITY_TIMEOUT,
+    ) -> List[ReceivedMessage]:
+        """
+        Receive up to `max_messages` (at most 10) messages in one call, parsed as MessageBusMessages.
+
+        Waits up to `wait_time_seconds` for messages to arrive (long polling) and hides
+        them from other consumers for `visibility_timeout` seconds. Bodies that are not
+        valid MessageBusMessages are logged and skipped; they become visible again once
+        their visibility timeout expires, so a redrive policy can move them aside.
+        """
+        # Import here to avoid circular dependency
+        from mykobo_py.message_bus.models import MessageBusMessage
+
+        response = self.client.receive_message(
+            QueueUrl=f"{self.queue_url}/{target_queue}",
+            AttributeNames=[
+                "SentTimestamp",
+                "ApproximateReceiveCount",
+            ],
+            MaxNumberOfMessages=max(1, min(max_messages, MAX_BATCH_ENTRIES)),
+            MessageAttributeNames=MESSAGE_ATTRIBUTE_NAMES,
+            VisibilityTimeout=visibility_timeout,
+            WaitTimeSeconds=wait_time_seconds,
+        )
+
+        received = []
+        for msg in response.get("Messages", []) if response else []:
+            try:
+                received.append(ReceivedMessage(
+                    receipt_handle=msg["ReceiptHandle"],
+                    message=MessageBusMessage.from_json(msg["Body"]),
+                    message_id=msg.get("MessageId"),
+                    receive_count=int(msg.get("Attributes", {}).get("ApproximateReceiveCount", 1)),
+                ))
+            except Exception as e:
+                self.logger.error(f"Could not parse message {msg.get('MessageId')}: {e}")
+        return received
+
+    def iter_messages(
+        self,
+        target_queue: str,
+        max_messages: int = MAX_BATCH_ENTRIES,
+        wait_time_seconds: int = DEFAULT_WAIT_TIME_SECONDS,
+        visibility_timeout: int = DEFAULT_VISIBILITY_TIMEOUT,
+        stop: Optional[threading.Event] = None,
+        error_backoff: float = 1.0,
+    ) -> Iterator[ReceivedMessage]:
+        """
+        Yield messages from the queue as they arrive until `stop` is set.
+
+        Each receive long polls for up to `wait_time_seconds`, so an idle queue costs one
+        call every `wait_time_seconds` rather than a busy loop. Failed receives are logged
+        and retried after `error_backoff` seconds. The caller deletes each message once it
+        has been handled.
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            try:
+                batch = self.receive_messages(target_queue, max_messages, wait_time_seconds, visibility_timeout)
+            except Exception as e:
+                self.logger.error(f"Could not receive messages from {target_queue}: {e}")
+                stop.wait(error_backoff)
+                continue
+            yield from batch
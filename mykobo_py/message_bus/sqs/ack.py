@@ -0,0 +1,121 @@
+import threading
+import time
+from logging import Logger
+from typing import Any, Callable, Dict, List, Optional
+
+from mykobo_py.message_bus.sqs.SQS import SQS, MAX_BATCH_ENTRIES
+
+DEFAULT_FLUSH_INTERVAL = 0.5
+
+
+class AckBuffer:
+    """
+    Collects receipt handles and deletes them with DeleteMessageBatch.
+
+    A batch is deleted as soon as `max_batch_size` (at most 10) handles are
+    pending, or `flush_interval` seconds after the oldest pending handle
+    was added, by a background thread. `close` deletes whatever is left.
+
+    Deletes that fail are logged, counted in `failed` and passed to
+    `on_failure(receipt_handle, failure)`; their messages become visible
+    again after the visibility timeout and are delivered once more. An
+    exception raised by `on_failure` is logged and does not stop the buffer.
+    """
+
+    def __init__(
+        self,
+        sqs: SQS,
+        target_queue: str,
+        max_batch_size: int = MAX_BATCH_ENTRIES,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        on_failure: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+        logger: Optional[Logger] = None,
+    ):
+        self.sqs = sqs
+        self.target_queue = target_queue
+        self.max_batch_size = max(1, min(max_batch_size, MAX_BATCH_ENTRIES))
+        self.flush_interval = flush_interval
+        self.on_failure = on_failure
+        self.logger = logger or sqs.logger
+        self.acked = 0
+        self.failed = 0
+        self._pending: List[str] = []
+        self._oldest: Optional[float] = None
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="sqs-ack-buffer", daemon=True)
+        self._thread.start()
+
+    def ack(self, receipt_handle: str):
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("AckBuffer is closed")
+            self._pending.append(receipt_handle)
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+                self._condition.notify()
+            batch = self._take() if len(self._pending) >= self.max_batch_size else None
+        if batch:
+            self._delete(batch)
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """Delete every pending handle now and return the entries that failed."""
+        with self._condition:
+            batch = self._take()
+        return self._delete(batch) if batch else []
+
+    def close(self) -> List[Dict[str, Any]]:
+        """Stop the background thread and flush what is pending."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        return self.flush()
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._pending)
+
+    def __enter__(self) -> 'AckBuffer':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _take(self) -> List[str]:
+        batch, self._pending, self._oldest = self._pending, [], None
+        return batch
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if self._oldest is None:
+                        self._condition.wait()
+                        continue
+                    remaining = self._oldest + self.flush_interval - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                if self._closed:
+                    return
+                batch = self._take()
+            self._delete(batch)
+
+    def _delete(self, batch: List[str]) -> List[Dict[str, Any]]:
+        failed = []
+        for start in range(0, len(batch), self.max_batch_size):
+            chunk = batch[start:start + self.max_batch_size]
+            result = self.sqs.delete_messages(self.target_queue, chunk)
+            failed.extend(result["Failed"])
+            with self._condition:
+                self.acked += len(chunk) - len(result["Failed"])
+                self.failed += len(result["Failed"])
+        for failure in failed:
+            self.logger.warning(f"Could not acknowledge message on {self.target_queue}: {failure.get('Code')} {failure.get('Message')}")
+            if self.on_failure is not None:
+                try:
+                    self.on_failure(failure.get("ReceiptHandle"), failure)
+                except Exception:
+                    self.logger.exception(f"on_failure raised for a message on {self.target_queue}")
+        return failed
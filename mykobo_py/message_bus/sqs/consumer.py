@@ -0,0 +1,189 @@
+import queue
+import threading
+import time
+from logging import Logger
+from typing import Callable, Dict, List, Optional
+
+from mykobo_py.message_bus.models import MessageBusMessage
+from mykobo_py.message_bus.sqs.SQS import SQS, ReceivedMessage, MAX_BATCH_ENTRIES, DEFAULT_WAIT_TIME_SECONDS, \
+    DEFAULT_VISIBILITY_TIMEOUT
+from mykobo_py.message_bus.sqs.ack import AckBuffer, DEFAULT_FLUSH_INTERVAL
+
+DEFAULT_POLLERS = 1
+DEFAULT_WORKERS = 4
+
+
+class SqsConsumer:
+    """
+    Receives messages from an SQS queue and hands them to `handler` on a pool of threads.
+
+    `pollers` threads long poll the queue and put messages on a bounded
+    queue of `queue_size`; `workers` threads take them off and call
+    `handler(message)`. When the workers fall behind the pollers block,
+    so no more messages are received than can be processed.
+
+    Every message is kept invisible from the moment it is received until
+    it has been handled: a heartbeat thread extends the visibility of
+    messages held longer than `heartbeat_interval` back to
+    `visibility_timeout`. Messages whose handler returns are acknowledged
+    through an AckBuffer; when the handler raises the message is left on
+    the queue and is delivered again once its visibility timeout expires.
+
+        consumer = SqsConsumer(sqs, "payment-queue", handle_payment, workers=8)
+        consumer.start()
+        ...
+        consumer.stop()
+    """
+
+    def __init__(
+        self,
+        sqs: SQS,
+        target_queue: str,
+        handler: Callable[[MessageBusMessage], None],
+        pollers: int = DEFAULT_POLLERS,
+        workers: int = DEFAULT_WORKERS,
+        queue_size: Optional[int] = None,
+        wait_time_seconds: int = DEFAULT_WAIT_TIME_SECONDS,
+        visibility_timeout: int = DEFAULT_VISIBILITY_TIMEOUT,
+        heartbeat_interval: Optional[float] = None,
+        ack_flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        error_backoff: float = 1.0,
+        logger: Optional[Logger] = None,
+    ):
+        self.sqs = sqs
+        self.target_queue = target_queue
+        self.handler = handler
+        self.pollers = pollers
+        self.workers = workers
+        self.wait_time_seconds = wait_time_seconds
+        self.visibility_timeout = visibility_timeout
+        self.heartbeat_interval = heartbeat_interval or visibility_timeout / 3
+        self.ack_flush_interval = ack_flush_interval
+        self.error_backoff = error_backoff
+        self.logger = logger or sqs.logger
+        self.processed = 0
+        self.failed = 0
+        self._queue: "queue.Queue[Optional[ReceivedMessage]]" = queue.Queue(maxsize=queue_size or workers * MAX_BATCH_ENTRIES)
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+        # Receipt handles of messages received but not yet handled, with when their visibility was last set
+        self._in_flight: Dict[str, float] = {}
+        self._threads: List[threading.Thread] = []
+        self._poller_threads: List[threading.Thread] = []
+        self._heartbeat_thread: Optional[threading.Thread] = None
+        self._acks: Optional[AckBuffer] = None
+
+    def start(self) -> 'SqsConsumer':
+        if self._threads:
+            raise RuntimeError("Consumer already started")
+        self._stopping.clear()
+        self._acks = AckBuffer(self.sqs, self.target_queue, flush_interval=self.ack_flush_interval, logger=self.logger)
+        self._poller_threads = [
+            threading.Thread(target=self._poll, name=f"sqs-poller-{n}", daemon=True) for n in range(self.pollers)
+        ]
+        workers = [threading.Thread(target=self._work, name=f"sqs-worker-{n}", daemon=True) for n in range(self.workers)]
+        self._heartbeat_thread = threading.Thread(target=self._heartbeat, name="sqs-heartbeat", daemon=True)
+        self._threads = self._poller_threads + workers + [self._heartbeat_thread]
+        for thread in self._threads:
+            thread.start()
+        self.logger.info(f"Consuming {self.target_queue} with {self.pollers} pollers and {self.workers} workers")
+        return self
+
+    def stop(self):
+        """
+        Stop receiving, finish the messages already received and flush their acknowledgements.
+
+        Pollers finish their current receive first, which can take up to `wait_time_seconds`.
+        """
+        if not self._threads:
+            return
+        self._stopping.set()
+        for thread in self._poller_threads:
+            thread.join()
+        for _ in range(self.workers):
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._acks.close()
+        self._threads = []
+        self.logger.info(f"Stopped consuming {self.target_queue}: {self.processed} processed, {self.failed} failed")
+
+    def run(self, stop: threading.Event):
+        """Consume until `stop` is set, then stop cleanly."""
+        self.start()
+        try:
+            stop.wait()
+        finally:
+            self.stop()
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._in_flight)
+
+    def __enter__(self) -> 'SqsConsumer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _poll(self):
+        while not self._stopping.is_set():
+            try:
+                received = self.sqs.receive_messages(
+                    self.target_queue,
+                    wait_time_seconds=self.wait_time_seconds,
+                    visibility_timeout=self.visibility_timeout,
+                )
+            except Exception as e:
+                self.logger.error(f"Could not receive messages from {self.target_queue}: {e}")
+                self._stopping.wait(self.error_backoff)
+                continue
+
+            now = time.monotonic()
+            with self._lock:
+                for item in received:
+                    self._in_flight[item.receipt_handle] = now
+            for item in received:
+                # Blocks while the workers are behind; the heartbeat keeps waiting messages invisible
+                self._queue.put(item)
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            try:
+                self.handler(item.message)
+            except Exception as e:
+                self.logger.error(f"Handler failed for message {item.message_id} on {self.target_queue}: {e}")
+                with self._lock:
+                    self._in_flight.pop(item.receipt_handle, None)
+                    self.failed += 1
+                continue
+
+            with self._lock:
+                self._in_flight.pop(item.receipt_handle, None)
+                self.processed += 1
+            self._acks.ack(item.receipt_handle)
+
+    def _heartbeat(self):
+        while not self._stopping.wait(self.heartbeat_interval / 2):
+            self._extend_visibility()
+        # Keep extending while the workers finish what was already received
+        while any(thread.is_alive() for thread in self._threads if thread is not self._heartbeat_thread):
+            self._extend_visibility()
+            time.sleep(min(self.heartbeat_interval / 2, 0.1))
+
+    def _extend_visibility(self):
+        now = time.monotonic()
+        with self._lock:
+            due = [handle for handle, extended_at in self._in_flight.items() if now - extended_at >= self.heartbeat_interval]
+        if not due:
+            return
+        result = self.sqs.change_message_visibility_batch(self.target_queue, due, self.visibility_timeout)
+        failed = {failure.get("ReceiptHandle") for failure in result["Failed"]}
+        with self._lock:
+            for handle in due:
+                if handle not in failed and handle in self._in_flight:
+                    self._in_flight[handle] = now
@@ -0,0 +1,109 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Generic, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def extract_items(page: Any, key: Optional[str]) -> List[Any]:
+    """Return the items of a page: the page itself if it is a list, else its `key` entry."""
+    if page is None:
+        return []
+    if isinstance(page, list):
+        return page
+    if key is not None and isinstance(page, dict) and key in page:
+        return page[key] or []
+    found = list(page) if isinstance(page, dict) else type(page).__name__
+    raise ValueError(f"Could not find items in page, expected {key!r} but got {found}")
+
+
+def extract_total(page: Any, key: Optional[str]) -> Optional[int]:
+    if key is not None and isinstance(page, dict) and isinstance(page.get(key), int):
+        return page[key]
+    return None
+
+
+class PageIterator(Generic[T]):
+    """
+    Lazily iterates the items of a paginated endpoint.
+
+    Only the page being consumed and, with `prefetch`, the next one are held
+    in memory, so memory stays flat however many pages there are. With
+    `prefetch` the next page is requested on a background thread as soon as
+    the current one arrives. Each page is either a list of items or a dict
+    holding them under `items_key`; any other shape raises ValueError rather
+    than being mistaken for the last page. Iteration stops on an empty or
+    short page, or, when the endpoint reports one under `total_key`, once that
+    grand total has been reached.
+
+    Progress is available while iterating through `pages_fetched`,
+    `items_yielded` and `total`; `on_page` is called after each page arrives.
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[int], Any],
+        limit: int,
+        items_key: Optional[str],
+        total_key: Optional[str] = None,
+        parse: Optional[Callable[[Any], T]] = None,
+        first_page: int = 1,
+        prefetch: bool = True,
+        on_page: Optional[Callable[['PageIterator[T]'], None]] = None,
+    ):
+        self.fetch_page = fetch_page
+        self.limit = limit
+        self.items_key = items_key
+        self.total_key = total_key
+        self.parse = parse
+        self.first_page = first_page
+        self.prefetch = prefetch
+        self.on_page = on_page
+        self.pages_fetched = 0
+        self.items_yielded = 0
+        self.total: Optional[int] = None
+        self.current_page: Optional[int] = None
+        self.finished = False
+
+    def __iter__(self) -> Iterator[T]:
+        for items in self.pages():
+            for item in items:
+                self.items_yielded += 1
+                yield self.parse(item) if self.parse else item
+
+    def pages(self) -> Iterator[List[Any]]:
+        """Iterate the raw items of each page, unparsed, instead of item by item."""
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="page-prefetch") if self.prefetch else None
+        try:
+            page_number = self.first_page
+            pending: Optional[Future] = None
+            page = self.fetch_page(page_number)
+            seen = 0
+            while True:
+                items = extract_items(page, self.items_key)
+                self.current_page = page_number
+                self.pages_fetched += 1
+                total = extract_total(page, self.total_key)
+                if total is not None:
+                    self.total = total
+                page = None
+
+                seen += len(items)
+                last = len(items) == 0 or len(items) < self.limit or (self.total is not None and seen >= self.total)
+                if not last and executor is not None:
+                    pending = executor.submit(self.fetch_page, page_number + 1)
+                if self.on_page is not None:
+                    self.on_page(self)
+
+                yield items
+
+                if last:
+                    self.finished = True
+                    return
+                page_number += 1
+                if pending is not None:
+                    page, pending = pending.result(), None
+                else:
+                    page = self.fetch_page(page_number)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
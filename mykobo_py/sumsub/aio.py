@@ -0,0 +1,40 @@
+import json
+from typing import Optional
+
+import httpx
+from httpx import Response
+
+from mykobo_py.async_client import AsyncMykoboServiceClient
+from mykobo_py.identity.models.auth import Token
+from mykobo_py.sumsub.models.requests import AccessTokenRequest, NewApplicantRequest, NewDocumentRequest
+
+
+class AsyncSumsubServiceClient(AsyncMykoboServiceClient):
+    def __init__(self, host, logger, http_client: Optional[httpx.AsyncClient] = None):
+        super().__init__(logger, host, http_client)
+
+    async def get_access_token(self, token: Token, request: AccessTokenRequest) -> Response:
+        return await self._post(token, f"{self.host}/access_token", request.to_dict())
+
+    async def get_applicant(self, token: Token, profile_id: str) -> Response:
+        response = await self.http_client.get(
+            f"{self.host}/get_applicant/{profile_id}",
+            headers=self.generate_headers(token, **{"Content-type": "application/json"}),
+        )
+        response.raise_for_status()
+        return response
+
+    async def create_applicant(self, token: Token, applicant_request: NewApplicantRequest) -> Response:
+        return await self._post(token, f"{self.host}/create_applicant", applicant_request.to_dict())
+
+    async def submit_document(self, token: Token, new_document_request: NewDocumentRequest) -> Response:
+        return await self._post(token, f"{self.host}/add_document", new_document_request.to_dict())
+
+    async def _post(self, token: Token, url: str, data: dict) -> Response:
+        response = await self.http_client.post(
+            url,
+            headers=self.generate_headers(token, **{"Content-type": "application/json"}),
+            content=json.dumps(data)
+        )
+        response.raise_for_status()
+        return response
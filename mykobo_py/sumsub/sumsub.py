@@ -1,3 +1,5 @@
+from typing import Optional
+
 import requests
 import json
 from requests.models import Response
@@ -6,12 +8,12 @@ from mykobo_py.identity.models.auth import Token
 from mykobo_py.sumsub.models.requests import AccessTokenRequest, NewApplicantRequest, NewDocumentRequest
 
 class SumsubServiceClient(MykoboServiceClient):
-    def __init__(self, host, logger):
-        super().__init__(logger, host)
+    def __init__(self, host, logger, session: Optional[requests.Session] = None):
+        super().__init__(logger, host, session)
 
     def get_access_token(self, token: Token, request: AccessTokenRequest) -> Response:
         url = f"{self.host}/access_token"
-        response = requests.post(
+        response = self.session.post(
             url,
             headers=self.generate_headers(token, **{"Content-type": "application/json"}),
             data=json.dumps(request.to_dict())
@@ -21,7 +23,7 @@ class SumsubServiceClient(MykoboServiceClient):
 
     def get_applicant(self, token: Token, profile_id: str) -> Response:
         url = f"{self.host}/get_applicant/{profile_id}"
-        response = requests.get(
+        response = self.session.get(
             url,
             headers=self.generate_headers(token, **{"Content-type": "application/json"}),
         )
@@ -30,7 +32,7 @@ class SumsubServiceClient(MykoboServiceClient):
 
     def create_applicant(self, token: Token,  applicant_request: NewApplicantRequest) -> Response:
         url = f"{self.host}/create_applicant"
-        response = requests.post(
+        response = self.session.post(
             url,
             headers=self.generate_headers(token, **{"Content-type": "application/json"}),
             data=json.dumps(applicant_request.to_dict())
@@ -40,7 +42,7 @@ class SumsubServiceClient(MykoboServiceClient):
 
     def submit_document(self, token: Token, new_document_request: NewDocumentRequest) -> Response:
         url = f"{self.host}/add_document"
-        response = requests.post(
+        response = self.session.post(
             url,
             headers=self.generate_headers(token, **{"Content-type": "application/json"}),
             data=json.dumps(new_document_request.to_dict())
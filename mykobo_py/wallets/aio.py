@@ -0,0 +1,44 @@
+from logging import Logger
+from typing import Optional
+
+import httpx
+from httpx import Response
+
+from mykobo_py.async_client import AsyncMykoboServiceClient
+from mykobo_py.identity.models.auth import Token
+from .models.request import RegisterWalletRequest
+
+
+class AsyncWalletServiceClient(AsyncMykoboServiceClient):
+    def __init__(self, wallet_service_url: str, logger: Logger, http_client: Optional[httpx.AsyncClient] = None):
+        super().__init__(logger, wallet_service_url, http_client)
+        self.wallet_service_url = wallet_service_url
+
+    async def get_wallet_profile(self, token: Token, account: str, memo: Optional[str] = None) -> Response:
+        params = {}
+        if memo is not None:
+            params["memo"] = memo
+        response = await self.http_client.get(
+            f"{self.wallet_service_url}/user/wallet/{account}",
+            headers=self.generate_headers(token, **{"Content-type": "application/json"}),
+            params=params,
+        )
+        response.raise_for_status()
+        return response
+
+    async def register_wallet(self, token: Token, request: RegisterWalletRequest) -> Response:
+        response = await self.http_client.post(
+            f"{self.wallet_service_url}/wallet/register",
+            headers=self.generate_headers(token, **{"Content-type": "application/json"}),
+            content=request.model_dump_json(exclude_none=True)
+        )
+        response.raise_for_status()
+        return response
+
+    async def get_user_wallets(self, token: Token, profile: str) -> Response:
+        response = await self.http_client.get(
+            f"{self.wallet_service_url}/wallet/user/{profile}",
+            headers=self.generate_headers(token, **{"Content-type": "application/json"}),
+        )
+        response.raise_for_status()
+        return response
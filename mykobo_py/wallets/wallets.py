@@ -9,15 +9,15 @@ from mykobo_py.identity.models.auth import Token
 from logging import Logger
 
 class WalletServiceClient(MykoboServiceClient):
-    def __init__(self, wallet_service_url: str, logger: Logger):
-        super().__init__(logger, wallet_service_url)
+    def __init__(self, wallet_service_url: str, logger: Logger, session: Optional[requests.Session] = None):
+        super().__init__(logger, wallet_service_url, session)
         self.wallet_service_url = wallet_service_url
 
     def get_wallet_profile(self, token: Token, account: str, memo: Optional[str] = None) -> Response:
         url = f"{self.wallet_service_url}/user/wallet/{account}"
         if memo is not None:
             url += f"?memo={memo}"
-        response = requests.get(
+        response = self.session.get(
             url,
             headers=self.generate_headers(token, **{"Content-type": "application/json"}),
         )
@@ -25,7 +25,7 @@ class WalletServiceClient(MykoboServiceClient):
         return response
 
     def register_wallet(self, token: Token, request: RegisterWalletRequest) -> Response:
-        response = requests.post(
+        response = self.session.post(
             f"{self.wallet_service_url}/wallet/register",
             headers=self.generate_headers(token, **{"Content-type": "application/json"}),
             data=request.model_dump_json(exclude_none=True)
@@ -34,7 +34,7 @@ class WalletServiceClient(MykoboServiceClient):
         return response
 
     def get_user_wallets(self, token: Token, profile: str) -> Response:
-        response = requests.get(
+        response = self.session.get(
             f"{self.wallet_service_url}/wallet/user/{profile}",
             headers=self.generate_headers(token, **{"Content-type": "application/json"}),
         )
@@ -0,0 +1,167 @@
+import asyncio
+import datetime
+import json
+import logging
+
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import httpx
+
+from mykobo_py.async_client import AsyncMykoboServiceClient, build_async_client
+from mykobo_py.anchor.dapp.aio import AsyncDappAnchorClient
+from mykobo_py.identity.aio import AsyncIdentityServiceClient
+from mykobo_py.identity.models.auth import Token
+from mykobo_py.identity.models.request import UpdateProfileRequest
+from mykobo_py.identity.models.response import UserProfile
+from mykobo_py.ledger.aio import AsyncLedgerServiceClient
+from mykobo_py.ledger.models.request import TransactionFilterRequest
+
+logger = logging.getLogger("test")
+host = "http://fallback"
+test_token = Token(
+    subject_id="urn:usrp:fb497b2fcbfa479991de4e8b0abecad6",
+    token="test_token",
+    refresh_token="test_token",
+    expires_at=datetime.datetime.now() + datetime.timedelta(days=30)
+)
+
+
+def mock_client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_acquire_token():
+    with open("tests/stubs/authenticate_success.json") as f:
+        json_data = json.loads(f.read())
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/authenticate"
+        return httpx.Response(200, json=json_data)
+
+    async def run():
+        client = AsyncIdentityServiceClient(host, logger, http_client=mock_client(handler))
+        return await client.acquire_token()
+
+    token = asyncio.run(run())
+    assert token.subject_id == "urn:svc:94fc474ee7144ed181855d63f0a2bcad"
+
+
+def test_get_user_profiles_concurrently():
+    with open("tests/stubs/customer_kyc_complete.json") as f:
+        json_data = json.loads(f.read())
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        assert request.headers["Authorization"] == "Bearer test_token"
+        return httpx.Response(200, json=json_data)
+
+    async def run():
+        client = AsyncIdentityServiceClient(host, logger, http_client=mock_client(handler))
+        responses = await asyncio.gather(*[client.get_user_profile(test_token, f"urn:usrp:{i}") for i in range(50)])
+        return [UserProfile.model_validate(r.json()) for r in responses]
+
+    profiles = asyncio.run(run())
+    assert len(profiles) == 50
+    assert len(seen) == 50
+
+
+def test_update_user_profile_sends_patch():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.method == "PATCH"
+        assert request.url.path == "/user/profile/update/urn:usrp:1"
+        assert json.loads(request.content) == {"tax_id": "123"}
+        return httpx.Response(200, json={})
+
+    async def run():
+        client = AsyncIdentityServiceClient(host, logger, http_client=mock_client(handler))
+        return await client.update_user_profile(test_token, "urn:usrp:1", UpdateProfileRequest(tax_id="123"))
+
+    assert asyncio.run(run()).status_code == 200
+
+
+def test_transaction_list_returns_empty_on_http_error():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(500, json={"error": "boom"})
+
+    async def run():
+        client = AsyncLedgerServiceClient(host, logger, http_client=mock_client(handler))
+        filters = TransactionFilterRequest(
+            sources=[], transaction_types=[], statuses=[], currencies=[], from_date=None,
+            to_date=None, payee=None, payer=None, page=1, limit=10
+        )
+        return await client.transaction_list(test_token, filters)
+
+    assert asyncio.run(run()) == {}
+
+
+def test_get_transaction_stats_query_params():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["from"] == "2025-01-01"
+        assert request.url.params["profile_id"] == "urn:usrp:1"
+        assert "to" not in request.url.params
+        return httpx.Response(200, json={"total": 1})
+
+    async def run():
+        client = AsyncLedgerServiceClient(host, logger, http_client=mock_client(handler))
+        return await client.get_transaction_stats(test_token, None, "2025-01-01", "urn:usrp:1")
+
+    assert asyncio.run(run()) == {"total": 1}
+
+
+def test_dapp_get_transaction_failure_returns_none():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, text="not found")
+
+    async def run():
+        client = AsyncDappAnchorClient(host, logger, http_client=mock_client(handler))
+        return await client.get_transaction(test_token, "missing")
+
+    assert asyncio.run(run()) is None
+
+
+def test_shared_client_is_per_event_loop():
+    async def run():
+        first = AsyncIdentityServiceClient(host, logger).http_client
+        second = AsyncLedgerServiceClient(host, logger).http_client
+        assert first is second
+        await AsyncMykoboServiceClient.aclose_transport()
+        return first
+
+    first_loop_client = asyncio.run(run())
+    second_loop_client = asyncio.run(run())
+    assert first_loop_client is not second_loop_client
+    assert first_loop_client.is_closed
+
+
+def test_built_client_does_not_keep_cookies():
+    class Handler(BaseHTTPRequestHandler):
+        cookies = []
+
+        def do_GET(self):
+            Handler.cookies.append(self.headers.get("Cookie"))
+            self.send_response(200)
+            self.send_header("Set-Cookie", "session=abc; Path=/")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    async def run():
+        async with build_async_client() as client:
+            url = f"http://127.0.0.1:{server.server_port}/"
+            await client.get(url)
+            await client.get(url)
+            return len(client.cookies.jar)
+
+    try:
+        assert asyncio.run(run()) == 0
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert Handler.cookies == [None, None]
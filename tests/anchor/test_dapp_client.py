@@ -1,6 +1,7 @@
 import datetime
 import pytest
 import logging
+import requests
 from mykobo_py.anchor.dapp.anchor import DappAnchorClient
 from mykobo_py.anchor.dapp.models import Transaction
 from mykobo_py.identity.models.auth import Token
@@ -201,3 +202,63 @@ class TestDappAnchorClient:
         assert transaction.tx_hash == "5YNmS1R9nNSCDzYx6H9FGqPM4SXNqD6sNgD3KL8XvW7P"
         assert transaction.has_tx_hash is True
         assert transaction.is_withdrawal is True
+
+    def test_get_transactions(self, requests_mock):
+        """Test fetching many transactions concurrently with per-id errors"""
+        client = DappAnchorClient(host, logger)
+        for transaction_id in ("tx-1", "tx-2"):
+            requests_mock.get(
+                f"{host}/v1/transactions/{transaction_id}",
+                json={"id": transaction_id, "status": "PENDING_ANCHOR"}
+            )
+        requests_mock.get(f"{host}/v1/transactions/missing", status_code=404)
+
+        transactions = client.get_transactions(test_token, ["tx-1", "missing", "tx-2", "tx-1"], max_workers=2)
+
+        assert list(transactions) == ["tx-1", "missing", "tx-2"]
+        assert isinstance(transactions["tx-2"], Transaction)
+        assert transactions["tx-2"].is_pending_anchor is True
+        assert isinstance(transactions["missing"], requests.exceptions.HTTPError)
+        assert requests_mock.call_count == 3
+        assert requests_mock.last_request.headers["Authorization"] == "Bearer test_token"
+
+    def test_get_transaction_not_modified(self, requests_mock):
+        """Test that a 304 answer returns the cached transaction"""
+        client = DappAnchorClient(host, logger)
+        transaction_id = "tx-1"
+        url = f"{host}/v1/transactions/{transaction_id}"
+        requests_mock.get(url, json={"id": transaction_id, "status": "PENDING_ANCHOR"}, headers={"ETag": '"v1"'})
+        first = client.get_transaction(test_token, transaction_id)
+
+        requests_mock.get(url, status_code=304)
+        second = client.get_transaction(test_token, transaction_id)
+
+        assert requests_mock.last_request.headers["If-None-Match"] == '"v1"'
+        assert second == first and second is not first
+        assert client.get_transactions(test_token, [transaction_id])[transaction_id].status == "PENDING_ANCHOR"
+
+    def test_get_transaction_changed(self, requests_mock):
+        """Test that a changed transaction replaces the cached one"""
+        client = DappAnchorClient(host, logger)
+        url = f"{host}/v1/transactions/tx-1"
+        requests_mock.get(url, json={"id": "tx-1", "status": "PENDING_ANCHOR"}, headers={"ETag": '"v1"'})
+        client.get_transaction(test_token, "tx-1")
+
+        requests_mock.get(url, json={"id": "tx-1", "status": "COMPLETED"})
+        assert client.get_transaction(test_token, "tx-1").status == "COMPLETED"
+        assert client.transaction_cache.get("tx-1") is None
+
+        requests_mock.get(url, json={"id": "tx-1", "status": "COMPLETED"})
+        client.get_transaction(test_token, "tx-1")
+        assert "If-None-Match" not in requests_mock.last_request.headers
+
+    def test_transaction_cache_disabled(self, requests_mock):
+        """Test that no validators are sent without a transaction cache"""
+        client = DappAnchorClient(host, logger, transaction_cache_size=0)
+        url = f"{host}/v1/transactions/tx-1"
+        requests_mock.get(url, json={"id": "tx-1"}, headers={"ETag": '"v1"'})
+        client.get_transaction(test_token, "tx-1")
+        client.get_transaction(test_token, "tx-1")
+
+        assert client.transaction_cache is None
+        assert "If-None-Match" not in requests_mock.last_request.headers
@@ -0,0 +1,174 @@
+import logging
+import threading
+
+from mykobo_py.anchor.dapp.anchor import DappAnchorClient
+from mykobo_py.anchor.dapp.models import Transaction
+from mykobo_py.anchor.poller import TransactionPoller, fingerprint
+from mykobo_py.message_bus.models.base import EventType
+from mykobo_py.message_bus.models.event import TransactionStatusEventPayload
+
+logger = logging.getLogger("test")
+host = "https://test-anchor.example.com"
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Anchor:
+    """Serves the transactions in `state` and records which ids were fetched"""
+
+    def __init__(self, **state):
+        self.state = {id: Transaction(id=id, reference=f"REF-{id}", **fields) for id, fields in state.items()}
+        self.fetched = []
+
+    def __call__(self, ids):
+        self.fetched.append(sorted(ids))
+        return {id: self.state.get(id, KeyError(id)) for id in ids}
+
+    def update(self, id, **fields):
+        self.state[id] = self.state[id].model_copy(update=fields)
+
+
+def make_poller(anchor, clock, **kwargs):
+    emitted = []
+    poller = TransactionPoller(
+        anchor, emitted.append, "ANCHOR_SOLANA", lambda: "service-token", logger,
+        min_backoff=10, max_backoff=40, clock=clock, **kwargs
+    )
+    return poller, emitted
+
+
+class TestTransactionPoller:
+    """Tests for TransactionPoller"""
+
+    def test_fingerprint(self):
+        """Test that only status, tx_hash and updated_at change the fingerprint"""
+        transaction = Transaction(id="a", status="PENDING_ANCHOR", updated_at="1")
+        assert len(fingerprint(transaction)) == 8
+        assert fingerprint(transaction) == fingerprint(transaction.model_copy(update={"first_name": "Changed"}))
+        assert fingerprint(transaction) != fingerprint(transaction.model_copy(update={"tx_hash": "abc"}))
+        assert fingerprint(transaction) != fingerprint(transaction.model_copy(update={"status": "COMPLETED"}))
+
+    def test_emits_only_changes(self):
+        """Test that an event is emitted once per change and not on first sight"""
+        anchor = Anchor(a={"status": "PENDING_ANCHOR"}, b={"status": "PENDING_ANCHOR"})
+        clock = Clock()
+        poller, emitted = make_poller(anchor, clock)
+        poller.track(["a", "b"])
+
+        assert poller.poll() == []
+        anchor.update("a", status="COMPLETED", tx_hash="hash", updated_at="2")
+        clock.now = 10
+        poller.poll()
+        clock.now = 30
+        poller.poll()
+
+        assert len(emitted) == 1
+        message = emitted[0]
+        assert message.meta_data.event == EventType.TRANSACTION_STATUS_UPDATE
+        assert message.meta_data.source == "ANCHOR_SOLANA"
+        assert message.meta_data.token == "service-token"
+        assert isinstance(message.payload, TransactionStatusEventPayload)
+        assert (message.payload.reference, message.payload.status) == ("REF-a", "COMPLETED")
+
+    def test_backs_off_unchanged_ids(self):
+        """Test that unchanged ids are polled less often and changed ones every cycle"""
+        anchor = Anchor(a={"status": "PENDING_ANCHOR"}, b={"status": "PENDING_ANCHOR"})
+        clock = Clock()
+        poller, emitted = make_poller(anchor, clock)
+        poller.track(["a", "b"])
+
+        for now in range(0, 80):
+            clock.now = now
+            if now == 15:
+                anchor.update("b", status="PENDING_USER")
+            poller.poll()
+
+        polls_of = {id: sum(id in ids for ids in anchor.fetched) for id in ("a", "b")}
+        # first sight, then delays of 10, 20, 40, 40
+        assert anchor.fetched[:3] == [["a", "b"], ["a", "b"], ["a", "b"]]
+        assert polls_of["a"] == 5
+        assert polls_of["b"] > polls_of["a"]
+        assert len(emitted) == 1
+
+    def test_failed_emit_is_retried(self):
+        """Test that a change whose emit failed is emitted again and other ids are still polled"""
+        anchor = Anchor(a={"status": "PENDING_ANCHOR"}, b={"status": "PENDING_ANCHOR"})
+        clock = Clock()
+        emitted = []
+        failing = {"a"}
+
+        def emit(message):
+            if message.payload.reference == "REF-a" and "a" in failing:
+                raise ConnectionError("bus down")
+            emitted.append(message)
+
+        poller = TransactionPoller(
+            anchor, emit, "ANCHOR_SOLANA", lambda: "service-token", logger,
+            min_backoff=10, max_backoff=40, clock=clock
+        )
+        poller.track(["a", "b"])
+        poller.poll()
+
+        anchor.update("a", status="COMPLETED")
+        anchor.update("b", status="COMPLETED")
+        clock.now = 10
+        poller.poll()
+        assert [message.payload.reference for message in emitted] == ["REF-b"]
+
+        failing.clear()
+        clock.now = 20
+        poller.poll()
+        assert [message.payload.reference for message in emitted] == ["REF-b", "REF-a"]
+
+        clock.now = 40
+        poller.poll()
+        assert len(emitted) == 2
+
+    def test_errors_and_final_transactions(self):
+        """Test that failed ids stay tracked and final ones are dropped after their event"""
+        anchor = Anchor(a={"status": "PENDING_ANCHOR"})
+        clock = Clock()
+        poller, emitted = make_poller(anchor, clock, is_final=lambda transaction: transaction.status == "COMPLETED")
+        poller.track(["a", "missing"])
+
+        poller.poll()
+        anchor.update("a", status="COMPLETED")
+        clock.now = 10
+        poller.poll()
+
+        assert len(emitted) == 1
+        assert poller.tracked == ["missing"]
+        poller.untrack(["missing"])
+        assert poller.poll() == []
+
+    def test_with_dapp_client(self, requests_mock, test_token):
+        """Test polling through DappAnchorClient.get_transactions"""
+        client = DappAnchorClient(host, logger)
+        url = f"{host}/v1/transactions/tx-1"
+        requests_mock.get(url, json={"id": "tx-1", "reference": "REF1", "status": "PENDING_ANCHOR"})
+        emitted = []
+        poller = TransactionPoller(
+            lambda ids: client.get_transactions(test_token, ids), emitted.append, "ANCHOR_SOLANA",
+            lambda: test_token.token, logger, min_backoff=0
+        )
+        poller.track(["tx-1"])
+        poller.poll()
+        requests_mock.get(url, json={"id": "tx-1", "reference": "REF1", "status": "COMPLETED"})
+
+        stop = threading.Event()
+        runner = threading.Thread(target=poller.run, args=(stop, 0.01))
+        runner.start()
+        for _ in range(500):
+            if emitted:
+                break
+            stop.wait(0.01)
+        stop.set()
+        runner.join(5)
+
+        assert emitted[0].payload.status == "COMPLETED"
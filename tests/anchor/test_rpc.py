@@ -0,0 +1,98 @@
+import asyncio
+import json
+import logging
+
+import httpx
+import pytest
+
+from mykobo_py.anchor.dapp.aio import AsyncDappAnchorClient
+from mykobo_py.anchor.dapp.anchor import DappAnchorClient
+from mykobo_py.anchor.rpc import RpcError, match_responses, rpc_request
+from mykobo_py.anchor.stellar.anchor import AnchorRpcClient
+
+logger = logging.getLogger("test")
+host = "https://test-anchor.example.com"
+
+
+def answer_in_reverse(request, context):
+    """Answer every call with its params, out of order, and fail the `fail` method"""
+    responses = []
+    for call in request.json():
+        if call["method"] == "fail":
+            responses.append({"jsonrpc": "2.0", "id": call["id"], "error": {"code": -32000, "message": "failed"}})
+        else:
+            responses.append({"jsonrpc": "2.0", "id": call["id"], "result": call["params"]})
+    return list(reversed(responses))
+
+
+class TestJsonRpcBatch:
+    """Tests for batched JSON-RPC calls"""
+
+    def test_request_ids_are_unique(self):
+        """Test that calls made together get different ids"""
+        ids = {rpc_request("method", {})["id"] for _ in range(1000)}
+        assert len(ids) == 1000
+
+    def test_match_responses_by_id(self):
+        """Test pairing responses with requests regardless of their order"""
+        requests = [rpc_request("a", {}, id="1"), rpc_request("b", {}, id="2"), rpc_request("c", {}, id="3")]
+        results = match_responses(requests, [
+            {"id": "2", "error": {"code": -1, "message": "bad", "data": {"x": 1}}},
+            {"id": "1", "result": {"value": 1}},
+        ])
+
+        assert results[0] == {"value": 1}
+        assert isinstance(results[1], RpcError) and results[1].code == -1 and results[1].data == {"x": 1}
+        assert isinstance(results[2], RpcError)
+
+    @pytest.mark.parametrize("client_class", [DappAnchorClient, AnchorRpcClient])
+    def test_batch_builder(self, requests_mock, client_class):
+        """Test sending several calls in one POST with the builder"""
+        client = client_class(host, logger)
+        requests_mock.post(host, json=answer_in_reverse)
+
+        batch = client.batch()
+        first = batch.add("getTransaction", {"id": "a"})
+        failed = batch.add("fail", {})
+        second = batch.add("getTransaction", {"id": "b"})
+        results = batch.send()
+
+        assert requests_mock.call_count == 1
+        assert len(requests_mock.last_request.json()) == 3
+        assert results[first] == {"id": "a"}
+        assert results[second] == {"id": "b"}
+        assert isinstance(results[failed], RpcError)
+
+    def test_batches_are_split(self, requests_mock):
+        """Test that large batches are sent in chunks of max_batch_size"""
+        client = AnchorRpcClient(host, logger)
+        client.max_batch_size = 10
+        requests_mock.post(host, json=answer_in_reverse)
+
+        results = client.make_batch_request([("getTransaction", {"n": n}) for n in range(25)])
+
+        assert requests_mock.call_count == 3
+        assert results == [{"n": n} for n in range(25)]
+
+    def test_batch_transport_failure(self, requests_mock):
+        """Test that every call of a batch that could not be sent gets the error"""
+        client = DappAnchorClient(host, logger)
+        requests_mock.post(host, status_code=502)
+
+        results = client.make_batch_request([("a", {}), ("b", {})])
+
+        assert len(results) == 2
+        assert all(isinstance(result, Exception) for result in results)
+
+    def test_async_batch(self):
+        """Test batched calls from the async client"""
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls = json.loads(request.content)
+            return httpx.Response(200, json=[{"id": call["id"], "result": call["method"]} for call in reversed(calls)])
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+                client = AsyncDappAnchorClient(host, logger, http_client=http_client)
+                return await client.make_batch_request([("a", {}), ("b", {})])
+
+        assert asyncio.run(run()) == ["a", "b"]
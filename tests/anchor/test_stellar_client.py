@@ -0,0 +1,59 @@
+import logging
+
+import pydantic
+import requests
+
+from mykobo_py.anchor.stellar.anchor import AnchorRpcClient
+from mykobo_py.anchor.stellar.models import Transaction
+
+logger = logging.getLogger("test")
+host = "https://test-stellar-anchor.example.com/"
+
+
+class TestAnchorRpcClient:
+    """Tests for AnchorRpcClient"""
+
+    def test_get_transaction(self, requests_mock):
+        """Test getting a transaction successfully"""
+        client = AnchorRpcClient(host, logger)
+        requests_mock.get(f"{host}transactions/tx-1", json={"id": "tx-1", "status": "pending_anchor", "kind": "deposit"})
+
+        transaction = client.get_transaction("tx-1")
+
+        assert isinstance(transaction, Transaction)
+        assert transaction.kind == "deposit"
+
+    def test_get_transaction_not_found(self, requests_mock):
+        """Test getting a transaction that doesn't exist"""
+        client = AnchorRpcClient(host, logger)
+        requests_mock.get(f"{host}transactions/missing", status_code=404)
+
+        assert client.get_transaction("missing") is None
+
+    def test_get_transactions(self, requests_mock):
+        """Test fetching many transactions concurrently with per-id errors"""
+        client = AnchorRpcClient(host, logger)
+        requests_mock.get(f"{host}transactions/tx-1", json={"id": "tx-1", "status": "completed"})
+        requests_mock.get(f"{host}transactions/tx-2", json={"id": "tx-2", "status": 5})
+        requests_mock.get(f"{host}transactions/missing", status_code=404)
+
+        transactions = client.get_transactions(["tx-1", "tx-2", "missing"], max_workers=3)
+
+        assert transactions["tx-1"].status == "completed"
+        assert isinstance(transactions["tx-2"], pydantic.ValidationError)
+        assert isinstance(transactions["missing"], requests.exceptions.HTTPError)
+
+    def test_get_transaction_not_modified(self, requests_mock):
+        """Test that a 304 answer returns the cached transaction"""
+        client = AnchorRpcClient(host, logger)
+        last_modified = "Wed, 21 Oct 2025 07:28:00 GMT"
+        requests_mock.get(f"{host}transactions/tx-1", json={"id": "tx-1", "status": "pending_anchor"},
+                          headers={"Last-Modified": last_modified})
+        first = client.get_transaction("tx-1")
+
+        requests_mock.get(f"{host}transactions/tx-1", status_code=304)
+        second = client.get_transaction("tx-1")
+
+        assert requests_mock.last_request.headers["If-Modified-Since"] == last_modified
+        assert second.status == "pending_anchor"
+        assert second == first
@@ -0,0 +1,15 @@
+import datetime
+
+import pytest
+
+from mykobo_py.identity.models.auth import Token
+
+
+@pytest.fixture
+def test_token() -> Token:
+    return Token(
+        subject_id="urn:usrp:test",
+        token="test_token",
+        refresh_token="test_token",
+        expires_at=datetime.datetime.now() + datetime.timedelta(days=30)
+    )
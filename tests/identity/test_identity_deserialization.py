@@ -1,11 +1,12 @@
 import json
 import logging
 import datetime
+import requests
 from dotenv import load_dotenv
 
 from mykobo_py.identity.identity import IdentityServiceClient
-from mykobo_py.identity.models.auth import Token
-from mykobo_py.identity.models.request import CustomerRequest
+from mykobo_py.identity.models.auth import Token, clear_jwt_cache, configure_jwt_cache, jwt_cache_info
+from mykobo_py.identity.models.request import CustomerRequest, UserProfileFilterRequest
 from os import getenv
 
 from mykobo_py.identity.models.response import UserProfile, UserRiskProfile, ProfileChangeLogResponse
@@ -159,3 +160,62 @@ def test_profile_change_log_deserialization():
     assert fifth_log.field_name == "id_country_code"
     assert fifth_log.old_value == "PW"
     assert fifth_log.new_value == "NI"
+
+
+def test_token_decoding_is_memoized():
+    with open("tests/stubs/authenticate_success.json") as f:
+        json_data = json.loads(f.read())
+
+    clear_jwt_cache()
+    first = Token.from_json(json_data)
+    second = Token.from_json(json_data)
+    from_jwt = Token.from_jwt(json_data["token"])
+
+    assert first == second
+    assert first is not second
+    assert from_jwt.subject_id == first.subject_id
+    assert from_jwt.refresh_token is None
+    info = jwt_cache_info()
+    assert info.hits == 2
+    assert info.currsize == 3
+
+    configure_jwt_cache(1)
+    assert jwt_cache_info().currsize == 1
+    configure_jwt_cache(1024)
+    clear_jwt_cache()
+    assert jwt_cache_info().currsize == 0
+
+
+def test_get_user_profiles(requests_mock):
+    with open("tests/stubs/customer_kyc_complete.json") as f:
+        json_data = json.loads(f.read())
+    ids = [f"urn:usrp:{i}" for i in range(20)]
+    for id in ids:
+        requests_mock.get(f"{host}/user/profile/{id}", json=dict(json_data, id=id))
+    requests_mock.get(f"{host}/user/profile/urn:usrp:missing", status_code=404)
+
+    profiles = identity_service.get_user_profiles(test_token, ids + ids[:5] + ["urn:usrp:missing"], max_workers=4)
+
+    assert list(profiles) == ids + ["urn:usrp:missing"]
+    assert all(profiles[id].id == id for id in ids)
+    assert isinstance(profiles["urn:usrp:missing"], requests.exceptions.HTTPError)
+    assert requests_mock.call_count == 21
+
+
+def test_iter_profiles(requests_mock):
+    with open("tests/stubs/customer_kyc_complete.json") as f:
+        json_data = json.loads(f.read())
+
+    def page_callback(request, context):
+        page = json.loads(request.body)["page"]
+        count = 2 if page < 3 else 1
+        return {"profiles": [dict(json_data, id=f"urn:usrp:{page}-{i}") for i in range(count)]}
+
+    requests_mock.post(f"{host}/user/list", json=page_callback)
+
+    profiles = identity_service.iter_profiles(test_token, UserProfileFilterRequest(limit=2))
+    ids = [profile.id for profile in profiles]
+
+    assert ids == ["urn:usrp:1-0", "urn:usrp:1-1", "urn:usrp:2-0", "urn:usrp:2-1", "urn:usrp:3-0"]
+    assert profiles.pages_fetched == 3
+    assert requests_mock.call_count == 3
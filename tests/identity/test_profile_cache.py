@@ -0,0 +1,162 @@
+import datetime
+import json
+import logging
+import threading
+
+import pytest
+import requests
+
+from mykobo_py.identity.identity import IdentityServiceClient
+from mykobo_py.identity.models.auth import Token
+from mykobo_py.identity.models.request import NewDocumentRequest, NewKycReviewRequest, UpdateProfileRequest, \
+    UserRiskResetRequest
+from mykobo_py.identity.profile_cache import ProfileCache
+
+logger = logging.getLogger("test")
+host = "http://identity.test"
+profile_id = "urn:usrp:fb497b2fcbfa479991de4e8b0abecad6"
+test_token = Token(
+    subject_id=profile_id,
+    token="test_token",
+    refresh_token="test_token",
+    expires_at=datetime.datetime.now() + datetime.timedelta(days=30)
+)
+
+with open("tests/stubs/customer_kyc_complete.json") as f:
+    profile_json = json.loads(f.read())
+
+
+def cached_client() -> IdentityServiceClient:
+    return IdentityServiceClient(host, logger, profile_cache=ProfileCache())
+
+
+def test_profile_lookups_are_cached(requests_mock):
+    profile = requests_mock.get(f"{host}/user/profile/{profile_id}", json=profile_json)
+    risk = requests_mock.get(f"{host}/user/profile/{profile_id}/risk_profile", json={"risk_score": 1.0})
+    client = cached_client()
+
+    for _ in range(3):
+        assert client.get_user_profile(test_token, profile_id).json()["id"] == profile_id
+        assert client.get_user_risk_score(test_token, profile_id).json()["risk_score"] == 1.0
+
+    assert profile.call_count == 1
+    assert risk.call_count == 1
+    stats = client.profile_cache.stats()
+    assert stats["profile"] == {"hits": 2, "misses": 1}
+    assert stats["risk_score"] == {"hits": 2, "misses": 1}
+
+
+def test_failed_lookups_are_not_cached(requests_mock):
+    requests_mock.get(f"{host}/kyc/profile/{profile_id}", [{"status_code": 500}, {"json": {"id": "kyc"}}])
+    client = cached_client()
+
+    try:
+        client.get_user_kyc_profile(test_token, profile_id)
+    except Exception:
+        pass
+    assert client.get_user_kyc_profile(test_token, profile_id).json() == {"id": "kyc"}
+    assert len(client.profile_cache) == 1
+
+
+def test_entries_expire_per_endpoint(requests_mock):
+    profile = requests_mock.get(f"{host}/user/profile/{profile_id}", json=profile_json)
+    client = IdentityServiceClient(host, logger, profile_cache=ProfileCache(ttls={"profile": 0}))
+
+    client.get_user_profile(test_token, profile_id)
+    client.get_user_profile(test_token, profile_id)
+    assert profile.call_count == 2
+
+
+def test_writes_invalidate_cached_profile(requests_mock):
+    email = profile_json["email_address"]
+    profile = requests_mock.get(f"{host}/user/profile/{profile_id}", json=profile_json)
+    by_email = requests_mock.get(f"{host}/user/profile/email/{email}", json=profile_json)
+    requests_mock.patch(f"{host}/user/profile/update", json={})
+    requests_mock.put(f"{host}/kyc/documents", json={})
+    requests_mock.post(f"{host}/kyc/reviews/initiate", json={})
+    requests_mock.post(f"{host}/user/profile/{profile_id}/risk_profile/reset", json={})
+    client = cached_client()
+
+    writes = [
+        lambda: client.update_user_profile(test_token, None, UpdateProfileRequest(tax_id="1")),
+        lambda: client.create_new_document(test_token, NewDocumentRequest(
+            profile_id=profile_id, document_type="PASSPORT", document_status="PENDING")),
+        lambda: client.initiate_kyc_review(test_token, NewKycReviewRequest(profile_id=profile_id, level="basic")),
+        lambda: client.reset_user_risk_score(test_token, profile_id, UserRiskResetRequest(comments="reviewed")),
+    ]
+    for count, write in enumerate(writes, start=1):
+        client.get_user_profile(test_token, profile_id)
+        client.get_profile_by_email(test_token, email)
+        assert len(client.profile_cache) == 2
+        write()
+        assert len(client.profile_cache) == 0
+        assert profile.call_count == count
+        assert by_email.call_count == count
+
+
+def test_invalidation_only_affects_one_profile(requests_mock):
+    other_id = "urn:usrp:other"
+    requests_mock.get(f"{host}/user/profile/{profile_id}", json=profile_json)
+    requests_mock.get(f"{host}/user/profile/{other_id}", json=dict(profile_json, id=other_id))
+    client = cached_client()
+
+    client.get_user_profile(test_token, profile_id)
+    client.get_user_profile(test_token, other_id)
+    assert client.profile_cache.invalidate(other_id) == 1
+    assert len(client.profile_cache) == 1
+
+
+def test_cache_is_opt_in(requests_mock):
+    profile = requests_mock.get(f"{host}/user/profile/{profile_id}", json=profile_json)
+    client = IdentityServiceClient(host, logger)
+
+    client.get_user_profile(test_token, profile_id)
+    client.get_user_profile(test_token, profile_id)
+    assert profile.call_count == 2
+
+
+def test_batch_lookup_uses_cache(requests_mock):
+    profile = requests_mock.get(f"{host}/user/profile/{profile_id}", json=profile_json)
+    client = cached_client()
+
+    client.get_user_profile(test_token, profile_id)
+    profiles = client.get_user_profiles(test_token, [profile_id, profile_id])
+
+    assert profiles[profile_id].id == profile_id
+    assert profile.call_count == 1
+
+
+def test_responses_are_not_shared_between_tokens(requests_mock):
+    profile = requests_mock.get(f"{host}/user/profile/{profile_id}", [{"json": profile_json}, {"status_code": 403}])
+    other_token = test_token.model_copy(update={"subject_id": "urn:usrp:other", "token": "other_token"})
+    client = cached_client()
+
+    client.get_user_profile(test_token, profile_id)
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.get_user_profile(other_token, profile_id)
+    assert client.get_user_profile(test_token, profile_id).json()["id"] == profile_id
+    assert profile.call_count == 2
+    assert profile.last_request.headers["Authorization"] == "Bearer other_token"
+
+    assert client.profile_cache.invalidate(profile_id) == 1
+
+
+def test_invalidate_during_set_is_not_lost():
+    cache = ProfileCache()
+    store = cache._cache.set
+    invalidating = []
+
+    def slow_set(*args, **kwargs):
+        # Start an invalidation between the generation check and the insert
+        thread = threading.Thread(target=cache.invalidate, args=(profile_id,))
+        thread.start()
+        thread.join(0.2)
+        invalidating.append(thread)
+        store(*args, **kwargs)
+
+    cache._cache.set = slow_set
+    cache.set("profile", profile_id, requests.Response(), generation=cache.generation)
+    invalidating[0].join()
+
+    assert cache.get("profile", profile_id) is None
+    assert len(cache) == 0
@@ -0,0 +1,131 @@
+import datetime
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from mykobo_py.identity.models.auth import Token
+from mykobo_py.identity.token_cache import FileTokenCache
+from mykobo_py.identity.token_manager import TokenManager
+
+logger = logging.getLogger("test")
+
+
+def make_token(name: str = "token", expires_in: datetime.timedelta = datetime.timedelta(hours=1)) -> Token:
+    return Token(
+        subject_id="urn:svc:test",
+        token=name,
+        refresh_token=f"{name}-refresh",
+        expires_at=datetime.datetime.now() + expires_in
+    )
+
+
+def test_store_and_load(tmp_path):
+    cache = FileTokenCache(str(tmp_path / "token.json"))
+    assert cache.load() is None
+
+    token = make_token()
+    cache.store(token)
+    loaded = cache.load()
+
+    assert loaded.token == token.token
+    assert loaded.expires_at == token.expires_at
+    assert oct(os.stat(cache.path).st_mode & 0o777) == "0o600"
+
+
+def test_load_picks_up_writes_from_other_instances(tmp_path):
+    path = str(tmp_path / "token.json")
+    reader = FileTokenCache(path)
+    writer = FileTokenCache(path)
+
+    writer.store(make_token("first"))
+    assert reader.load().token == "first"
+    writer.store(make_token("second"))
+    assert reader.load().token == "second"
+    writer.clear()
+    assert reader.load() is None
+
+
+def test_corrupt_file_is_treated_as_missing(tmp_path):
+    path = tmp_path / "token.json"
+    path.write_text("{not json")
+    assert FileTokenCache(str(path)).load() is None
+
+
+def test_files_others_can_access_are_not_trusted(tmp_path):
+    path = tmp_path / "token.json"
+    cache = FileTokenCache(str(path))
+    cache.store(make_token())
+
+    os.chmod(path, 0o644)
+    assert cache.load() is None
+
+    planted = tmp_path / "planted.json"
+    planted.write_text(make_token("planted").model_dump_json(exclude={"is_expired"}))
+    os.chmod(planted, 0o600)
+    path.unlink()
+    path.symlink_to(planted)
+    assert cache.load() is None
+
+    open(cache.lock_path, "w").close()
+    os.chmod(cache.lock_path, 0o666)
+    with pytest.raises(PermissionError):
+        with cache.lock():
+            pass
+
+
+def test_for_service_defaults_to_a_private_directory(tmp_path, monkeypatch):
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+
+    cache = FileTokenCache.for_service("access-key")
+    directory = os.path.dirname(cache.path)
+    assert directory == str(tmp_path / f"mykobo-{os.geteuid()}")
+    assert oct(os.stat(directory).st_mode & 0o777) == "0o700"
+
+    os.chmod(directory, 0o777)
+    with pytest.raises(PermissionError):
+        FileTokenCache.for_service("access-key")
+
+
+def test_managers_sharing_a_file_authenticate_once(tmp_path):
+    path = str(tmp_path / "token.json")
+    first_client = Mock(logger=logger)
+    first_client.acquire_token.return_value = make_token("shared")
+    second_client = Mock(logger=logger)
+
+    first = TokenManager(first_client, cache=FileTokenCache(path))
+    second = TokenManager(second_client, cache=FileTokenCache(path))
+
+    assert first.get_token().token == "shared"
+    assert second.get_token().token == "shared"
+    second_client.acquire_token.assert_not_called()
+
+
+def _hold_lock(path, held, release):
+    with FileTokenCache(path).lock():
+        held.set()
+        release.wait(timeout=5)
+
+
+def test_lock_is_exclusive_across_processes(tmp_path):
+    path = str(tmp_path / "token.json")
+    context = multiprocessing.get_context("fork")
+    held, release = context.Event(), context.Event()
+    process = context.Process(target=_hold_lock, args=(path, held, release))
+    process.start()
+    try:
+        assert held.wait(timeout=5)
+        started = time.monotonic()
+        threading.Timer(0.2, release.set).start()
+        with FileTokenCache(path).lock():
+            waited = time.monotonic() - started
+    finally:
+        release.set()
+        process.join(timeout=5)
+
+    assert waited >= 0.15
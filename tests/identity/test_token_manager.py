@@ -0,0 +1,116 @@
+import datetime
+import logging
+import threading
+import time
+from unittest.mock import Mock
+
+from mykobo_py.identity.models.auth import Token
+from mykobo_py.identity.token_manager import TokenManager
+
+logger = logging.getLogger("test")
+
+
+def make_token(expires_in: datetime.timedelta, name: str = "token") -> Token:
+    return Token(
+        subject_id="urn:svc:test",
+        token=name,
+        refresh_token=f"{name}-refresh",
+        expires_at=datetime.datetime.now() + expires_in
+    )
+
+
+def make_client(*tokens):
+    client = Mock()
+    client.logger = logger
+    client.acquire_token.side_effect = list(tokens)
+    return client
+
+
+def test_token_is_cached():
+    client = make_client(make_token(datetime.timedelta(hours=1)))
+    manager = TokenManager(client)
+
+    first = manager.get_token()
+    second = manager.get_token()
+
+    assert first is second
+    assert client.acquire_token.call_count == 1
+
+
+def test_expired_token_is_replaced_blocking():
+    client = make_client(make_token(datetime.timedelta(seconds=-1), "old"), make_token(datetime.timedelta(hours=1), "new"))
+    manager = TokenManager(client)
+
+    assert manager.get_token().token == "old"
+    assert manager.get_token().token == "new"
+    assert client.acquire_token.call_count == 2
+    client.refresh_token.assert_not_called()
+
+
+def test_token_inside_margin_is_refreshed_in_background():
+    client = make_client(make_token(datetime.timedelta(seconds=30), "old"))
+    client.refresh_token.return_value = make_token(datetime.timedelta(hours=1), "new")
+    manager = TokenManager(client, refresh_margin=60)
+
+    assert manager.get_token().token == "old"
+    # still valid, so the current token is served while the refresh runs
+    assert manager.get_token().token == "old"
+    for _ in range(100):
+        if manager.cache.load().token == "new":
+            break
+        time.sleep(0.01)
+
+    assert manager.get_token().token == "new"
+    client.refresh_token.assert_called_once_with("old-refresh")
+
+
+def test_failed_refresh_falls_back_to_authentication():
+    client = make_client(make_token(datetime.timedelta(seconds=30), "old"), make_token(datetime.timedelta(hours=1), "new"))
+    client.refresh_token.side_effect = Exception("refresh rejected")
+    manager = TokenManager(client, refresh_margin=60, background_refresh=False)
+
+    assert manager.get_token().token == "old"
+    assert manager.get_token().token == "new"
+
+
+def test_concurrent_callers_share_one_acquisition():
+    release = threading.Event()
+    calls = []
+
+    def slow_acquire():
+        calls.append(1)
+        release.wait(timeout=5)
+        return make_token(datetime.timedelta(hours=1))
+
+    client = Mock()
+    client.logger = logger
+    client.acquire_token.side_effect = slow_acquire
+    manager = TokenManager(client)
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(manager.get_token())) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(results) == 20
+    assert all(result is results[0] for result in results)
+
+
+def test_invalidate_forces_new_token():
+    client = make_client(make_token(datetime.timedelta(hours=1), "first"), make_token(datetime.timedelta(hours=1), "second"))
+    manager = TokenManager(client)
+
+    assert manager.get_token().token == "first"
+    manager.invalidate()
+    assert manager.get_token().token == "second"
+
+
+def test_returns_none_when_acquisition_fails():
+    client = make_client(None)
+    manager = TokenManager(client)
+    assert manager.get_token() is None
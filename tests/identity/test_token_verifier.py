@@ -0,0 +1,123 @@
+import datetime
+import logging
+import time
+
+import jwt
+import pytest
+
+pytest.importorskip("cryptography")
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from mykobo_py.identity.identity import IdentityServiceClient
+from mykobo_py.identity.models.auth import Token
+
+logger = logging.getLogger("test")
+host = "http://identity.test"
+jwks_url = f"{host}/.well-known/jwks.json"
+service_token = Token(
+    subject_id="urn:svc:test",
+    token="service_token",
+    refresh_token=None,
+    expires_at=datetime.datetime.now() + datetime.timedelta(days=1)
+)
+
+
+def make_key(kid: str):
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+    jwk.update(kid=kid, alg="RS256", use="sig")
+    return private_key, jwk
+
+
+def sign(private_key, kid: str, expires_in: int = 300, **claims) -> str:
+    payload = {"sub": "urn:usrp:1", "scope": ["user:read"], "exp": int(time.time()) + expires_in}
+    payload.update(claims)
+    return jwt.encode(payload, private_key, algorithm="RS256", headers={"kid": kid})
+
+
+@pytest.fixture(scope="module")
+def keys():
+    return make_key("key-1"), make_key("key-2")
+
+
+def test_scope_and_subject_checked_locally(requests_mock, keys):
+    (private_key, jwk), _ = keys
+    requests_mock.get(jwks_url, json={"keys": [jwk]})
+    scope_check = requests_mock.post(f"{host}/authorise/scope", json={})
+    client = IdentityServiceClient(host, logger)
+    client.enable_local_verification()
+    target = sign(private_key, "key-1")
+
+    assert client.authorise_scope(service_token, target, "user:read")
+    assert not client.authorise_scope(service_token, target, "user:admin")
+    assert client.authorise_subject(service_token, target, "urn:usrp:1")
+    assert not client.authorise_subject(service_token, target, "urn:usrp:2")
+    assert not scope_check.called
+    assert requests_mock.call_count == 1
+
+
+def test_expired_or_tampered_tokens_are_rejected(requests_mock, keys):
+    (private_key, jwk), (other_key, _) = keys
+    requests_mock.get(jwks_url, json={"keys": [jwk]})
+    client = IdentityServiceClient(host, logger)
+    client.enable_local_verification()
+
+    assert not client.authorise_scope(service_token, sign(private_key, "key-1", expires_in=-10), "user:read")
+    assert not client.authorise_scope(service_token, sign(other_key, "key-1"), "user:read")
+    assert not client.authorise_scope(service_token, "not-a-jwt", "user:read")
+
+
+def test_rotated_key_is_fetched(requests_mock, keys):
+    (first_key, first_jwk), (second_key, second_jwk) = keys
+    requests_mock.get(jwks_url, [{"json": {"keys": [first_jwk]}}, {"json": {"keys": [first_jwk, second_jwk]}}])
+    client = IdentityServiceClient(host, logger)
+    client.enable_local_verification(min_refresh_interval=0)
+
+    assert client.authorise_scope(service_token, sign(first_key, "key-1"), "user:read")
+    assert client.authorise_scope(service_token, sign(second_key, "key-2"), "user:read")
+    assert requests_mock.call_count == 2
+
+
+def test_falls_back_to_remote_check_when_keys_unavailable(requests_mock, keys):
+    (private_key, _), _ = keys
+    requests_mock.get(jwks_url, status_code=503)
+    requests_mock.post(f"{host}/authorise/scope", [{"json": {}}, {"status_code": 403}])
+    client = IdentityServiceClient(host, logger)
+    client.enable_local_verification()
+    target = sign(private_key, "key-1")
+
+    assert client.authorise_scope(service_token, target, "user:read")
+    assert not client.authorise_scope(service_token, target, "user:admin")
+
+
+def test_unsupported_algorithm_falls_back_to_remote_check(requests_mock, keys):
+    (_, jwk), _ = keys
+    requests_mock.get(jwks_url, json={"keys": [jwk]})
+    subject_check = requests_mock.post(f"{host}/authorise/subject", json={})
+    client = IdentityServiceClient(host, logger)
+    client.enable_local_verification()
+    target = jwt.encode({"sub": "urn:usrp:1", "exp": int(time.time()) + 60}, "a-shared-secret-of-at-least-32-bytes", algorithm="HS256")
+
+    assert client.authorise_subject(service_token, target, "urn:usrp:1")
+    assert subject_check.called
+
+
+def test_remote_check_without_local_verification(requests_mock):
+    requests_mock.post(f"{host}/authorise/scope", json={})
+    client = IdentityServiceClient(host, logger)
+    assert client.authorise_scope(service_token, "target", "user:read")
+
+
+def test_algorithm_not_matching_the_key_is_rejected(requests_mock, keys):
+    (private_key, jwk), _ = keys
+    requests_mock.get(jwks_url, json={"keys": [jwk]})
+    scope_check = requests_mock.post(f"{host}/authorise/scope", json={})
+    client = IdentityServiceClient(host, logger)
+    client.enable_local_verification()
+    header, payload, signature = sign(private_key, "key-1").split(".")
+    forged_header = jwt.utils.base64url_encode(b'{"alg":"ES256","kid":"key-1","typ":"JWT"}').decode()
+    target = ".".join([forged_header, payload, signature])
+
+    assert not client.authorise_scope(service_token, target, "user:read")
+    assert not client.authorise_subject(service_token, target, "urn:usrp:1")
+    assert not scope_check.called
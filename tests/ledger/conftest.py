@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+from mykobo_py.ledger.models.request import TransactionFilterRequest
+
+
+@pytest.fixture
+def make_filter():
+    """Build a TransactionFilterRequest with every filter empty unless given."""
+    def make(page: int = 1, limit: int = 10, **kwargs) -> TransactionFilterRequest:
+        values = dict(
+            sources=[], transaction_types=[], statuses=[], currencies=[], from_date=None,
+            to_date=None, payee=None, payer=None, page=page, limit=limit
+        )
+        values.update(kwargs)
+        return TransactionFilterRequest(**values)
+    return make
+
+
+@pytest.fixture
+def paged():
+    """Build a transaction_list callback that pages through `rows` and reports their total."""
+    def make(rows):
+        def callback(request, context):
+            body = json.loads(request.body)
+            start = (body["page"] - 1) * body["limit"]
+            return {"transactions": rows[start:start + body["limit"]], "total": len(rows)}
+        return callback
+    return make
+
+
+@pytest.fixture
+def transaction():
+    """Build a ledger transaction row; odd ids are deposits and every third id is paid by urn:usrp:b."""
+    def make(i: int, status: str = "PENDING", updated_at: str = None, **kwargs) -> dict:
+        row = {
+            "id": f"urn:tx:{i}",
+            "reference": f"REF{i}",
+            "transaction_type": "DEPOSIT" if i % 2 else "WITHDRAWAL",
+            "status": status,
+            "incoming_currency": "EUR",
+            "outgoing_currency": "EURC",
+            "payer": "urn:usrp:a" if i % 3 else "urn:usrp:b",
+            "payee": None,
+            "amount_in": 10.5,
+            "created_at": f"2025-11-{i + 1:02d}T10:00:00",
+            "updated_at": updated_at or f"2025-11-{i + 1:02d}T10:00:00.000001",
+        }
+        row.update(kwargs)
+        return row
+    return make
@@ -0,0 +1,73 @@
+import datetime
+import json
+import logging
+from decimal import Decimal
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.parquet as pq
+
+from mykobo_py.ledger.columnar import transactions_to_record_batch, write_record_batches
+from mykobo_py.ledger.ledger import LedgerServiceClient
+
+logger = logging.getLogger("test")
+host = "http://ledger.test"
+
+with open("tests/stubs/ledger_transaction_details.json") as f:
+    detail = json.loads(f.read())["transaction"]
+
+
+def test_record_batch_types():
+    rows = [
+        detail,
+        dict(detail, id="urn:tx:2", amount_in="0.25000000", fee=None, updated_at=None),
+    ]
+    batch = transactions_to_record_batch(rows)
+
+    assert batch.num_rows == 2
+    assert batch.column("amount_in").to_pylist() == [Decimal("76.86"), Decimal("0.25")]
+    assert batch.column("fee").to_pylist() == [Decimal("0.96"), None]
+    assert batch.column("created_at").to_pylist()[0] == datetime.datetime(2025, 11, 24, 17, 42, 41, tzinfo=datetime.UTC)
+    assert batch.column("updated_at").to_pylist()[1] is None
+    assert batch.column("payee").to_pylist() == [None, None]
+    assert "requester_first_name" not in batch.schema.names
+
+
+def test_record_batch_with_timezone_offsets():
+    batch = transactions_to_record_batch([
+        {"id": "1", "created_at": "2025-11-24T17:42:41+02:00"},
+        {"id": "2", "created_at": "2025-11-24T17:42:41"},
+    ])
+    assert [value.hour for value in batch.column("created_at").to_pylist()] == [15, 17]
+
+
+def test_record_batch_rejects_excess_precision():
+    with pytest.raises(pa.ArrowInvalid):
+        transactions_to_record_batch([{"id": "1", "amount_in": "1.123456789"}])
+
+
+def test_write_transactions_to_parquet(requests_mock, tmp_path, make_filter, paged, test_token):
+    rows = [dict(detail, id=f"urn:tx:{i}", amount_in=f"{i}.5") for i in range(25)]
+    requests_mock.post(f"{host}/transactions/list", json=paged(rows))
+    client = LedgerServiceClient(host, logger)
+    path = str(tmp_path / "transactions.parquet")
+
+    assert client.write_transactions(test_token, make_filter(limit=10), path) == 25
+
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_row_groups == 3
+    table = parquet.read()
+    assert table.column("id").to_pylist() == [row["id"] for row in rows]
+    assert table.column("amount_in").to_pylist()[3] == Decimal("3.5")
+
+
+def test_write_ipc_file(tmp_path):
+    path = str(tmp_path / "transactions.arrow")
+    assert write_record_batches([[detail], [], [dict(detail, id="urn:tx:2")]], path, file_format="ipc") == 2
+
+    with pa.ipc.open_file(path) as reader:
+        table = reader.read_all()
+    assert table.num_rows == 2
+    with pytest.raises(ValueError):
+        write_record_batches([], str(tmp_path / "out.csv"), file_format="csv")
@@ -0,0 +1,92 @@
+import datetime
+import json
+import logging
+from datetime import timedelta
+
+import pytest
+import requests
+
+from mykobo_py.ledger.ledger import LedgerServiceClient
+from mykobo_py.ledger.partition import time_slices, PartitionedExport, format_ledger_datetime, \
+    parse_ledger_datetime
+
+logger = logging.getLogger("test")
+host = "http://ledger.test"
+start = datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC)
+
+
+def ranged(rows):
+    """Stub list endpoint that treats from/to as an inclusive range, so boundary rows appear in two windows."""
+    def callback(request, context):
+        body = json.loads(request.body)
+        low, high = datetime.datetime.fromisoformat(body["from"]), datetime.datetime.fromisoformat(body["to"])
+        matching = [row for row in rows if low <= datetime.datetime.fromisoformat(row["created_at"]) <= high]
+        offset = (body["page"] - 1) * body["limit"]
+        return {"transactions": matching[offset:offset + body["limit"]]}
+    return callback
+
+
+def make_rows(hours: int):
+    return [
+        {"id": f"urn:tx:{i}", "created_at": (start + timedelta(hours=i)).isoformat()}
+        for i in range(hours + 1)
+    ]
+
+
+def test_time_slices():
+    slices = time_slices(start, start + timedelta(days=2, hours=12), timedelta(days=1))
+    assert [(a.day, b.day, b.hour) for a, b in slices] == [(1, 2, 0), (2, 3, 0), (3, 3, 12)]
+    with pytest.raises(ValueError):
+        time_slices(start, start - timedelta(days=1), timedelta(days=1))
+
+
+def test_ledger_datetimes_are_utc():
+    parsed = parse_ledger_datetime("2025-01-01T00:00:00+02:00")
+    assert parsed == datetime.datetime(2024, 12, 31, 22, 0)
+    assert format_ledger_datetime(parsed) == "2024-12-31T22:00:00.000000Z"
+    assert format_ledger_datetime(start.astimezone(datetime.timezone(timedelta(hours=2)))) == "2025-01-01T00:00:00.000000Z"
+    assert parse_ledger_datetime("2025-01-01T00:00:00.000000Z") == datetime.datetime(2025, 1, 1)
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_export_merges_slices_without_duplicates(requests_mock, ordered, make_filter, test_token):
+    rows = make_rows(hours=24 * 5)
+    requests_mock.post(f"{host}/transactions/list", json=ranged(rows))
+    client = LedgerServiceClient(host, logger)
+    params = make_filter(
+        limit=7,
+        from_date=start.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+        to_date=(start + timedelta(days=5)).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+    )
+
+    export = client.export_transactions(test_token, params, slice_width=timedelta(hours=12), max_workers=4, ordered=ordered)
+    exported = [row["id"] for row in export]
+
+    assert sorted(exported) == sorted(row["id"] for row in rows)
+    assert len(exported) == len(set(exported))
+    assert export.duplicates == 9
+    if ordered:
+        assert exported == [row["id"] for row in rows]
+
+
+def test_export_requires_a_date_range(make_filter, test_token):
+    client = LedgerServiceClient(host, logger)
+    with pytest.raises(ValueError):
+        client.export_transactions(test_token, make_filter())
+
+
+def test_export_raises_slice_errors(requests_mock, make_filter, test_token):
+    requests_mock.post(f"{host}/transactions/list", status_code=500)
+    client = LedgerServiceClient(host, logger)
+    params = make_filter(from_date="2025-01-01T00:00:00.000000Z", to_date="2025-01-03T00:00:00.000000Z")
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        list(client.export_transactions(test_token, params, ordered=False))
+
+
+def test_abandoned_export_stops_workers():
+    slices = time_slices(start, start + timedelta(days=30), timedelta(days=1))
+    export = PartitionedExport(lambda a, b: ({"id": f"{a}-{i}"} for i in range(1000)), slices, page_size=10)
+    iterator = iter(export)
+    assert next(iterator)["id"].endswith("-0")
+    iterator.close()
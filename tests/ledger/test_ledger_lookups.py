@@ -0,0 +1,61 @@
+import json
+import logging
+import threading
+import time
+
+import requests
+
+from mykobo_py.ledger.ledger import LedgerServiceClient
+
+logger = logging.getLogger("test")
+host = "http://ledger.test"
+
+with open("tests/stubs/ledger_transaction_details.json") as f:
+    details = json.loads(f.read())
+
+
+def test_concurrent_lookups_share_one_request(requests_mock, test_token):
+    def slow(request, context):
+        time.sleep(0.1)
+        return details
+
+    requests_mock.get(f"{host}/transactions/reference/REF1/details", json=slow)
+    client = LedgerServiceClient(host, logger)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(client.get_transaction_by_reference(test_token, "REF1")))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert requests_mock.call_count == 1
+    assert len(results) == 5 and all(result == details for result in results)
+    assert len({id(result) for result in results}) == 5
+
+    client.get_transaction_by_reference(test_token, "REF1")
+    assert requests_mock.call_count == 2
+
+
+def test_bulk_lookup_by_reference(requests_mock, test_token):
+    for reference in ("REF1", "REF2"):
+        requests_mock.get(f"{host}/transactions/reference/{reference}/details", json=dict(details, reference=reference))
+    requests_mock.get(f"{host}/transactions/reference/MISSING/details", status_code=404)
+    client = LedgerServiceClient(host, logger)
+
+    results = client.get_transactions_by_reference(test_token, ["REF1", "MISSING", "REF2", "REF1"], max_workers=2)
+
+    assert list(results) == ["REF1", "MISSING", "REF2"]
+    assert results["REF2"]["reference"] == "REF2"
+    assert isinstance(results["MISSING"], requests.exceptions.HTTPError)
+    assert requests_mock.call_count == 3
+
+
+def test_lookup_without_token(requests_mock):
+    requests_mock.get(f"{host}/transactions/reference/REF1/details", json=details)
+    client = LedgerServiceClient(host, logger)
+
+    assert client.get_transaction_by_reference(None, "REF1") == details
+    assert "Authorization" not in requests_mock.last_request.headers
@@ -0,0 +1,160 @@
+import json
+import logging
+from datetime import timedelta
+from decimal import Decimal
+
+import re
+
+import pytest
+
+from mykobo_py.ledger.ledger import LedgerServiceClient
+from mykobo_py.ledger.mirror import LedgerMirror
+
+logger = logging.getLogger("test")
+host = "http://ledger.test"
+
+
+class LedgerStub:
+    """transaction_list filtered on created_at, plus the details of each transaction by reference."""
+
+    def __init__(self, requests_mock, rows):
+        self.rows = rows
+        self.requests = []
+        self.details = []
+        requests_mock.post(f"{host}/transactions/list", json=self.list)
+        requests_mock.get(f"{host}/transactions/statuses", json={"statuses": ["PENDING", "FULFILLED"]})
+        requests_mock.get(f"{host}/transactions/statuses/transitions/PENDING", json={"transitions": ["FULFILLED"]})
+        requests_mock.get(f"{host}/transactions/statuses/transitions/FULFILLED", json={"transitions": []})
+        requests_mock.get(re.compile(rf"{host}/transactions/reference/\w+/details"), json=self.detail)
+
+    def list(self, request, context):
+        body = json.loads(request.body)
+        self.requests.append(body)
+        matching = [row for row in self.rows if not body.get("from") or row["created_at"] >= body["from"][:19]]
+        offset = (body["page"] - 1) * body["limit"]
+        return {"transactions": matching[offset:offset + body["limit"]]}
+
+    def detail(self, request, context):
+        reference = request.path.split("/")[-2].upper()
+        self.details.append(reference)
+        return {"transaction": next(row for row in self.rows if row["reference"] == reference), "events": []}
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    mirror = LedgerMirror(LedgerServiceClient(host, logger), str(tmp_path / "ledger.db"), page_size=4)
+    yield mirror
+    mirror.close()
+
+
+def test_first_sync_mirrors_everything(requests_mock, mirror, test_token, transaction):
+    LedgerStub(requests_mock, [transaction(i) for i in range(10)])
+
+    result = mirror.sync(test_token)
+
+    assert result.rows == 10
+    assert result.from_date is None
+    assert result.high_water_mark == "2025-11-10T10:00:00"
+    assert mirror.checkpoint() == result.high_water_mark
+    assert mirror.get("urn:tx:3")["reference"] == "REF3"
+    assert mirror.by_reference("REF4")["id"] == "urn:tx:4"
+
+
+def test_next_sync_only_fetches_changes(requests_mock, mirror, test_token, transaction):
+    rows = [transaction(i, status="FULFILLED" if i < 2 else "PENDING") for i in range(10)]
+    stub = LedgerStub(requests_mock, rows)
+    mirror.sync(test_token)
+
+    rows[2] = transaction(2, status="FULFILLED", updated_at="2025-12-05T09:00:00.000000")
+    rows.append(transaction(10))
+    stub.requests.clear()
+    result = mirror.sync(test_token)
+
+    assert stub.requests[0]["from"] == "2025-11-09T10:00:00.000000Z"
+    assert [row["id"] for row in mirror.transactions(from_date="2025-11-09")] == ["urn:tx:8", "urn:tx:9", "urn:tx:10"]
+    assert sorted(stub.details) == [f"REF{i}" for i in range(2, 8)]
+    assert result.rows == 9
+    assert mirror.get("urn:tx:2")["status"] == "FULFILLED"
+    assert mirror.checkpoint() == "2025-11-11T10:00:00"
+    assert mirror.stats()["total"] == 11
+
+    stub.details.clear()
+    mirror.sync(test_token)
+    assert sorted(stub.details) == [f"REF{i}" for i in range(3, 9)]
+
+
+def test_stats_from_local_copy(requests_mock, mirror, test_token, transaction):
+    rows = [transaction(i, status="FULFILLED" if i < 4 else "PENDING", incoming_currency="EUR" if i < 5 else "USD") for i in range(10)]
+    LedgerStub(requests_mock, rows)
+    mirror.sync(test_token)
+    calls = requests_mock.call_count
+
+    stats = mirror.stats()
+    assert stats["by_status"] == {"FULFILLED": 4, "PENDING": 6}
+    assert stats["by_currency"] == {"EUR": 5, "USD": 5}
+    assert stats["volume_by_type"] == {
+        "DEPOSIT": {"EUR": Decimal("21"), "USD": Decimal("31.5")},
+        "WITHDRAWAL": {"EUR": Decimal("31.5"), "USD": Decimal("21")},
+    }
+
+    profile_stats = mirror.stats(profile_id="urn:usrp:b", from_date="2025-11-02")
+    assert profile_stats["total"] == 3
+    assert [row["id"] for row in mirror.transactions(profile_id="urn:usrp:b")] == ["urn:tx:0", "urn:tx:3", "urn:tx:6", "urn:tx:9"]
+    assert requests_mock.call_count == calls
+
+
+def test_failed_sync_keeps_checkpoint(requests_mock, mirror, test_token, transaction):
+    LedgerStub(requests_mock, [transaction(i) for i in range(3)])
+    mirror.sync(test_token)
+    checkpoint = mirror.checkpoint()
+
+    requests_mock.post(f"{host}/transactions/list", [
+        {"json": {"transactions": [transaction(i, updated_at="2025-12-01T00:00:00") for i in range(4)]}},
+        {"status_code": 500},
+    ])
+    with pytest.raises(Exception):
+        mirror.sync(test_token)
+    assert mirror.checkpoint() == checkpoint
+
+
+def test_refresh_is_bounded_by_window_and_limit(requests_mock, tmp_path, test_token, transaction):
+    stub = LedgerStub(requests_mock, [transaction(i) for i in range(10)])
+    mirror = LedgerMirror(
+        LedgerServiceClient(host, logger), str(tmp_path / "ledger.db"), page_size=4,
+        refresh_window=timedelta(days=4), refresh_limit=2
+    )
+    mirror.sync(test_token)
+    mirror.sync(test_token)
+    mirror.close()
+
+    assert sorted(stub.details) == ["REF6", "REF7"]
+
+
+def test_refresh_skipped_without_final_statuses(requests_mock, mirror, test_token, transaction):
+    stub = LedgerStub(requests_mock, [transaction(i) for i in range(10)])
+    requests_mock.get(f"{host}/transactions/statuses", json={"statuses": ["PENDING"]})
+    mirror.sync(test_token)
+
+    rows = [transaction(i) for i in range(11)]
+    stub.rows[:] = rows
+    result = mirror.sync(test_token)
+
+    assert stub.details == []
+    assert result.rows == 3
+    assert mirror.checkpoint() == "2025-11-11T10:00:00"
+
+
+def test_failing_reference_does_not_block_checkpoint(requests_mock, mirror, test_token, transaction):
+    stub = LedgerStub(requests_mock, [transaction(i) for i in range(10)])
+    mirror.sync(test_token)
+
+    stub.rows[3] = transaction(3, status="FULFILLED")
+    stub.rows[4] = transaction(4, status="FULFILLED")
+    stub.rows.append(transaction(10))
+    requests_mock.get(f"{host}/transactions/reference/REF3/details", status_code=500)
+    result = mirror.sync(test_token)
+
+    assert mirror.checkpoint() == "2025-11-11T10:00:00"
+    assert mirror.get("urn:tx:3")["status"] == "PENDING"
+    assert mirror.get("urn:tx:4")["status"] == "FULFILLED"
+    assert result.rows == 3 + 7
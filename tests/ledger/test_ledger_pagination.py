@@ -0,0 +1,82 @@
+import json
+import logging
+
+import pytest
+import requests
+
+from mykobo_py.ledger.ledger import LedgerServiceClient
+
+logger = logging.getLogger("test")
+host = "http://ledger.test"
+
+
+def test_iter_transactions_walks_every_page(requests_mock, make_filter, paged, test_token):
+    rows = [{"id": f"urn:tx:{i}", "reference": str(i)} for i in range(25)]
+    requests_mock.post(f"{host}/transactions/list", json=paged(rows))
+    client = LedgerServiceClient(host, logger)
+    progress = []
+
+    transactions = client.iter_transactions(
+        test_token,
+        make_filter(limit=10),
+        total_key="total",
+        on_page=lambda it: progress.append((it.pages_fetched, it.total)),
+    )
+
+    assert [row["id"] for row in transactions] == [row["id"] for row in rows]
+    assert transactions.items_yielded == 25
+    assert transactions.finished
+    assert progress == [(1, 25), (2, 25), (3, 25)]
+    assert requests_mock.call_count == 3
+
+
+def test_iter_transactions_stops_on_exact_last_page(requests_mock, make_filter, paged, test_token):
+    rows = [{"id": f"urn:tx:{i}"} for i in range(20)]
+    requests_mock.post(f"{host}/transactions/list", json=paged(rows))
+    client = LedgerServiceClient(host, logger)
+
+    assert len(list(client.iter_transactions(test_token, make_filter(limit=10), total_key="total"))) == 20
+    assert requests_mock.call_count == 2
+
+    assert len(list(client.iter_transactions(test_token, make_filter(limit=10)))) == 20
+    assert requests_mock.call_count == 5
+
+
+def test_iter_transactions_does_not_stop_on_page_count(requests_mock, make_filter, test_token):
+    rows = [{"id": f"urn:tx:{i}"} for i in range(21)]
+
+    def callback(request, context):
+        body = json.loads(request.body)
+        start = (body["page"] - 1) * body["limit"]
+        page = rows[start:start + body["limit"]]
+        return {"transactions": page, "count": len(page)}
+
+    requests_mock.post(f"{host}/transactions/list", json=callback)
+    client = LedgerServiceClient(host, logger)
+
+    assert len(list(client.iter_transactions(test_token, make_filter(limit=10)))) == 21
+
+
+def test_iter_transactions_raises_on_unexpected_page(requests_mock, make_filter, test_token):
+    requests_mock.post(f"{host}/transactions/list", json={"items": [{"id": "urn:tx:1"}]})
+    client = LedgerServiceClient(host, logger)
+
+    with pytest.raises(ValueError):
+        list(client.iter_transactions(test_token, make_filter(limit=10)))
+
+
+def test_iter_transactions_raises_on_failed_page(requests_mock, make_filter, test_token):
+    requests_mock.post(f"{host}/transactions/list", [
+        {"json": {"transactions": [{"id": "urn:tx:1"}, {"id": "urn:tx:2"}]}},
+        {"status_code": 500},
+    ])
+    client = LedgerServiceClient(host, logger)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        list(client.iter_transactions(test_token, make_filter(limit=2)))
+
+
+def test_transaction_list_still_swallows_http_errors(requests_mock, make_filter, test_token):
+    requests_mock.post(f"{host}/transactions/list", status_code=500)
+    client = LedgerServiceClient(host, logger)
+    assert client.transaction_list(test_token, make_filter()) == {}
@@ -0,0 +1,122 @@
+import logging
+import time
+
+import pytest
+import requests
+
+from mykobo_py.ledger.ledger import LedgerServiceClient
+from mykobo_py.ledger.models.reference import ComplianceGate, VerificationErrorCode
+from mykobo_py.ledger.reference import ReferenceDataCache
+
+logger = logging.getLogger("test")
+host = "http://ledger.test"
+
+GATES = {"compliance_gates": [
+    {"code": "AML_SCREENING", "name": "AML screening", "blocking": True},
+    {"code": "SOURCE_OF_FUNDS", "name": "Source of funds"},
+]}
+ERROR_CODES = {"error_codes": [
+    {"code": "E100", "description": "Document expired"},
+    {"code": "E200", "description": "Face mismatch", "severity": "high"},
+]}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def client(clock):
+    client = LedgerServiceClient(host, logger)
+    client.reference_data = ReferenceDataCache(
+        client.get_compliance_gates, client.get_verification_error_codes, logger, ttl=60, retry_interval=10, clock=clock
+    )
+    return client
+
+
+def wait_for_refresh(dataset):
+    deadline = time.monotonic() + 5
+    while dataset._refreshing and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not dataset._refreshing
+
+
+def test_typed_lookups_by_code(requests_mock, client, test_token):
+    requests_mock.get(f"{host}/transactions/compliance_gates", json=GATES)
+    requests_mock.get(f"{host}/transactions/verification/error_codes", json=ERROR_CODES)
+
+    gate = client.get_compliance_gate(test_token, "AML_SCREENING")
+    assert isinstance(gate, ComplianceGate)
+    assert gate.name == "AML screening"
+    assert gate.blocking is True
+    assert client.get_compliance_gate(test_token, "MISSING") is None
+
+    code = client.get_verification_error_code(test_token, "E200")
+    assert isinstance(code, VerificationErrorCode)
+    assert code.description == "Face mismatch"
+    assert client.get_verification_error_code(test_token, "E100").description == "Document expired"
+
+    for _ in range(5):
+        client.get_compliance_gate(test_token, "SOURCE_OF_FUNDS")
+    assert requests_mock.call_count == 2
+
+
+def test_stale_data_is_served_while_refreshing(requests_mock, client, clock, test_token):
+    requests_mock.get(f"{host}/transactions/compliance_gates", json=GATES)
+    client.get_compliance_gate(test_token, "AML_SCREENING")
+
+    requests_mock.get(f"{host}/transactions/compliance_gates", json={"compliance_gates": [{"code": "AML_SCREENING", "name": "Renamed"}]})
+    clock.now = 61
+    assert client.get_compliance_gate(test_token, "AML_SCREENING").name == "AML screening"
+    wait_for_refresh(client.reference_data.compliance_gates)
+
+    assert client.get_compliance_gate(test_token, "AML_SCREENING").name == "Renamed"
+    assert client.get_compliance_gate(test_token, "SOURCE_OF_FUNDS") is None
+    assert requests_mock.call_count == 2
+
+
+def test_failed_refresh_keeps_stale_data(requests_mock, client, clock, test_token):
+    requests_mock.get(f"{host}/transactions/compliance_gates", json=GATES)
+    client.get_compliance_gate(test_token, "AML_SCREENING")
+
+    requests_mock.get(f"{host}/transactions/compliance_gates", status_code=503)
+    clock.now = 61
+    assert client.get_compliance_gate(test_token, "AML_SCREENING") is not None
+    wait_for_refresh(client.reference_data.compliance_gates)
+    assert client.get_compliance_gate(test_token, "AML_SCREENING") is not None
+    assert requests_mock.call_count == 2
+
+    clock.now = 72
+    requests_mock.get(f"{host}/transactions/compliance_gates", json={"compliance_gates": []})
+    client.get_compliance_gate(test_token, "AML_SCREENING")
+    wait_for_refresh(client.reference_data.compliance_gates)
+    assert client.get_compliance_gate(test_token, "AML_SCREENING") is None
+    assert requests_mock.call_count == 3
+
+
+def test_first_load_failure_raises(requests_mock, client, test_token):
+    requests_mock.get(f"{host}/transactions/compliance_gates", status_code=500)
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.get_compliance_gate(test_token, "AML_SCREENING")
+
+    requests_mock.get(f"{host}/transactions/compliance_gates", json=GATES)
+    assert client.get_compliance_gate(test_token, "AML_SCREENING") is not None
+
+
+def test_unexpected_response_fails_loudly(requests_mock, client, test_token):
+    requests_mock.get(f"{host}/transactions/verification/error_codes", json={"E100": "Document expired"})
+    with pytest.raises(ValueError):
+        client.get_verification_error_code(test_token, "E100")
+
+    requests_mock.get(f"{host}/transactions/compliance_gates", json={"compliance_gates": [{"gate": "AML_SCREENING"}]})
+    with pytest.raises(ValueError):
+        client.get_compliance_gate(test_token, "AML_SCREENING")
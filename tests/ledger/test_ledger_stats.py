@@ -0,0 +1,74 @@
+import logging
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from mykobo_py.ledger import stats as stats_module
+from mykobo_py.ledger.ledger import LedgerServiceClient
+from mykobo_py.ledger.stats import TransactionStatsEngine
+
+logger = logging.getLogger("test")
+host = "http://ledger.test"
+
+
+def test_stats_per_profile(transaction):
+    rows = [transaction(i, status="FULFILLED" if i < 4 else "PENDING", incoming_currency="EUR" if i < 5 else "USD") for i in range(10)]
+    engine = TransactionStatsEngine()
+    engine.add_page(rows[:4])
+    engine.add_page([])
+    engine.add_page(rows[4:])
+
+    result = engine.result()
+    assert engine.rows == 10
+    assert set(result) == {"urn:usrp:a", "urn:usrp:b"}
+    assert result["urn:usrp:b"] == {
+        "total": 4,
+        "by_status": {"FULFILLED": 2, "PENDING": 2},
+        "by_currency": {"EUR": 2, "USD": 2},
+        "volume_by_type": {
+            "DEPOSIT": {"EUR": Decimal("10.5"), "USD": Decimal("10.5")},
+            "WITHDRAWAL": {"EUR": Decimal("10.5"), "USD": Decimal("10.5")},
+        },
+    }
+    assert result["urn:usrp:a"]["total"] == 6
+
+
+def test_transaction_counts_for_payer_and_payee_once_each(transaction):
+    engine = TransactionStatsEngine()
+    engine.add_page([
+        transaction(1, payer="urn:usrp:a", payee="urn:usrp:c"),
+        transaction(2, payer="urn:usrp:c", payee="urn:usrp:c", amount_in=None),
+        transaction(3, payer=None, payee=None),
+    ])
+
+    result = engine.result()
+    assert set(result) == {"urn:usrp:a", "urn:usrp:c"}
+    assert result["urn:usrp:c"]["total"] == 2
+    assert result["urn:usrp:c"]["volume_by_type"] == {"DEPOSIT": {"EUR": Decimal("10.5")}, "WITHDRAWAL": {"EUR": Decimal(0)}}
+
+
+def test_only_requested_profiles_are_kept(monkeypatch, transaction):
+    monkeypatch.setattr(stats_module, "COMPACT_EVERY", 2)
+    engine = TransactionStatsEngine(profile_ids=["urn:usrp:b", "urn:usrp:z"])
+    for i in range(10):
+        engine.add_page([transaction(i)])
+
+    result = engine.result()
+    assert list(result) == ["urn:usrp:b"]
+    assert result["urn:usrp:b"]["total"] == 4
+    assert result["urn:usrp:b"]["by_status"] == {"PENDING": 4}
+    assert result["urn:usrp:b"]["volume_by_type"] == {"DEPOSIT": {"EUR": Decimal("21")}, "WITHDRAWAL": {"EUR": Decimal("21")}}
+
+
+def test_compute_transaction_stats(requests_mock, make_filter, paged, test_token, transaction):
+    rows = [transaction(i) for i in range(25)]
+    requests_mock.post(f"{host}/transactions/list", json=paged(rows))
+    client = LedgerServiceClient(host, logger)
+
+    result = client.compute_transaction_stats(test_token, make_filter(limit=10))
+
+    assert requests_mock.call_count == 3
+    assert sum(profile["total"] for profile in result.values()) == 25
+    assert result["urn:usrp:b"]["by_currency"] == {"EUR": 9}
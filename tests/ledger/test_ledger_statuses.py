@@ -0,0 +1,110 @@
+import logging
+import threading
+
+import pytest
+import requests
+
+from mykobo_py.ledger.ledger import LedgerServiceClient
+from mykobo_py.ledger.statuses import TransactionStatusGraph, status_names
+
+logger = logging.getLogger("test")
+host = "http://ledger.test"
+
+TRANSITIONS = {
+    "PENDING": ["PROCESSING", "CANCELLED"],
+    "PROCESSING": ["FULFILLED", "FAILED"],
+    "FULFILLED": [],
+}
+
+
+def mock_statuses(requests_mock):
+    requests_mock.get(f"{host}/transactions/statuses", json={"statuses": list(TRANSITIONS)})
+    for status, targets in TRANSITIONS.items():
+        requests_mock.get(f"{host}/transactions/statuses/transitions/{status}", json={"transitions": targets})
+
+
+def test_status_names():
+    assert status_names({"statuses": ["A", "B"]}, "statuses") == ["A", "B"]
+    assert status_names({"transitions": []}, "transitions") == []
+    for payload in (None, ["A"], {"unexpected": ["A"]}, {"statuses": "A"}, {"statuses": [{"status": "A"}]}):
+        with pytest.raises(ValueError):
+            status_names(payload, "statuses")
+
+
+def test_can_transition_loads_graph_once(requests_mock, test_token):
+    mock_statuses(requests_mock)
+    client = LedgerServiceClient(host, logger)
+
+    assert client.can_transition(test_token, "PENDING", "PROCESSING")
+    assert client.can_transition(test_token, "PROCESSING", "FULFILLED")
+    assert not client.can_transition(test_token, "PENDING", "FULFILLED")
+    assert not client.can_transition(test_token, "FULFILLED", "PENDING")
+    assert not client.can_transition(test_token, "UNKNOWN", "PENDING")
+    assert client.status_graph.statuses(test_token) == {"PENDING", "PROCESSING", "FULFILLED"}
+
+    assert requests_mock.call_count == 4
+    assert requests_mock.last_request.headers["Authorization"] == f"Bearer {test_token.token}"
+
+
+def test_graph_reloads_after_ttl(requests_mock, test_token):
+    mock_statuses(requests_mock)
+    client = LedgerServiceClient(host, logger)
+    client.status_graph.transitions(test_token)
+
+    client.status_graph._cache._clock = lambda: 10 ** 9
+    assert client.can_transition(test_token, "PENDING", "CANCELLED")
+    assert requests_mock.call_count == 8
+
+    client.status_graph.invalidate()
+    client.can_transition(test_token, "PENDING", "CANCELLED")
+    assert requests_mock.call_count == 12
+
+
+def test_unexpected_response_fails_loudly(requests_mock, test_token):
+    requests_mock.get(f"{host}/transactions/statuses", json={"PENDING": ["FULFILLED"], "FULFILLED": []})
+    client = LedgerServiceClient(host, logger)
+
+    with pytest.raises(ValueError):
+        client.can_transition(test_token, "PENDING", "FULFILLED")
+
+    mock_statuses(requests_mock)
+    requests_mock.get(f"{host}/transactions/statuses/transitions/PENDING", json={"next": ["PROCESSING"]})
+    with pytest.raises(ValueError):
+        client.can_transition(test_token, "PENDING", "PROCESSING")
+
+
+def test_failed_load_is_not_cached(requests_mock, test_token):
+    mock_statuses(requests_mock)
+    requests_mock.get(f"{host}/transactions/statuses/transitions/PROCESSING", status_code=503)
+    client = LedgerServiceClient(host, logger)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.can_transition(test_token, "PENDING", "PROCESSING")
+
+    mock_statuses(requests_mock)
+    assert client.can_transition(test_token, "PROCESSING", "FAILED")
+
+
+def test_concurrent_callers_share_one_load(test_token):
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch(token, status):
+        calls.append(status)
+        started.set()
+        release.wait(5)
+        return {"statuses": ["PENDING"]} if status is None else {"transitions": ["FULFILLED"]}
+
+    graph = TransactionStatusGraph(fetch, logger)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(graph.can_transition(test_token, "PENDING", "FULFILLED"))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    started.wait(5)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == [True] * 5
+    assert calls == [None, "PENDING"]
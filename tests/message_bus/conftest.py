@@ -0,0 +1,31 @@
+import pytest
+
+from mykobo_py.message_bus.models import MessageBusMessage, PaymentPayload, InstructionType
+
+
+@pytest.fixture
+def sqs_message():
+    """Build an SQS message as returned by ReceiveMessage, carrying a PAYMENT instruction"""
+    def make(n: int, receive_count: int = 1) -> dict:
+        message = MessageBusMessage.create(
+            source="BANKING_SERVICE",
+            instruction_type=InstructionType.PAYMENT,
+            payload=PaymentPayload(
+                external_reference=f"P{n}",
+                payer_name="Jane Doe",
+                currency="EUR",
+                value="10.00",
+                source="BANK",
+                reference=f"REF{n}",
+                direction="INBOUND",
+                bank_account_number="GB456"
+            ),
+            service_token="jwt.token.here",
+        )
+        return {
+            "MessageId": f"id-{n}",
+            "ReceiptHandle": f"receipt-{n}",
+            "Body": message.to_json(),
+            "Attributes": {"ApproximateReceiveCount": str(receive_count)},
+        }
+    return make
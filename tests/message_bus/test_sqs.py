@@ -1,7 +1,8 @@
 import pytest
 import json
+import threading
 from unittest.mock import Mock, patch, MagicMock
-from mykobo_py.message_bus.sqs.SQS import SQS
+from mykobo_py.message_bus.sqs.SQS import SQS, ReceivedMessage
 from mykobo_py.message_bus.models import (
     MessageBusMessage,
     MetaData,
@@ -164,3 +165,142 @@ class TestSQS:
 
         call_args = mock_client.send_message.call_args
         assert call_args[1]["QueueUrl"] == "http://localhost:4566/my-queue"
+
+    def test_send_messages_in_batches_of_ten(self, sqs_client):
+        """Test that send_messages packs messages into SendMessageBatch calls of 10"""
+        sqs, mock_client = sqs_client
+        mock_client.send_message_batch.side_effect = lambda QueueUrl, Entries: {
+            "Successful": [{"Id": entry["Id"], "MessageId": f"msg-{entry['Id']}"} for entry in Entries]
+        }
+
+        result = sqs.send_messages([{"n": n} for n in range(25)], "my-queue", delay_seconds=0)
+
+        calls = mock_client.send_message_batch.call_args_list
+        assert [len(call[1]["Entries"]) for call in calls] == [10, 10, 5]
+        assert calls[0][1]["QueueUrl"] == "http://localhost:4566/my-queue"
+        assert calls[0][1]["Entries"][0]["DelaySeconds"] == 0
+        assert json.loads(calls[2][1]["Entries"][4]["MessageBody"]) == {"n": 24}
+        assert [entry["Id"] for entry in result["Successful"]] == [str(n) for n in range(25)]
+        assert result["Failed"] == []
+        mock_client.send_message.assert_not_called()
+
+    def test_send_messages_respects_batch_size_limit(self, sqs_client):
+        """Test that batches stay under 256 KB and oversized messages are rejected"""
+        sqs, mock_client = sqs_client
+        mock_client.send_message_batch.side_effect = lambda QueueUrl, Entries: {
+            "Successful": [{"Id": entry["Id"]} for entry in Entries]
+        }
+        large = {"data": "x" * 100_000}
+
+        result = sqs.send_messages([large, large, large, {"data": "x" * 300_000}], "my-queue")
+
+        assert [len(call[1]["Entries"]) for call in mock_client.send_message_batch.call_args_list] == [2, 1]
+        assert result["Failed"] == [{
+            "Id": "3", "SenderFault": True, "Code": "MessageTooLong", "Message": "Message is larger than 262144 bytes"
+        }]
+        assert mock_client.send_message_batch.call_args_list[0][1]["Entries"][0]["DelaySeconds"] == 10
+
+    def test_send_messages_retries_only_failed_entries(self, sqs_client):
+        """Test that only entries failed by the service are retried"""
+        sqs, mock_client = sqs_client
+        mock_client.send_message_batch.side_effect = [
+            {
+                "Successful": [{"Id": "0"}],
+                "Failed": [
+                    {"Id": "1", "SenderFault": False, "Code": "ServiceUnavailable"},
+                    {"Id": "2", "SenderFault": True, "Code": "InvalidMessageContents"},
+                ],
+            },
+            Exception("throttled"),
+            {"Successful": [{"Id": "1"}]},
+        ]
+
+        with patch("mykobo_py.message_bus.sqs.SQS.time.sleep") as sleep:
+            result = sqs.send_messages([{"n": n} for n in range(3)], "my-queue")
+
+        calls = mock_client.send_message_batch.call_args_list
+        assert [[entry["Id"] for entry in call[1]["Entries"]] for call in calls] == [["0", "1", "2"], ["1"], ["1"]]
+        assert [entry["Id"] for entry in result["Successful"]] == ["0", "1"]
+        assert [entry["Id"] for entry in result["Failed"]] == ["2"]
+        assert sleep.call_count == 2
+
+    def test_send_messages_gives_up_after_max_attempts(self, sqs_client):
+        """Test that entries still failing after max_attempts are reported"""
+        sqs, mock_client = sqs_client
+        mock_client.send_message_batch.side_effect = Exception("unavailable")
+
+        result = sqs.send_messages([{"n": 1}], "my-queue", max_attempts=2, retry_backoff=0)
+
+        assert mock_client.send_message_batch.call_count == 2
+        assert result["Failed"][0]["Code"] == "Exception"
+
+    def test_receive_messages(self, sqs_client, sqs_message):
+        """Test receiving a batch of parsed messages with long polling"""
+        sqs, mock_client = sqs_client
+        mock_client.receive_message.return_value = {
+            "Messages": [sqs_message(1), {"MessageId": "bad", "ReceiptHandle": "receipt-bad", "Body": "{}"}, sqs_message(2, 3)]
+        }
+
+        received = sqs.receive_messages("payment-queue", wait_time_seconds=5, visibility_timeout=60)
+
+        call_args = mock_client.receive_message.call_args[1]
+        assert call_args["QueueUrl"] == "http://localhost:4566/payment-queue"
+        assert call_args["MaxNumberOfMessages"] == 10
+        assert call_args["WaitTimeSeconds"] == 5
+        assert call_args["VisibilityTimeout"] == 60
+        assert [item.receipt_handle for item in received] == ["receipt-1", "receipt-2"]
+        assert isinstance(received[0], ReceivedMessage)
+        assert isinstance(received[0].message.payload, PaymentPayload)
+        assert received[0].message.payload.reference == "REF1"
+        assert received[1].receive_count == 3
+
+    def test_receive_messages_defaults(self, sqs_client):
+        """Test that receive_messages long polls by default and caps the batch size at 10"""
+        sqs, mock_client = sqs_client
+        mock_client.receive_message.return_value = {}
+
+        assert sqs.receive_messages("payment-queue", max_messages=50) == []
+
+        call_args = mock_client.receive_message.call_args[1]
+        assert call_args["MaxNumberOfMessages"] == 10
+        assert call_args["WaitTimeSeconds"] == 20
+        assert call_args["VisibilityTimeout"] == 30
+
+    def test_iter_messages(self, sqs_client, sqs_message):
+        """Test iterating messages across receives until stopped"""
+        sqs, mock_client = sqs_client
+        mock_client.receive_message.side_effect = [
+            {"Messages": [sqs_message(1), sqs_message(2)]},
+            Exception("unavailable"),
+            {},
+            {"Messages": [sqs_message(3)]},
+        ]
+        stop = threading.Event()
+
+        received = []
+        for item in sqs.iter_messages("payment-queue", stop=stop, error_backoff=0):
+            received.append(item.message.payload.reference)
+            if len(received) == 3:
+                stop.set()
+
+        assert received == ["REF1", "REF2", "REF3"]
+        assert mock_client.receive_message.call_count == 4
+
+    def test_delete_messages(self, sqs_client):
+        """Test deleting receipt handles with DeleteMessageBatch"""
+        sqs, mock_client = sqs_client
+        mock_client.delete_message_batch.side_effect = [
+            {"Successful": [{"Id": str(n)} for n in range(10) if n != 3],
+             "Failed": [{"Id": "3", "SenderFault": True, "Code": "ReceiptHandleIsInvalid"}]},
+            Exception("unavailable"),
+        ]
+
+        result = sqs.delete_messages("payment-queue", [f"receipt-{n}" for n in range(12)])
+
+        calls = mock_client.delete_message_batch.call_args_list
+        assert calls[0][1]["QueueUrl"] == "http://localhost:4566/payment-queue"
+        assert [len(call[1]["Entries"]) for call in calls] == [10, 2]
+        assert len(result["Successful"]) == 9
+        assert [(entry["Id"], entry["ReceiptHandle"]) for entry in result["Failed"]] == [
+            ("3", "receipt-3"), ("10", "receipt-10"), ("11", "receipt-11")
+        ]
@@ -0,0 +1,126 @@
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mykobo_py.message_bus.sqs.SQS import SQS
+from mykobo_py.message_bus.sqs.ack import AckBuffer
+
+
+class TestAckBuffer:
+    """Tests for AckBuffer"""
+
+    @pytest.fixture
+    def sqs_client(self):
+        """Create SQS client with mocked boto3 client that records deleted handles"""
+        with patch('mykobo_py.message_bus.sqs.SQS.boto3.client') as mock_client:
+            mock_sqs = Mock()
+            mock_client.return_value = mock_sqs
+            sqs = SQS(queue_url="http://localhost:4566")
+            sqs.client = mock_sqs
+            deleted = []
+
+            def delete_message_batch(QueueUrl, Entries):
+                deleted.append([entry["ReceiptHandle"] for entry in Entries])
+                return {"Successful": [{"Id": entry["Id"]} for entry in Entries]}
+
+            mock_sqs.delete_message_batch.side_effect = delete_message_batch
+            yield sqs, deleted
+
+    def test_flushes_full_batches(self, sqs_client):
+        """Test that a batch is deleted as soon as 10 handles are pending"""
+        sqs, deleted = sqs_client
+        with AckBuffer(sqs, "payment-queue", flush_interval=60) as buffer:
+            for n in range(23):
+                buffer.ack(f"receipt-{n}")
+            assert [len(batch) for batch in deleted] == [10, 10]
+            assert len(buffer) == 3
+
+        assert [len(batch) for batch in deleted] == [10, 10, 3]
+        assert buffer.acked == 23
+        with pytest.raises(RuntimeError):
+            buffer.ack("late")
+
+    def test_flushes_after_interval(self, sqs_client):
+        """Test that pending handles are deleted once the flush interval has passed"""
+        sqs, deleted = sqs_client
+        buffer = AckBuffer(sqs, "payment-queue", flush_interval=0.05)
+        buffer.ack("receipt-1")
+        buffer.ack("receipt-2")
+
+        deadline = time.monotonic() + 5
+        while not deleted and time.monotonic() < deadline:
+            time.sleep(0.01)
+        buffer.close()
+
+        assert deleted == [["receipt-1", "receipt-2"]]
+
+    def test_reports_failed_entries(self, sqs_client):
+        """Test that failed deletes are returned and passed to on_failure"""
+        sqs, _ = sqs_client
+        sqs.client.delete_message_batch.side_effect = lambda QueueUrl, Entries: {
+            "Successful": [{"Id": "0"}],
+            "Failed": [{"Id": "1", "SenderFault": True, "Code": "ReceiptHandleIsInvalid"}],
+        }
+        failures = []
+        buffer = AckBuffer(sqs, "payment-queue", flush_interval=60, on_failure=lambda handle, failure: failures.append(handle))
+        buffer.ack("receipt-ok")
+        buffer.ack("receipt-bad")
+
+        failed = buffer.close()
+
+        assert [entry["ReceiptHandle"] for entry in failed] == ["receipt-bad"]
+        assert failures == ["receipt-bad"]
+        assert (buffer.acked, buffer.failed) == (1, 1)
+
+    def test_failing_on_failure_does_not_stop_flushing(self, sqs_client):
+        """Test that an on_failure callback that raises does not stop the background flushes"""
+        sqs, deleted = sqs_client
+
+        def delete_message_batch(QueueUrl, Entries):
+            deleted.append([entry["ReceiptHandle"] for entry in Entries])
+            return {
+                "Successful": [{"Id": entry["Id"]} for entry in Entries if entry["ReceiptHandle"] != "receipt-bad"],
+                "Failed": [
+                    {"Id": entry["Id"], "SenderFault": True, "Code": "ReceiptHandleIsInvalid"}
+                    for entry in Entries if entry["ReceiptHandle"] == "receipt-bad"
+                ],
+            }
+
+        def on_failure(handle, failure):
+            raise ValueError("callback bug")
+
+        sqs.client.delete_message_batch.side_effect = delete_message_batch
+        buffer = AckBuffer(sqs, "payment-queue", flush_interval=0.05, on_failure=on_failure)
+        buffer.ack("receipt-bad")
+        deadline = time.monotonic() + 5
+        while buffer.failed == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        buffer.ack("receipt-ok")
+        deadline = time.monotonic() + 1
+        while buffer.acked == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert deleted == [["receipt-bad"], ["receipt-ok"]]
+        assert buffer.acked == 1
+        buffer.close()
+
+    def test_concurrent_acks(self, sqs_client):
+        """Test that handles acked from many threads are all deleted once"""
+        sqs, deleted = sqs_client
+        buffer = AckBuffer(sqs, "payment-queue", flush_interval=0.01)
+        threads = [
+            threading.Thread(target=lambda t=t: [buffer.ack(f"receipt-{t}-{n}") for n in range(50)])
+            for t in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        buffer.close()
+
+        handles = [handle for batch in deleted for handle in batch]
+        assert len(handles) == 200 and len(set(handles)) == 200
+        assert all(len(batch) <= 10 for batch in deleted)
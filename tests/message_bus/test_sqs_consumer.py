@@ -0,0 +1,138 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from mykobo_py.message_bus.sqs.SQS import SQS
+from mykobo_py.message_bus.sqs.consumer import SqsConsumer
+
+
+class FakeSqsClient:
+    """Serves queued messages and records deletes and visibility changes"""
+
+    def __init__(self, messages):
+        self.messages = messages
+        self.lock = threading.Lock()
+        self.receives = []
+        self.deleted = []
+        self.extended = []
+
+    def receive_message(self, QueueUrl, MaxNumberOfMessages, WaitTimeSeconds, VisibilityTimeout, **kwargs):
+        with self.lock:
+            self.receives.append(MaxNumberOfMessages)
+            batch, self.messages = self.messages[:MaxNumberOfMessages], self.messages[MaxNumberOfMessages:]
+        if not batch:
+            time.sleep(0.01)
+        return {"Messages": batch}
+
+    def delete_message_batch(self, QueueUrl, Entries):
+        with self.lock:
+            self.deleted.extend(entry["ReceiptHandle"] for entry in Entries)
+        return {"Successful": [{"Id": entry["Id"]} for entry in Entries]}
+
+    def change_message_visibility_batch(self, QueueUrl, Entries):
+        with self.lock:
+            self.extended.extend((entry["ReceiptHandle"], entry["VisibilityTimeout"]) for entry in Entries)
+        return {"Successful": [{"Id": entry["Id"]} for entry in Entries]}
+
+
+@pytest.fixture
+def fake_sqs(sqs_message):
+    """Build a FakeSqsClient serving `count` queued messages"""
+    return lambda count: FakeSqsClient([sqs_message(n) for n in range(count)])
+
+
+def make_sqs(fake):
+    with patch('mykobo_py.message_bus.sqs.SQS.boto3.client'):
+        sqs = SQS(queue_url="http://localhost:4566")
+    sqs.client = fake
+    return sqs
+
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert condition()
+
+
+class TestSqsConsumer:
+    """Tests for SqsConsumer"""
+
+    def test_processes_and_acknowledges_in_batches(self, fake_sqs):
+        """Test that every message is handled by the workers and deleted in batches"""
+        fake = fake_sqs(45)
+        handled = []
+        threads = set()
+
+        def handler(message):
+            threads.add(threading.current_thread().name)
+            time.sleep(0.005)
+            handled.append(message.payload.reference)
+
+        with SqsConsumer(make_sqs(fake), "payment-queue", handler, pollers=2, workers=4, wait_time_seconds=1,
+                         ack_flush_interval=0.01) as consumer:
+            wait_until(lambda: len(handled) == 45)
+
+        assert sorted(handled) == sorted(f"REF{n}" for n in range(45))
+        assert sorted(fake.deleted) == sorted(f"receipt-{n}" for n in range(45))
+        assert consumer.processed == 45
+        assert consumer.in_flight == 0
+        assert len(threads) > 1
+
+    def test_failed_messages_are_not_acknowledged(self, fake_sqs):
+        """Test that messages whose handler raises stay on the queue"""
+        fake = fake_sqs(4)
+
+        def handler(message):
+            if message.payload.reference == "REF2":
+                raise ValueError("cannot handle")
+
+        consumer = SqsConsumer(make_sqs(fake), "payment-queue", handler, workers=2, ack_flush_interval=0.01)
+        consumer.start()
+        wait_until(lambda: consumer.processed + consumer.failed == 4)
+        consumer.stop()
+
+        assert consumer.failed == 1
+        assert sorted(fake.deleted) == ["receipt-0", "receipt-1", "receipt-3"]
+
+    def test_bounded_queue_applies_backpressure(self, fake_sqs):
+        """Test that pollers stop receiving while the workers are busy"""
+        fake = fake_sqs(100)
+        release = threading.Event()
+        consumer = SqsConsumer(make_sqs(fake), "payment-queue", lambda message: release.wait(5), workers=1, queue_size=5)
+        consumer.start()
+        time.sleep(0.1)
+
+        # one message being handled, five queued and at most one blocked batch in the poller
+        assert len(fake.receives) <= 2
+        assert consumer.in_flight <= 1 + 5 + 10
+
+        release.set()
+        wait_until(lambda: consumer.processed == 100)
+        consumer.stop()
+
+    def test_heartbeat_extends_visibility_of_slow_messages(self, fake_sqs):
+        """Test that messages held longer than the heartbeat interval get their visibility extended"""
+        fake = fake_sqs(1)
+        release = threading.Event()
+        consumer = SqsConsumer(
+            make_sqs(fake), "payment-queue", lambda message: release.wait(5), workers=1,
+            visibility_timeout=30, heartbeat_interval=0.05, ack_flush_interval=0.01,
+        )
+        consumer.start()
+        wait_until(lambda: len(fake.extended) >= 2)
+        release.set()
+        consumer.stop()
+
+        assert set(fake.extended) == {("receipt-0", 30)}
+        assert fake.deleted == ["receipt-0"]
+
+    def test_start_twice(self, fake_sqs):
+        """Test that a running consumer cannot be started again"""
+        consumer = SqsConsumer(make_sqs(fake_sqs(0)), "payment-queue", lambda message: None, workers=1)
+        consumer.start()
+        with pytest.raises(RuntimeError):
+            consumer.start()
+        consumer.stop()
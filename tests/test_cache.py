@@ -0,0 +1,56 @@
+import pytest
+
+from mykobo_py.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=10, ttl=5, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=20)
+
+    clock.now = 6
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+
+def test_counts_hits_and_misses():
+    cache = TTLCache(maxsize=10)
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("missing")
+
+    info = cache.info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+    cache.clear()
+    assert cache.info() == (0, 0, 10, 0)
+
+
+def test_resize_evicts_oldest():
+    cache = TTLCache(maxsize=3)
+    for key in "abc":
+        cache.set(key, key)
+    cache.resize(1)
+    assert list(cache.keys()) == ["c"]
+    with pytest.raises(ValueError):
+        cache.resize(0)
@@ -0,0 +1,96 @@
+import logging
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+import requests
+
+from mykobo_py.client import MykoboServiceClient, build_session
+from mykobo_py.identity.identity import IdentityServiceClient
+from mykobo_py.ledger.ledger import LedgerServiceClient
+
+logger = logging.getLogger("test")
+host = "http://fallback"
+
+
+def test_clients_share_pooled_session():
+    identity = IdentityServiceClient(host, logger)
+    ledger = LedgerServiceClient(host, logger)
+    assert identity.session is ledger.session
+    assert identity.session is MykoboServiceClient.shared_session()
+
+
+def test_build_session_configures_adapter():
+    session = build_session(pool_connections=4, pool_maxsize=32, max_retries=5)
+    adapter = session.get_adapter("https://example.com")
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 32
+    assert adapter.max_retries.total == 5
+    assert adapter.max_retries.allowed_methods == {"GET", "HEAD", "OPTIONS"}
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+def test_forked_child_gets_its_own_session():
+    session = MykoboServiceClient.shared_session()
+    pid = os.fork()
+    if pid == 0:
+        child = MykoboServiceClient.shared_session()
+        os._exit(0 if child is not session and child is MykoboServiceClient.shared_session() else 1)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert MykoboServiceClient.shared_session() is session
+
+
+def test_build_session_without_keep_alive():
+    session = build_session(keep_alive=False)
+    assert session.headers["Connection"] == "close"
+
+
+def test_session_does_not_keep_cookies():
+    class Handler(BaseHTTPRequestHandler):
+        cookies = []
+
+        def do_GET(self):
+            Handler.cookies.append(self.headers.get("Cookie"))
+            self.send_response(200)
+            self.send_header("Set-Cookie", "session=abc; Path=/")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        session = build_session()
+        url = f"http://127.0.0.1:{server.server_port}/"
+        session.get(url)
+        session.get(url)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert len(session.cookies) == 0
+    assert Handler.cookies == [None, None]
+
+
+def test_configure_transport_replaces_shared_session():
+    previous = MykoboServiceClient.shared_session()
+    session = MykoboServiceClient.configure_transport(pool_maxsize=50)
+    try:
+        assert session is not previous
+        assert IdentityServiceClient(host, logger).session is session
+    finally:
+        MykoboServiceClient.close_transport()
+
+
+def test_client_with_own_session(requests_mock):
+    session = requests.Session()
+    client = IdentityServiceClient(host, logger, session=session)
+    assert client.session is session
+
+    requests_mock.get(f"{host}/user/profile/urn:usrp:1", json={"id": "urn:usrp:1"})
+    response = client.get_user_profile(None, "urn:usrp:1")
+    assert response.json()["id"] == "urn:usrp:1"
@@ -0,0 +1,73 @@
+import threading
+import time
+
+import pytest
+
+from mykobo_py.concurrency import SingleFlight, fan_out
+
+
+def test_fan_out_bounds_parallelism_and_keeps_order():
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def work(key):
+        with lock:
+            running.append(key)
+            peak.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(key)
+        if key == 3:
+            raise ValueError("bad key")
+        return key * 2
+
+    results = fan_out(work, [5, 1, 3, 1, 2, 5, 4], max_workers=2)
+
+    assert list(results) == [5, 1, 3, 2, 4]
+    assert results[5] == 10
+    assert isinstance(results[3], ValueError)
+    assert max(peak) <= 2
+
+
+def test_fan_out_with_no_keys():
+    assert fan_out(lambda key: key, []) == {}
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+    results = []
+
+    def work():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {"value": 1}
+
+    def call():
+        results.append(flight.do("key", work))
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+    threads[0].start()
+    started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert sorted(shared for _, shared in results) == [False, True, True, True]
+    assert flight.in_flight() == 0
+    assert flight.do("key", lambda: 2) == (2, False)
+
+
+def test_single_flight_shares_exceptions():
+    flight = SingleFlight()
+    with pytest.raises(ValueError):
+        flight.do("key", lambda: int("boom"))
+    assert flight.in_flight() == 0
@@ -0,0 +1,104 @@
+import threading
+import time
+
+import pytest
+
+from mykobo_py.pagination import PageIterator
+
+
+def make_pages(count: int, limit: int, last_size: int):
+    pages = {}
+    for page in range(1, count + 1):
+        size = last_size if page == count else limit
+        start = (page - 1) * limit
+        pages[page] = {"items": list(range(start, start + size))}
+    return pages
+
+
+def test_iterates_until_short_page():
+    pages = make_pages(3, limit=4, last_size=2)
+    requested = []
+
+    def fetch(page):
+        requested.append(page)
+        return pages[page]
+
+    iterator = PageIterator(fetch, limit=4, items_key="items", prefetch=False)
+    assert list(iterator) == list(range(10))
+    assert requested == [1, 2, 3]
+    assert iterator.pages_fetched == 3
+    assert iterator.items_yielded == 10
+    assert iterator.finished
+
+
+def test_stops_on_reported_total_and_empty_page():
+    iterator = PageIterator(lambda page: {"results": [page] * 2, "total": 4}, limit=2, items_key="results", total_key="total")
+    assert list(iterator) == [1, 1, 2, 2]
+    assert iterator.total == 4
+
+    iterator = PageIterator(lambda page: [] if page > 2 else [page, page], limit=2, items_key=None)
+    assert list(iterator) == [1, 1, 2, 2]
+
+
+def test_page_sizes_are_not_mistaken_for_a_total():
+    rows = list(range(21))
+    iterator = PageIterator(
+        lambda page: {"items": rows[(page - 1) * 10:page * 10], "count": len(rows[(page - 1) * 10:page * 10])},
+        limit=10,
+        items_key="items",
+    )
+    assert list(iterator) == rows
+    assert iterator.pages_fetched == 3
+    assert iterator.total is None
+
+
+def test_prefetches_next_page_while_consuming():
+    pages = make_pages(3, limit=2, last_size=1)
+    fetched = {}
+
+    def fetch(page):
+        fetched[page] = threading.current_thread().name
+        return pages[page]
+
+    iterator = iter(PageIterator(fetch, limit=2, items_key="items", parse=str))
+    assert next(iterator) == "0"
+    for _ in range(50):
+        if 2 in fetched:
+            break
+        time.sleep(0.01)
+    assert 2 in fetched
+    assert 3 not in fetched
+    assert list(iterator) == ["1", "2", "3", "4"]
+    assert fetched[2].startswith("page-prefetch")
+
+
+def test_reports_progress_per_page():
+    progress = []
+    iterator = PageIterator(
+        lambda page: make_pages(2, limit=3, last_size=1)[page],
+        limit=3,
+        items_key="items",
+        on_page=lambda it: progress.append((it.current_page, it.items_yielded)),
+    )
+    list(iterator)
+    assert progress == [(1, 0), (2, 3)]
+
+
+def test_unknown_page_shape_raises():
+    with pytest.raises(ValueError):
+        list(PageIterator(lambda page: {"unexpected": []}, limit=2, items_key="items"))
+    with pytest.raises(ValueError):
+        list(PageIterator(lambda page: {"items": []}, limit=2, items_key=None))
+
+
+def test_prefetch_errors_surface_to_consumer():
+    def fetch(page):
+        if page == 2:
+            raise RuntimeError("page failed")
+        return [1, 2]
+
+    iterator = iter(PageIterator(fetch, limit=2, items_key=None))
+    assert next(iterator) == 1
+    assert next(iterator) == 2
+    with pytest.raises(RuntimeError):
+        next(iterator)